@@ -12,7 +12,13 @@ from pydantic_ai.providers.openai import OpenAIProvider
 
 from config.settings import settings
 from .dependencies import AirbyteDependencies
-from tools.airbyte_api import get_airbyte_job_status, get_airbyte_connection_health
+from tools.airbyte_api import (
+    get_airbyte_job_status,
+    get_airbyte_connection_health,
+    find_airbyte_connection,
+)
+from tools.circuit_breaker import CircuitOpenError
+from analytics.job_patterns import analyze_jobs
 
 logger = logging.getLogger(__name__)
 
@@ -112,6 +118,9 @@ async def get_airbyte_jobs(
         logger.info(f"Successfully retrieved {len(jobs_data)} Airbyte job records")
         return jobs_data
         
+    except CircuitOpenError as e:
+        logger.warning(f"Skipping Airbyte jobs: {e}")
+        return [e.summary]
     except Exception as e:
         logger.error(f"Failed to get Airbyte jobs: {e}")
         return [{"error": f"Failed to retrieve Airbyte jobs: {str(e)}"}]
@@ -141,11 +150,47 @@ async def get_connection_health(
         logger.info(f"Successfully retrieved health data for {len(health_data)} connections")
         return health_data
         
+    except CircuitOpenError as e:
+        logger.warning(f"Skipping Airbyte connection health: {e}")
+        return [e.summary]
     except Exception as e:
         logger.error(f"Failed to get connection health: {e}")
         return [{"error": f"Failed to retrieve connection health: {str(e)}"}]
 
 
+@airbyte_agent.tool
+async def lookup_connection(
+    ctx: RunContext[AirbyteDependencies],
+    name_or_id: str
+) -> Dict[str, Any]:
+    """
+    Look up an Airbyte connection by name or ID, including the other
+    connections that share its source and destination.
+    
+    Args:
+        name_or_id: Connection name or connection ID
+    
+    Returns:
+        Connection details or an error
+    """
+    try:
+        connection = await find_airbyte_connection(
+            name_or_id,
+            api_key=ctx.deps.api_key,
+            client_id=ctx.deps.client_id,
+            client_secret=ctx.deps.client_secret,
+            workspace_id=ctx.deps.workspace_id
+        )
+        
+        if connection is None:
+            return {"error": f"Connection '{name_or_id}' not found"}
+        return connection
+        
+    except Exception as e:
+        logger.error(f"Failed to look up connection {name_or_id}: {e}")
+        return {"error": f"Failed to look up connection: {str(e)}"}
+
+
 @airbyte_agent.tool
 async def analyze_job_patterns(
     ctx: RunContext[AirbyteDependencies],
@@ -164,48 +209,10 @@ async def analyze_job_patterns(
         if not jobs_data or any("error" in job for job in jobs_data):
             return {"error": "No valid job data available for analysis"}
         
-        # Calculate basic statistics
-        total_jobs = len(jobs_data)
-        successful_jobs = len([j for j in jobs_data if j.get("status") == "success"])
-        failed_jobs = len([j for j in jobs_data if j.get("status") == "failed"])
-        running_jobs = len([j for j in jobs_data if j.get("status") == "running"])
-        
-        success_rate = (successful_jobs / total_jobs * 100) if total_jobs > 0 else 0
-        failure_rate = (failed_jobs / total_jobs * 100) if total_jobs > 0 else 0
-        
-        # Identify problematic jobs
-        failed_job_names = [j.get("job_name", "Unknown") for j in jobs_data if j.get("status") == "failed"]
-        error_patterns = {}
-        
-        for job in jobs_data:
-            if job.get("status") == "failed" and job.get("error_message"):
-                error_msg = job.get("error_message", "").lower()
-                # Simple error categorization
-                if "timeout" in error_msg:
-                    error_patterns["timeout"] = error_patterns.get("timeout", 0) + 1
-                elif "connection" in error_msg:
-                    error_patterns["connection"] = error_patterns.get("connection", 0) + 1
-                elif "authentication" in error_msg or "auth" in error_msg:
-                    error_patterns["authentication"] = error_patterns.get("authentication", 0) + 1
-                else:
-                    error_patterns["other"] = error_patterns.get("other", 0) + 1
-        
-        # Duration analysis
-        durations = [j.get("duration_seconds") for j in jobs_data if j.get("duration_seconds")]
-        avg_duration = sum(durations) / len(durations) if durations else 0
-        
-        analysis = {
-            "total_jobs": total_jobs,
-            "successful_jobs": successful_jobs,
-            "failed_jobs": failed_jobs,
-            "running_jobs": running_jobs,
-            "success_rate": round(success_rate, 2),
-            "failure_rate": round(failure_rate, 2),
-            "avg_duration_seconds": round(avg_duration, 2),
-            "failed_job_names": list(set(failed_job_names)),
-            "error_patterns": error_patterns,
-            "analysis_timestamp": datetime.now(timezone.utc).isoformat()
-        }
+        # Counts, rates, duration percentiles, failure streaks and error
+        # categories are computed in one vectorized pass
+        analysis = analyze_jobs(jobs_data)
+        success_rate = analysis["success_rate"]
         
         logger.info(f"Completed job pattern analysis: {success_rate:.1f}% success rate")
         return analysis
@@ -274,6 +281,15 @@ async def create_platform_health_summary(
         if success_rate < 90:
             recommendations.append("Consider implementing job retry mechanisms")
         
+        # Jobs that keep failing run after run
+        repeat_failures = [
+            s for s in jobs_analysis.get("failure_streaks", []) if s.get("current_streak", 0) >= 3
+        ]
+        for streak in repeat_failures:
+            recommendations.append(
+                f"Job {streak['job_name']} has failed {streak['current_streak']} runs in a row"
+            )
+        
         # Connection health assessment
         total_connections = len(connections_health)
         healthy_connections = len([c for c in connections_health if c.get("is_healthy", False)])
@@ -286,6 +302,14 @@ async def create_platform_health_summary(
         if success_rate < 85:
             issues.append(f"Low success rate: {success_rate:.1f}%")
         
+        if repeat_failures:
+            issues.append(f"{len(repeat_failures)} jobs failing repeatedly")
+        
+        error_clusters = jobs_analysis.get("error_clusters", [])
+        if error_clusters:
+            top_error = error_clusters[0]
+            issues.append(f"Most frequent error ({top_error['count']} failures): {top_error['template']}")
+        
         if total_connections > healthy_connections:
             unhealthy_count = total_connections - healthy_connections
             issues.append(f"{unhealthy_count} unhealthy connections detected")
@@ -2,9 +2,11 @@
 Shared dependency classes for all monitoring agents.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 from config.settings import settings
+from config.instances import get_instances
+from models.platform_instances import PlatformInstance
 
 
 @dataclass
@@ -195,6 +197,9 @@ class OrchestratorDependencies:
     session_id: Optional[str] = None
     monitoring_id: Optional[str] = None
     
+    # Additional platform instances (empty unless INSTANCES_PATH is set)
+    instances: List[PlatformInstance] = field(default_factory=list)
+    
     @classmethod
     def from_settings(
         cls, 
@@ -239,6 +244,9 @@ class OrchestratorDependencies:
             # Session
             session_id=session_id,
             monitoring_id=monitoring_id,
+            
+            # Instances
+            instances=get_instances(settings),
         )
     
     def get_airbyte_deps(self) -> AirbyteDependencies:
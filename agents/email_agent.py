@@ -3,7 +3,7 @@ Email notification agent for generating and sending monitoring alerts.
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from datetime import datetime, timezone
 from uuid import uuid4
 
@@ -73,6 +73,106 @@ email_agent = Agent(
 )
 
 
+def build_monitoring_notification(
+    monitoring_context: Dict[str, Any],
+    recipient_emails: List[str],
+) -> Tuple[EmailNotification, str]:
+    """
+    Build a monitoring notification from the template matching its severity.
+    
+    Args:
+        monitoring_context: Monitoring results and health assessment data
+        recipient_emails: List of email addresses to notify
+        
+    Returns:
+        Tuple of the notification and the template key used
+    """
+    # Extract key information
+    failed_jobs = monitoring_context.get("failed_jobs_count", 0)
+    total_jobs = monitoring_context.get("total_jobs_count", 0)
+    risk_level = monitoring_context.get("risk_level", "LOW")
+    platform_summaries = monitoring_context.get("platform_summaries", [])
+    monitoring_id = monitoring_context.get("monitoring_id", f"mon_{uuid4().hex[:8]}")
+    
+    # Determine notification priority and template
+    if risk_level == "CRITICAL" or failed_jobs > 10:
+        template_key = "critical_alert"
+        priority = NotificationPriority.URGENT
+    elif risk_level == "HIGH" or failed_jobs > 5:
+        template_key = "warning_alert" 
+        priority = NotificationPriority.HIGH
+    else:
+        template_key = "info_summary"
+        priority = NotificationPriority.NORMAL
+    
+    # Get template
+    template = DEFAULT_EMAIL_TEMPLATES.get(template_key)
+    if not template:
+        raise ValueError(f"Template {template_key} not found")
+    
+    # Generate email content
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    success_count = total_jobs - failed_jobs
+    success_rate = (success_count / total_jobs * 100) if total_jobs > 0 else 0
+    failure_rate = (failed_jobs / total_jobs * 100) if total_jobs > 0 else 0
+    
+    # Generate platform details section
+    platform_details = []
+    for summary in platform_summaries:
+        if isinstance(summary, dict):
+            platform_name = summary.get("platform", "Unknown").title()
+            platform_status = summary.get("platform_status", "Unknown")
+            platform_failed = summary.get("failed_jobs", 0)
+            platform_total = summary.get("total_jobs", 0)
+            
+            platform_details.append(
+                f"<li><strong>{platform_name}</strong>: {platform_status} "
+                f"({platform_failed}/{platform_total} failed)</li>"
+            )
+    
+    platform_details_html = "<ul>" + "".join(platform_details) + "</ul>" if platform_details else "No platform details available"
+    
+    # Generate recommendations
+    recommendations = monitoring_context.get("recommendations", [])
+    recommendations_html = "<ul>" + "".join(f"<li>{rec}</li>" for rec in recommendations) + "</ul>" if recommendations else "<p>No specific recommendations at this time.</p>"
+    
+    # Format subject and body
+    subject = template.subject_template.format(
+        failed_count=failed_jobs,
+        total_count=total_jobs,
+    )
+    
+    body = template.body_template.format(
+        timestamp=timestamp,
+        monitoring_id=monitoring_id,
+        failed_count=failed_jobs,
+        total_count=total_jobs,
+        success_count=success_count,
+        failure_rate=failure_rate,
+        success_rate=success_rate,
+        risk_level=risk_level,
+        platform_details=platform_details_html,
+        recommendations=recommendations_html,
+    )
+    
+    # Create recipients
+    recipients = [
+        EmailRecipient(email=email, type="to") for email in recipient_emails
+    ]
+    
+    # Create notification
+    notification = EmailNotification(
+        notification_id=f"notif_{monitoring_id}",
+        recipients=recipients,
+        subject=subject,
+        body=body,
+        priority=priority,
+        metadata={"monitoring_id": monitoring_id, "risk_level": risk_level}
+    )
+    
+    return notification, template_key
+
+
 @email_agent.tool
 async def generate_monitoring_notification(
     ctx: RunContext[EmailDependencies],
@@ -94,88 +194,10 @@ async def generate_monitoring_notification(
     try:
         logger.info(f"Generating monitoring notification for {len(recipient_emails)} recipients")
         
-        # Extract key information
-        failed_jobs = monitoring_context.get("failed_jobs_count", 0)
-        total_jobs = monitoring_context.get("total_jobs_count", 0)
-        risk_level = monitoring_context.get("risk_level", "LOW")
-        platform_summaries = monitoring_context.get("platform_summaries", [])
-        monitoring_id = monitoring_context.get("monitoring_id", f"mon_{uuid4().hex[:8]}")
-        
-        # Determine notification priority and template
-        if risk_level == "CRITICAL" or failed_jobs > 10:
-            template_key = "critical_alert"
-            priority = NotificationPriority.URGENT
-        elif risk_level == "HIGH" or failed_jobs > 5:
-            template_key = "warning_alert" 
-            priority = NotificationPriority.HIGH
-        else:
-            template_key = "info_summary"
-            priority = NotificationPriority.NORMAL
-        
-        # Get template
-        template = DEFAULT_EMAIL_TEMPLATES.get(template_key)
-        if not template:
-            return {"error": f"Template {template_key} not found"}
-        
-        # Generate email content
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-        success_count = total_jobs - failed_jobs
-        success_rate = (success_count / total_jobs * 100) if total_jobs > 0 else 0
-        failure_rate = (failed_jobs / total_jobs * 100) if total_jobs > 0 else 0
-        
-        # Generate platform details section
-        platform_details = []
-        for summary in platform_summaries:
-            if isinstance(summary, dict):
-                platform_name = summary.get("platform", "Unknown").title()
-                platform_status = summary.get("platform_status", "Unknown")
-                platform_failed = summary.get("failed_jobs", 0)
-                platform_total = summary.get("total_jobs", 0)
-                
-                platform_details.append(
-                    f"<li><strong>{platform_name}</strong>: {platform_status} "
-                    f"({platform_failed}/{platform_total} failed)</li>"
-                )
-        
-        platform_details_html = "<ul>" + "".join(platform_details) + "</ul>" if platform_details else "No platform details available"
-        
-        # Generate recommendations
-        recommendations = monitoring_context.get("recommendations", [])
-        recommendations_html = "<ul>" + "".join(f"<li>{rec}</li>" for rec in recommendations) + "</ul>" if recommendations else "<p>No specific recommendations at this time.</p>"
-        
-        # Format subject and body
-        subject = template.subject_template.format(
-            failed_count=failed_jobs,
-            total_count=total_jobs,
-        )
-        
-        body = template.body_template.format(
-            timestamp=timestamp,
-            monitoring_id=monitoring_id,
-            failed_count=failed_jobs,
-            total_count=total_jobs,
-            success_count=success_count,
-            failure_rate=failure_rate,
-            success_rate=success_rate,
-            risk_level=risk_level,
-            platform_details=platform_details_html,
-            recommendations=recommendations_html,
-        )
-        
-        # Create recipients
-        recipients = [
-            EmailRecipient(email=email, type="to") for email in recipient_emails
-        ]
-        
-        # Create notification
-        notification = EmailNotification(
-            notification_id=f"notif_{monitoring_id}",
-            recipients=recipients,
-            subject=subject,
-            body=body,
-            priority=priority,
-            metadata={"monitoring_id": monitoring_id, "risk_level": risk_level}
-        )
+        notification, template_key = build_monitoring_notification(monitoring_context, recipient_emails)
+        recipients = notification.recipients
+        priority = notification.priority
+        subject = notification.subject
         
         # Send or create draft
         if send_notification and ctx.deps.from_email:
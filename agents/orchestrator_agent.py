@@ -3,7 +3,7 @@ Main orchestrator agent that coordinates all platform monitoring activities.
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 from uuid import uuid4
 
@@ -17,6 +17,14 @@ from .airbyte_agent import airbyte_agent
 from .email_agent import email_agent
 from .snowflake_db_agent import snowflake_db_agent
 from models.job_status import RiskLevel
+from tools.monitoring_cycle import get_current_cycle, mark_cycle_step, STORAGE_STEP, NOTIFICATION_STEP
+from tools.instance_scheduler import collect_instances
+from tools.local_history import (
+    LocalHistoryError,
+    get_local_failure_summary,
+    get_local_job_history,
+    get_local_recent_jobs,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +64,10 @@ Always provide:
 - Specific issues identified with severity levels
 - Actions taken (notifications sent, data stored)
 - Recommendations for addressing identified issues
+
+For questions about recent history or trends (e.g. how often a job failed this
+week), use query_local_history first; it answers from a local copy of recent
+cycles without querying Snowflake.
 """
 
 
@@ -129,6 +141,31 @@ async def monitor_airbyte_platform(
         }
 
 
+@orchestrator_agent.tool
+async def monitor_platform_instances(
+    ctx: RunContext[OrchestratorDependencies]
+) -> Dict[str, Any]:
+    """
+    Collect job status from every configured platform instance concurrently.
+    
+    Used when several workspaces, tenants or accounts are configured (see
+    INSTANCES_PATH). Records are tagged with their instance.
+    
+    Returns:
+        Per-instance results with job and failure counts, and failed instances
+    """
+    if not ctx.deps.instances:
+        return {"success": False, "error": "No platform instances are configured"}
+    
+    logger.info(f"Starting collection across {len(ctx.deps.instances)} platform instances")
+    collection = await collect_instances(ctx.deps.instances, settings.instance_collection_concurrency)
+    return {
+        "success": True,
+        **collection.summary(),
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
+
 @orchestrator_agent.tool
 async def store_monitoring_results(
     ctx: RunContext[OrchestratorDependencies],
@@ -188,6 +225,7 @@ async def store_monitoring_results(
         )
         
         logger.info("Successfully stored monitoring results")
+        mark_cycle_step(STORAGE_STEP)
         return {
             "storage_success": True,
             "storage_data": storage_result.data,
@@ -235,6 +273,7 @@ async def send_health_notifications(
         # Skip notification for low-risk situations
         if risk_level == "LOW" and failed_jobs_count == 0 and not requires_notification:
             logger.info("No notification needed - system healthy")
+            mark_cycle_step(NOTIFICATION_STEP)
             return {
                 "notification_sent": False,
                 "reason": "System healthy, no notification required",
@@ -281,6 +320,7 @@ async def send_health_notifications(
         )
         
         logger.info("Health notification processing completed")
+        mark_cycle_step(NOTIFICATION_STEP)
         return {
             "notification_sent": True,
             "risk_level": risk_level,
@@ -352,6 +392,18 @@ async def assess_overall_system_health(
                 failed_platforms += 1
                 critical_issues.append(f"{platform_name.title()} monitoring failed: {platform_result.get('error', 'Unknown error')}")
         
+        # Correlate failures through the pipeline graph so one upstream failure
+        # is reported as one incident covering every affected platform
+        pipeline_incidents = []
+        stale_jobs = []
+        cycle = get_current_cycle()
+        analysis = cycle.analyze_dependencies() if cycle is not None else None
+        if analysis is not None:
+            critical_issues.extend(incident.describe() for incident in analysis.incidents)
+            critical_issues.extend(f"{job} has not succeeded within its freshness limit" for job in analysis.stale_jobs)
+            pipeline_incidents = [incident.model_dump() for incident in analysis.incidents]
+            stale_jobs = analysis.stale_jobs
+        
         # Calculate overall metrics
         success_rate = (total_jobs - failed_jobs) / total_jobs * 100 if total_jobs > 0 else 100
         platform_availability = successful_platforms / len(platform_results) * 100
@@ -388,6 +440,8 @@ async def assess_overall_system_health(
             "failed_platforms": failed_platforms,
             "critical_issues": list(set(critical_issues)),  # Remove duplicates
             "recommendations": list(set(all_recommendations)),  # Remove duplicates
+            "pipeline_incidents": pipeline_incidents,
+            "stale_jobs": stale_jobs,
             "assessment_timestamp": datetime.now(timezone.utc).isoformat()
         }
         
@@ -405,6 +459,49 @@ async def assess_overall_system_health(
         }
 
 
+@orchestrator_agent.tool
+async def query_local_history(
+    ctx: RunContext[OrchestratorDependencies],
+    query: str = "failures",
+    platform: Optional[str] = None,
+    job_id: Optional[str] = None,
+    status: Optional[str] = None,
+    hours_back: int = 24,
+    limit: int = 50
+) -> Dict[str, Any]:
+    """
+    Answer history and trend questions from the local history store.
+    
+    Args:
+        query: "failures" (jobs ranked by failures), "recent" (latest records) or "job" (one job's runs)
+        platform: Platform filter (required for "job")
+        job_id: Job identifier (required for "job")
+        status: Status filter for "recent"
+        hours_back: Time window in hours
+        limit: Maximum rows returned
+        
+    Returns:
+        Dictionary with the matching rows
+    """
+    try:
+        if query == "failures":
+            rows = await get_local_failure_summary(hours_back=hours_back, limit=limit)
+        elif query == "recent":
+            rows = await get_local_recent_jobs(platform=platform, hours_back=hours_back, status=status, limit=limit)
+        elif query == "job":
+            if not platform or not job_id:
+                return {"error": "platform and job_id are required for job history"}
+            rows = await get_local_job_history(platform, job_id, limit=limit)
+        else:
+            return {"error": f"Unknown history query: {query}"}
+        
+        return {"query": query, "hours_back": hours_back, "count": len(rows), "rows": rows}
+        
+    except (LocalHistoryError, ValueError) as e:
+        logger.error(f"Local history query failed: {e}")
+        return {"error": f"Local history query failed: {str(e)}"}
+
+
 # Convenience function
 def create_orchestrator_agent() -> Agent:
     """Create an orchestrator agent with default configuration."""
@@ -12,8 +12,9 @@ from pydantic_ai.providers.openai import OpenAIProvider
 
 from config.settings import settings
 from .dependencies import SnowflakeDBDependencies
-from tools.snowflake_db_api import store_job_status_records, store_monitoring_result
-from models.job_status import JobStatusRecord, MonitoringResult
+from tools.snowflake_db_api import store_job_status_batch, store_monitoring_result
+from models.job_status import MonitoringResult
+from models.job_batch import JobStatusBatch
 
 logger = logging.getLogger(__name__)
 
@@ -86,35 +87,15 @@ async def store_job_records(
         if not job_records_data:
             return {"stored_records": 0, "message": "No records to store"}
         
-        # Convert dictionaries to JobStatusRecord objects
-        job_records = []
-        for record_data in job_records_data:
-            try:
-                # Handle nested data conversion if needed
-                if "last_run_time" in record_data and isinstance(record_data["last_run_time"], str):
-                    record_data["last_run_time"] = datetime.fromisoformat(
-                        record_data["last_run_time"].replace('Z', '+00:00')
-                    )
-                
-                if "checked_at" in record_data and isinstance(record_data["checked_at"], str):
-                    record_data["checked_at"] = datetime.fromisoformat(
-                        record_data["checked_at"].replace('Z', '+00:00')
-                    )
-                
-                # Create JobStatusRecord object
-                record = JobStatusRecord(**record_data)
-                job_records.append(record)
-                
-            except Exception as e:
-                logger.warning(f"Failed to convert record data: {e}")
-                continue
-        
-        if not job_records:
+        # Convert dictionaries straight into a columnar batch
+        batch = JobStatusBatch.from_dicts(job_records_data, skip_invalid=True)
+        
+        if not len(batch):
             return {"error": "No valid records to store after conversion"}
         
         # Store records
-        stored_count = await store_job_status_records(
-            records=job_records,
+        stored_count = await store_job_status_batch(
+            batch=batch,
             account=ctx.deps.account,
             user=ctx.deps.user,
             password=ctx.deps.password,
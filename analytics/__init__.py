@@ -0,0 +1,46 @@
+"""Vectorized analytics over job status records."""
+
+from .dependency_graph import (
+    GraphAnalysis,
+    PipelineGraph,
+    PipelineIncident,
+    get_pipeline_graph,
+)
+
+from .duration_anomaly import (
+    DurationAnomaly,
+    DurationAnomalyDetector,
+)
+
+from .error_fingerprints import (
+    ERROR_CATEGORY_PATTERNS,
+    ErrorCluster,
+    ErrorFingerprintStore,
+    categorize_error,
+    cluster_errors,
+    fingerprint_error,
+    normalize_error,
+)
+
+from .job_patterns import (
+    JobColumns,
+    analyze_jobs,
+)
+
+__all__ = [
+    "GraphAnalysis",
+    "PipelineGraph",
+    "PipelineIncident",
+    "get_pipeline_graph",
+    "DurationAnomaly",
+    "DurationAnomalyDetector",
+    "ERROR_CATEGORY_PATTERNS",
+    "ErrorCluster",
+    "ErrorFingerprintStore",
+    "categorize_error",
+    "cluster_errors",
+    "fingerprint_error",
+    "normalize_error",
+    "JobColumns",
+    "analyze_jobs",
+]
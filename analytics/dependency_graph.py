@@ -0,0 +1,311 @@
+"""
+Cross-platform pipeline dependency graph.
+
+Pipelines chain jobs across platforms (an Airbyte sync feeds a Databricks
+job, which feeds a Snowflake task, which triggers a Power Automate flow).
+The graph is declared in a JSON file and kept as adjacency lists in
+topological order. Each cycle's records are analyzed in one pass over the
+graph: failures whose upstream also failed are folded into the upstream's
+incident, so one broken source produces one correlated incident instead of
+an alert per platform. Jobs whose last success is older than their
+freshness limit are reported as stale, together with everything downstream.
+
+A job collected from a configured platform instance is referenced as
+"platform@instance:job_name", so same-named jobs in two workspaces are
+separate nodes.
+"""
+
+import json
+import logging
+import os
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from pydantic import BaseModel, Field
+
+from models.job_status import JobStatus, JobStatusRecord, PlatformType
+from models.timestamps import ensure_utc, utc_now
+
+logger = logging.getLogger(__name__)
+
+# (platform, instance, job_name); instance is "" for jobs collected outside any instance
+NodeKey = Tuple[PlatformType, str, str]
+
+
+def node_label(node: NodeKey) -> str:
+    """Readable "platform:job_name" (or "platform@instance:job_name") label for a node."""
+    platform, instance, job_name = node
+    if instance:
+        return f"{platform.value}@{instance}:{job_name}"
+    return f"{platform.value}:{job_name}"
+
+
+def parse_node(label: str) -> NodeKey:
+    """
+    Parse a "platform:job_name" or "platform@instance:job_name" label.
+
+    Raises:
+        ValueError: If the platform is unknown or the label has no job name
+    """
+    platform, sep, job_name = label.partition(":")
+    if not sep or not job_name:
+        raise ValueError(f"Invalid job reference '{label}', expected 'platform:job_name'")
+    platform, _, instance = platform.partition("@")
+    return PlatformType(platform), instance, job_name
+
+
+def record_node(record: JobStatusRecord) -> NodeKey:
+    """Graph node a record belongs to."""
+    return PlatformType(record.platform), record.metadata.get("instance") or "", record.job_name
+
+
+class PipelineIncident(BaseModel):
+    """One root-cause failure and everything it affects downstream."""
+
+    root_cause: str = Field(..., description="Failed job with no failed upstream")
+    root_error: Optional[str] = Field(None, description="Root job's error message")
+    failed_downstream: List[str] = Field(default_factory=list, description="Downstream jobs that also failed")
+    impacted_downstream: List[str] = Field(default_factory=list, description="Downstream jobs at risk")
+    platforms: List[str] = Field(default_factory=list, description="Platforms involved")
+
+    def describe(self) -> str:
+        """One-line description for issue lists."""
+        text = f"{self.root_cause} failed"
+        if self.failed_downstream:
+            text += f", causing {len(self.failed_downstream)} downstream failures"
+        if self.impacted_downstream:
+            text += f", {len(self.impacted_downstream)} more downstream jobs at risk"
+        return text
+
+
+class GraphAnalysis(BaseModel):
+    """Result of analyzing one cycle's records against the graph."""
+
+    incidents: List[PipelineIncident] = Field(default_factory=list, description="Correlated incidents")
+    stale_jobs: List[str] = Field(default_factory=list, description="Jobs past their freshness limit")
+    stale_upstream: Dict[str, List[str]] = Field(
+        default_factory=dict, description="Job -> stale upstream jobs it depends on"
+    )
+    unmonitored_jobs: List[str] = Field(default_factory=list, description="Graph jobs with no records this cycle")
+
+
+class PipelineGraph:
+    """Directed acyclic graph of job dependencies across platforms."""
+
+    def __init__(self):
+        """Initialize an empty graph."""
+        self.downstream: Dict[NodeKey, List[NodeKey]] = {}
+        self.upstream: Dict[NodeKey, List[NodeKey]] = {}
+        self.max_staleness: Dict[NodeKey, timedelta] = {}
+        self._order: Optional[List[NodeKey]] = None
+
+    def __len__(self) -> int:
+        return len(self.downstream)
+
+    def __contains__(self, node: NodeKey) -> bool:
+        return node in self.downstream
+
+    def add_job(self, node: NodeKey, max_staleness_minutes: Optional[float] = None) -> None:
+        """Add a job, optionally with the maximum age of its last successful run."""
+        self.downstream.setdefault(node, [])
+        self.upstream.setdefault(node, [])
+        if max_staleness_minutes is not None:
+            self.max_staleness[node] = timedelta(minutes=max_staleness_minutes)
+        self._order = None
+
+    def add_dependency(self, upstream: NodeKey, downstream: NodeKey) -> None:
+        """Declare that downstream consumes upstream's output."""
+        self.add_job(upstream)
+        self.add_job(downstream)
+        if downstream not in self.downstream[upstream]:
+            self.downstream[upstream].append(downstream)
+            self.upstream[downstream].append(upstream)
+        self._order = None
+
+    def topological_order(self) -> List[NodeKey]:
+        """
+        Jobs ordered so every job comes after its upstreams (Kahn's algorithm).
+
+        Raises:
+            ValueError: If the dependencies contain a cycle
+        """
+        if self._order is None:
+            in_degree = {node: len(parents) for node, parents in self.upstream.items()}
+            queue = deque(node for node, degree in in_degree.items() if degree == 0)
+            order = []
+            while queue:
+                node = queue.popleft()
+                order.append(node)
+                for child in self.downstream[node]:
+                    in_degree[child] -= 1
+                    if in_degree[child] == 0:
+                        queue.append(child)
+            if len(order) != len(self.downstream):
+                cyclic = sorted(node_label(n) for n, degree in in_degree.items() if degree > 0)
+                raise ValueError(f"Pipeline dependencies contain a cycle involving: {', '.join(cyclic)}")
+            self._order = order
+        return self._order
+
+    def descendants(self, node: NodeKey) -> List[NodeKey]:
+        """All jobs downstream of a job, breadth first."""
+        seen: Set[NodeKey] = {node}
+        queue = deque([node])
+        result = []
+        while queue:
+            for child in self.downstream.get(queue.popleft(), []):
+                if child not in seen:
+                    seen.add(child)
+                    result.append(child)
+                    queue.append(child)
+        return result
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "PipelineGraph":
+        """
+        Build a graph from its declarative form.
+
+        Example:
+            {
+                "jobs": [{"job": "airbyte:Salesforce Sync", "max_staleness_minutes": 180}],
+                "dependencies": [["airbyte:Salesforce Sync", "databricks:Transform Accounts"]]
+            }
+
+        Raises:
+            ValueError: On unknown platforms, malformed references or cycles
+        """
+        graph = cls()
+        for job in config.get("jobs", []):
+            graph.add_job(parse_node(job["job"]), job.get("max_staleness_minutes"))
+        for upstream, downstream in config.get("dependencies", []):
+            graph.add_dependency(parse_node(upstream), parse_node(downstream))
+        graph.topological_order()
+        return graph
+
+    @classmethod
+    def load(cls, path: str) -> "PipelineGraph":
+        """
+        Load a graph from a JSON file.
+
+        Raises:
+            ValueError: If the file is not a valid graph definition
+            OSError: If the file cannot be read
+        """
+        with open(path) as f:
+            graph = cls.from_dict(json.load(f))
+        logger.info(f"Loaded pipeline graph with {len(graph)} jobs from {path}")
+        return graph
+
+    def analyze(self, records: Iterable[JobStatusRecord], now: Optional[datetime] = None) -> GraphAnalysis:
+        """
+        Correlate a cycle's records into incidents and find stale jobs.
+
+        Runs in O(records + jobs + dependencies): records are reduced to the
+        latest status per job, then the graph is walked once in topological
+        order propagating failed and stale ancestors.
+
+        Args:
+            records: Job status records collected this cycle
+            now: Reference time for freshness checks
+
+        Returns:
+            GraphAnalysis with incidents, stale jobs and unmonitored jobs
+        """
+        now = now or utc_now()
+        order = self.topological_order()
+
+        # Latest record and latest success per graph job
+        latest: Dict[NodeKey, JobStatusRecord] = {}
+        last_success: Dict[NodeKey, datetime] = {}
+        for record in records:
+            node = record_node(record)
+            if node not in self.downstream:
+                continue
+            run_time = ensure_utc(record.last_run_time or record.checked_at)
+            current = latest.get(node)
+            if current is None or run_time >= ensure_utc(current.last_run_time or current.checked_at):
+                latest[node] = record
+            if record.status == JobStatus.SUCCESS and (node not in last_success or run_time > last_success[node]):
+                last_success[node] = run_time
+
+        failed = {node for node, record in latest.items() if record.status == JobStatus.FAILED}
+        stale = {
+            node for node, limit in self.max_staleness.items()
+            if node not in last_success or now - last_success[node] > limit
+        }
+
+        # Walk once in topological order, carrying the failed roots and stale
+        # jobs upstream of each node
+        failed_roots: Dict[NodeKey, Set[NodeKey]] = {}
+        stale_ancestors: Dict[NodeKey, Set[NodeKey]] = {}
+        roots: List[NodeKey] = []
+        for node in order:
+            inherited_roots: Set[NodeKey] = set()
+            inherited_stale: Set[NodeKey] = set()
+            for parent in self.upstream[node]:
+                inherited_roots |= failed_roots.get(parent, set())
+                inherited_stale |= stale_ancestors.get(parent, set())
+                if parent in stale:
+                    inherited_stale.add(parent)
+            if node in failed and not inherited_roots:
+                roots.append(node)
+                inherited_roots = {node}
+            if inherited_roots:
+                failed_roots[node] = inherited_roots
+            if inherited_stale:
+                stale_ancestors[node] = inherited_stale
+
+        incidents: Dict[NodeKey, PipelineIncident] = {
+            root: PipelineIncident(root_cause=node_label(root), root_error=latest[root].error_message)
+            for root in roots
+        }
+        for node in order:
+            for root in failed_roots.get(node, ()):
+                if node == root:
+                    continue
+                incident = incidents[root]
+                target = incident.failed_downstream if node in failed else incident.impacted_downstream
+                target.append(node_label(node))
+        for root, incident in incidents.items():
+            involved = [root] + [parse_node(label) for label in incident.failed_downstream]
+            incident.platforms = sorted({n[0].value for n in involved})
+
+        return GraphAnalysis(
+            incidents=list(incidents.values()),
+            stale_jobs=[node_label(n) for n in order if n in stale],
+            stale_upstream={
+                node_label(node): sorted(node_label(s) for s in ancestors)
+                for node, ancestors in stale_ancestors.items()
+            },
+            unmonitored_jobs=[node_label(n) for n in order if n not in latest],
+        )
+
+
+_graph_cache: Dict[str, Tuple[float, PipelineGraph]] = {}
+
+
+def get_pipeline_graph(path: str) -> Optional[PipelineGraph]:
+    """
+    Get the pipeline graph for a definition file, reloading it when the file changes.
+
+    Returns:
+        PipelineGraph, or None if no path is configured or the file is missing or invalid
+    """
+    if not path:
+        return None
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        logger.warning(f"Pipeline graph file not found: {path}")
+        return None
+
+    cached = _graph_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        graph = PipelineGraph.load(path)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.error(f"Invalid pipeline graph {path}: {e}")
+        return None
+    _graph_cache[path] = (mtime, graph)
+    return graph
@@ -0,0 +1,228 @@
+"""
+Streaming duration-anomaly detection with per-job baselines.
+
+Each (platform, instance, job_name) keeps an exponentially weighted mean and variance
+of its run durations: three floats and a counter, updated in O(1) per
+record. A run whose duration falls outside mean +/- k standard deviations of
+its job's baseline is flagged. Baselines are saved to a JSON state file so
+they survive restarts.
+"""
+
+import logging
+import math
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from models.job_status import JobStatus, JobStatusRecord, PlatformType
+from models.state_file import PersistentState
+from models.timestamps import ensure_utc
+
+logger = logging.getLogger(__name__)
+
+STATE_VERSION = 2
+
+# (platform, instance, job_name); instance is "" for jobs collected outside any instance
+BaselineKey = Tuple[str, str, str]
+
+
+class DurationBaseline:
+    """EWMA mean/variance of one job's durations."""
+
+    __slots__ = ("mean", "variance", "count", "last_run_epoch")
+
+    def __init__(self, mean: float = 0.0, variance: float = 0.0, count: int = 0, last_run_epoch: float = 0.0):
+        self.mean = mean
+        self.variance = variance
+        self.count = count
+        self.last_run_epoch = last_run_epoch
+
+    @property
+    def std(self) -> float:
+        """Standard deviation of the baseline."""
+        return math.sqrt(self.variance)
+
+    def update(self, duration: float, alpha: float) -> None:
+        """Fold a duration into the baseline (the first sample seeds the mean)."""
+        if self.count == 0:
+            self.mean = duration
+            self.variance = 0.0
+        else:
+            diff = duration - self.mean
+            increment = alpha * diff
+            self.mean += increment
+            self.variance = (1 - alpha) * (self.variance + diff * increment)
+        self.count += 1
+
+    def to_list(self) -> List[float]:
+        """Compact serialized form."""
+        return [self.mean, self.variance, self.count, self.last_run_epoch]
+
+    @classmethod
+    def from_list(cls, values: List[float]) -> "DurationBaseline":
+        """Restore from to_list output."""
+        mean, variance, count, last_run_epoch = values
+        return cls(float(mean), float(variance), int(count), float(last_run_epoch))
+
+
+class DurationAnomaly(BaseModel):
+    """A run whose duration fell outside its job's learned band."""
+
+    platform: PlatformType = Field(..., description="Platform type")
+    job_name: str = Field(..., description="Job name")
+    job_id: str = Field(..., description="Job run identifier")
+    duration_seconds: int = Field(..., description="Observed duration")
+    baseline_mean_seconds: float = Field(..., description="Baseline mean duration")
+    baseline_std_seconds: float = Field(..., description="Baseline standard deviation")
+    ratio: float = Field(..., description="Observed duration / baseline mean")
+    direction: str = Field(..., description="'slow' or 'fast'")
+
+    def describe(self) -> str:
+        """One-line description for issue lists and logs."""
+        return (
+            f"{self.job_name} took {self.duration_seconds}s, "
+            f"{self.ratio:.1f}x its usual {self.baseline_mean_seconds:.0f}s"
+        )
+
+
+class DurationAnomalyDetector(PersistentState):
+    """Per-job EWMA duration baselines with anomaly flagging."""
+
+    state_name = "duration baselines"
+
+    def __init__(
+        self,
+        alpha: float = 0.1,
+        threshold_sigmas: float = 3.0,
+        min_samples: int = 5,
+        min_relative_deviation: float = 0.5,
+        max_jobs: int = 10000,
+    ):
+        """
+        Initialize duration anomaly detector.
+
+        Args:
+            alpha: EWMA smoothing factor; higher values adapt faster
+            threshold_sigmas: Width of the normal band in standard deviations
+            min_samples: Runs a job needs before it can be flagged
+            min_relative_deviation: Deviation from the mean (as a fraction of it) a run must
+                also exceed, so very stable jobs are not flagged for small jitter
+            max_jobs: Baselines kept; the least recently updated job is evicted beyond this
+        """
+        self.alpha = alpha
+        self.threshold_sigmas = threshold_sigmas
+        self.min_samples = min_samples
+        self.min_relative_deviation = min_relative_deviation
+        self.max_jobs = max_jobs
+        self.baselines: "OrderedDict[BaselineKey, DurationBaseline]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.baselines)
+
+    def _baseline(self, key: BaselineKey) -> DurationBaseline:
+        """Get or create a baseline and mark it most recently used."""
+        baseline = self.baselines.get(key)
+        if baseline is None:
+            baseline = DurationBaseline()
+            self.baselines[key] = baseline
+            if len(self.baselines) > self.max_jobs:
+                self.baselines.popitem(last=False)
+        else:
+            self.baselines.move_to_end(key)
+        return baseline
+
+    def _check(self, baseline: DurationBaseline, duration: float) -> Optional[str]:
+        """Return 'slow' or 'fast' if the duration is outside the baseline band."""
+        if baseline.count < self.min_samples or baseline.mean <= 0:
+            return None
+        deviation = duration - baseline.mean
+        band = max(self.threshold_sigmas * baseline.std, self.min_relative_deviation * baseline.mean)
+        if abs(deviation) <= band:
+            return None
+        return "slow" if deviation > 0 else "fast"
+
+    def observe(self, record: JobStatusRecord) -> Optional[DurationAnomaly]:
+        """
+        Check a record against its job's baseline, then learn from it.
+
+        Only successful runs with a duration and run time are considered: a
+        failed or cancelled run stops early or hangs for reasons unrelated to
+        its normal duration, and is already reported as a failure. A run
+        already seen (same or older run time) is ignored, so re-collecting
+        recent jobs every cycle does not skew the baseline.
+
+        Returns:
+            DurationAnomaly if the run is outside the band, otherwise None
+        """
+        if record.status != JobStatus.SUCCESS:
+            return None
+        if record.duration_seconds is None or record.last_run_time is None:
+            return None
+
+        run_epoch = ensure_utc(record.last_run_time).timestamp()
+        key = (PlatformType(record.platform).value, record.metadata.get("instance") or "", record.job_name)
+        baseline = self._baseline(key)
+        if run_epoch <= baseline.last_run_epoch:
+            return None
+        baseline.last_run_epoch = run_epoch
+
+        duration = float(record.duration_seconds)
+        direction = self._check(baseline, duration)
+        anomaly = None
+        if direction is not None:
+            anomaly = DurationAnomaly(
+                platform=record.platform,
+                job_name=record.job_name,
+                job_id=record.job_id,
+                duration_seconds=record.duration_seconds,
+                baseline_mean_seconds=round(baseline.mean, 2),
+                baseline_std_seconds=round(baseline.std, 2),
+                ratio=round(duration / baseline.mean, 2),
+                direction=direction,
+            )
+
+        baseline.update(duration, self.alpha)
+        return anomaly
+
+    def observe_records(self, records: Iterable[JobStatusRecord]) -> List[DurationAnomaly]:
+        """
+        Observe records in run-time order and collect anomalies.
+
+        Returns:
+            Anomalies found among the records
+        """
+        ordered = sorted(
+            (r for r in records if r.last_run_time is not None),
+            key=lambda r: ensure_utc(r.last_run_time),
+        )
+        anomalies = []
+        for record in ordered:
+            anomaly = self.observe(record)
+            if anomaly is not None:
+                anomalies.append(anomaly)
+        return anomalies
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize baselines, least recently used first."""
+        return {
+            "version": STATE_VERSION,
+            "alpha": self.alpha,
+            "baselines": [[*key, *b.to_list()] for key, b in self.baselines.items()],
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        """Replace baselines with serialized state from to_dict."""
+        version = state.get("version")
+        if version not in (1, STATE_VERSION):
+            logger.warning(f"Ignoring duration baseline state with version {version}")
+            return
+        self.baselines.clear()
+        for row in state.get("baselines", []):
+            # Version 1 baselines predate instances and belong to unscoped jobs
+            if version == 1:
+                row = [row[0], "", *row[1:]]
+            platform, instance, job_name, *values = row
+            self.baselines[(platform, instance, job_name)] = DurationBaseline.from_list(values)
+        while len(self.baselines) > self.max_jobs:
+            self.baselines.popitem(last=False)
@@ -0,0 +1,240 @@
+"""
+Error-message fingerprinting and clustering.
+
+Variable tokens (UUIDs, hex ids, timestamps, paths, URLs, numbers, quoted
+values) are replaced with placeholders, and the remaining template is hashed
+into a stable signature, so thousands of failures that differ only in ids or
+times collapse into a handful of distinct problems. Known error categories
+are matched with one precompiled multi-pattern regex.
+"""
+
+import hashlib
+import logging
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from models.job_status import JobStatus, JobStatusRecord, PlatformType
+from models.state_file import PersistentState
+from models.timestamps import utc_now
+
+logger = logging.getLogger(__name__)
+
+STATE_VERSION = 1
+MAX_TEMPLATE_LENGTH = 500
+
+# Variable tokens, most specific first; each match is replaced by <group name>
+_VARIABLE_TOKENS = re.compile(
+    "|".join([
+        r"(?P<url>\b[a-z][a-z0-9+.-]*://\S+)",
+        r"(?P<email>\b[\w.+-]+@[\w-]+\.[\w.-]+\b)",
+        r"(?P<uuid>\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b)",
+        r"(?P<ts>\b\d{4}-\d{2}-\d{2}[t ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:z|[+-]\d{2}:?\d{2})?)",
+        r"(?P<ip>\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b)",
+        r"(?P<path>(?:[a-z]:\\|/)[\w.\-\\/]*[\\/][\w.\-\\/]*)",
+        r"(?P<hex>\b(?:0x)?(?=[0-9a-f]*\d)(?=[0-9a-f]*[a-f])[0-9a-f]{6,}\b)",
+        r"(?P<str>'[^']*'|\"[^\"]*\")",
+        r"(?P<num>\d+(?:\.\d+)?)",
+    ]),
+    re.IGNORECASE,
+)
+_WHITESPACE = re.compile(r"\s+")
+
+# Known categories in priority order; when several match, the earliest listed wins
+ERROR_CATEGORY_PATTERNS: Tuple[Tuple[str, str], ...] = (
+    ("timeout", r"time[d ]?\s?out|deadline exceeded"),
+    ("connection", r"connection|connect(?:ion)? refused|unreachable|network|dns|ssl|socket"),
+    ("authentication", r"authenticat|\bauth|unauthori[sz]ed|\b401\b|invalid (?:token|credentials)|expired token"),
+    ("permission", r"permission|forbidden|access denied|not authori[sz]ed|\b403\b|insufficient privileges"),
+    ("rate_limit", r"rate limit|too many requests|\b429\b|throttl|quota"),
+    ("out_of_memory", r"out of memory|\boom\b|memoryerror|heap space|memory limit"),
+    ("not_found", r"not found|does not exist|no such|\b404\b"),
+    ("schema", r"schema|column|type mismatch|cannot cast|invalid type|parse error|syntax error"),
+)
+OTHER_CATEGORY = "other"
+CATEGORY_NAMES = tuple(name for name, _ in ERROR_CATEGORY_PATTERNS) + (OTHER_CATEGORY,)
+_CATEGORY_PRIORITY = {name: i for i, name in enumerate(CATEGORY_NAMES)}
+_CATEGORY_MATCHER = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in ERROR_CATEGORY_PATTERNS),
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=8192)
+def categorize_error(error_message: str) -> str:
+    """Classify an error message with the multi-pattern matcher (one scan of the text)."""
+    matched = {m.lastgroup for m in _CATEGORY_MATCHER.finditer(error_message)}
+    if not matched:
+        return OTHER_CATEGORY
+    return min(matched, key=_CATEGORY_PRIORITY.__getitem__)
+
+
+@lru_cache(maxsize=8192)
+def normalize_error(error_message: str) -> str:
+    """Replace variable tokens with placeholders and collapse whitespace."""
+    template = _VARIABLE_TOKENS.sub(lambda m: f"<{m.lastgroup}>", error_message.lower())
+    return _WHITESPACE.sub(" ", template).strip()[:MAX_TEMPLATE_LENGTH]
+
+
+@lru_cache(maxsize=8192)
+def fingerprint_error(error_message: str) -> Tuple[str, str]:
+    """
+    Compute an error's stable signature.
+
+    Returns:
+        (signature, normalized template); the signature is a 16-character hex digest
+    """
+    template = normalize_error(error_message)
+    signature = hashlib.blake2b(template.encode("utf-8"), digest_size=8).hexdigest()
+    return signature, template
+
+
+class ErrorCluster(BaseModel):
+    """Failures sharing one error signature."""
+
+    signature: str = Field(..., description="Stable hash of the normalized message")
+    template: str = Field(..., description="Message with variable tokens replaced")
+    category: str = Field(..., description="Matched error category")
+    count: int = Field(0, description="Failures with this signature")
+    example: str = Field(..., description="One original message")
+    platforms: List[str] = Field(default_factory=list, description="Platforms reporting it")
+    job_names: List[str] = Field(default_factory=list, description="Up to max_jobs_per_cluster affected jobs")
+    first_seen: Optional[str] = Field(None, description="ISO time first observed")
+    last_seen: Optional[str] = Field(None, description="ISO time last observed")
+
+
+def _add_failure(
+    clusters: Dict[str, ErrorCluster],
+    record: JobStatusRecord,
+    seen_at: str,
+    max_jobs_per_cluster: int,
+) -> ErrorCluster:
+    """Fold one failed record into a cluster dictionary."""
+    signature, template = fingerprint_error(record.error_message)
+    cluster = clusters.get(signature)
+    if cluster is None:
+        cluster = ErrorCluster(
+            signature=signature,
+            template=template,
+            category=categorize_error(record.error_message),
+            example=record.error_message[:MAX_TEMPLATE_LENGTH],
+            first_seen=seen_at,
+        )
+        clusters[signature] = cluster
+    cluster.count += 1
+    cluster.last_seen = seen_at
+    platform = PlatformType(record.platform).value
+    if platform not in cluster.platforms:
+        cluster.platforms.append(platform)
+    if record.job_name not in cluster.job_names and len(cluster.job_names) < max_jobs_per_cluster:
+        cluster.job_names.append(record.job_name)
+    return cluster
+
+
+def _failed_with_message(records: Iterable[JobStatusRecord]) -> Iterable[JobStatusRecord]:
+    """Failed records that carry an error message."""
+    return (r for r in records if r.status == JobStatus.FAILED and r.error_message)
+
+
+def cluster_errors(
+    records: Iterable[JobStatusRecord],
+    limit: Optional[int] = None,
+    max_jobs_per_cluster: int = 5,
+) -> List[ErrorCluster]:
+    """
+    Group failed records by error signature in one pass.
+
+    Args:
+        records: Job status records; only failed ones with an error message are used
+        limit: Maximum number of clusters returned
+        max_jobs_per_cluster: Affected job names kept per cluster
+
+    Returns:
+        Clusters ranked by failure count
+    """
+    clusters: Dict[str, ErrorCluster] = {}
+    seen_at = utc_now().isoformat()
+    for record in _failed_with_message(records):
+        _add_failure(clusters, record, seen_at, max_jobs_per_cluster)
+    ranked = sorted(clusters.values(), key=lambda c: c.count, reverse=True)
+    return ranked[:limit] if limit is not None else ranked
+
+
+class ErrorFingerprintStore(PersistentState):
+    """Error clusters accumulated across monitoring cycles."""
+
+    state_name = "error fingerprints"
+
+    def __init__(
+        self,
+        max_signatures: int = 5000,
+        max_tracked_runs: int = 50000,
+        max_jobs_per_cluster: int = 5,
+    ):
+        """
+        Initialize error fingerprint store.
+
+        Args:
+            max_signatures: Clusters kept; the least recently seen is evicted beyond this
+            max_tracked_runs: Failed runs remembered so re-collected runs are not counted twice
+            max_jobs_per_cluster: Affected job names kept per cluster
+        """
+        self.max_signatures = max_signatures
+        self.max_tracked_runs = max_tracked_runs
+        self.max_jobs_per_cluster = max_jobs_per_cluster
+        self.clusters: "OrderedDict[str, ErrorCluster]" = OrderedDict()
+        self._seen_runs: "OrderedDict[str, None]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.clusters)
+
+    def observe_records(self, records: Iterable[JobStatusRecord]) -> List[ErrorCluster]:
+        """
+        Count new failures from a batch of records.
+
+        Returns:
+            Clusters that received failures from this batch, ranked by their total count
+        """
+        seen_at = utc_now().isoformat()
+        touched: Dict[str, ErrorCluster] = {}
+        for record in _failed_with_message(records):
+            run_key = f"{PlatformType(record.platform).value}:{record.job_id}"
+            if run_key in self._seen_runs:
+                continue
+            self._seen_runs[run_key] = None
+            if len(self._seen_runs) > self.max_tracked_runs:
+                self._seen_runs.popitem(last=False)
+
+            cluster = _add_failure(self.clusters, record, seen_at, self.max_jobs_per_cluster)
+            self.clusters.move_to_end(cluster.signature)
+            touched[cluster.signature] = cluster
+
+        while len(self.clusters) > self.max_signatures:
+            self.clusters.popitem(last=False)
+        return sorted(touched.values(), key=lambda c: c.count, reverse=True)
+
+    def ranked(self, limit: Optional[int] = None) -> List[ErrorCluster]:
+        """All known clusters ranked by total failure count."""
+        ranked = sorted(self.clusters.values(), key=lambda c: c.count, reverse=True)
+        return ranked[:limit] if limit is not None else ranked
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize clusters and tracked runs, least recently seen first."""
+        return {
+            "version": STATE_VERSION,
+            "clusters": [c.model_dump() for c in self.clusters.values()],
+            "seen_runs": list(self._seen_runs),
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        """Replace contents with serialized state from to_dict."""
+        if state.get("version") != STATE_VERSION:
+            logger.warning(f"Ignoring error fingerprint state with version {state.get('version')}")
+            return
+        self.clusters = OrderedDict(
+            (c["signature"], ErrorCluster(**c)) for c in state.get("clusters", [])[-self.max_signatures:]
+        )
+        self._seen_runs = OrderedDict.fromkeys(state.get("seen_runs", [])[-self.max_tracked_runs:])
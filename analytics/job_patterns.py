@@ -0,0 +1,239 @@
+"""
+Vectorized job pattern analysis.
+
+Job records (agent dictionaries, JobStatusRecord objects or a
+JobStatusBatch) are turned into NumPy columns once; status counts, rates,
+duration percentiles, per-job failure streaks and error categories are then
+computed on those arrays instead of with repeated passes over dictionaries.
+Works for any platform's records.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from models.job_batch import JobStatusBatch, STATUS_CODES, NO_DURATION
+from models.job_status import JobStatus, JobStatusRecord
+from models.timestamps import try_parse_timestamp, utc_now
+from .error_fingerprints import CATEGORY_NAMES, categorize_error, fingerprint_error
+
+logger = logging.getLogger(__name__)
+
+_STATUS_INDEX = {status: i for i, status in enumerate(STATUS_CODES)}
+UNKNOWN_CODE = _STATUS_INDEX[JobStatus.UNKNOWN]
+FAILED_CODE = _STATUS_INDEX[JobStatus.FAILED]
+
+_CATEGORY_INDEX = {name: i for i, name in enumerate(CATEGORY_NAMES)}
+
+DURATION_PERCENTILES = (50, 95, 99)
+
+JobsInput = Union[JobStatusBatch, Iterable[Dict[str, Any]], Iterable[JobStatusRecord]]
+
+
+class JobColumns:
+    """Column arrays extracted from job records for analysis."""
+
+    def __init__(
+        self,
+        status_codes: np.ndarray,
+        durations: np.ndarray,
+        run_epochs: np.ndarray,
+        job_names: List[str],
+        error_messages: Dict[int, str],
+    ):
+        """
+        Initialize job columns.
+
+        Args:
+            status_codes: uint8 index into STATUS_CODES per row
+            durations: float64 seconds per row, NaN when unknown
+            run_epochs: float64 last run time per row, NaN when unknown
+            job_names: Job name per row (groups rows for streaks)
+            error_messages: Sparse row -> error message
+        """
+        self.status_codes = status_codes
+        self.durations = durations
+        self.run_epochs = run_epochs
+        self.job_names = job_names
+        self.error_messages = error_messages
+
+    def __len__(self) -> int:
+        return len(self.status_codes)
+
+    @classmethod
+    def from_batch(cls, batch: JobStatusBatch) -> "JobColumns":
+        """Wrap a JobStatusBatch's arrays without copying the numeric columns."""
+        durations = np.frombuffer(batch.duration_seconds, dtype=np.int64).astype(np.float64)
+        durations[durations == NO_DURATION] = np.nan
+        return cls(
+            status_codes=np.frombuffer(batch.status_codes, dtype=np.uint8),
+            durations=durations,
+            run_epochs=np.frombuffer(batch.last_run_epochs, dtype=np.float64),
+            job_names=batch.job_names,
+            error_messages=batch.error_messages,
+        )
+
+    @classmethod
+    def from_records(cls, jobs: Iterable[Any]) -> "JobColumns":
+        """
+        Extract columns from agent dictionaries or JobStatusRecord objects.
+
+        Missing or unrecognized values are tolerated: an unknown status counts
+        as UNKNOWN and a missing duration or run time becomes NaN.
+        """
+        status_codes: List[int] = []
+        durations: List[float] = []
+        run_epochs: List[float] = []
+        job_names: List[str] = []
+        error_messages: Dict[int, str] = {}
+
+        for row, job in enumerate(jobs):
+            get = job.get if isinstance(job, dict) else lambda key, _job=job: getattr(_job, key, None)
+            status_codes.append(_STATUS_INDEX.get(get("status"), UNKNOWN_CODE))
+            duration = get("duration_seconds")
+            durations.append(float(duration) if duration is not None else np.nan)
+            last_run = try_parse_timestamp(get("last_run_time"))
+            run_epochs.append(last_run.timestamp() if last_run else np.nan)
+            job_names.append(get("job_name") or "Unknown")
+            error_message = get("error_message")
+            if error_message:
+                error_messages[row] = error_message
+
+        return cls(
+            status_codes=np.array(status_codes, dtype=np.uint8),
+            durations=np.array(durations, dtype=np.float64),
+            run_epochs=np.array(run_epochs, dtype=np.float64),
+            job_names=job_names,
+            error_messages=error_messages,
+        )
+
+    @classmethod
+    def from_jobs(cls, jobs: JobsInput) -> "JobColumns":
+        """Build columns from any supported job input."""
+        if isinstance(jobs, JobStatusBatch):
+            return cls.from_batch(jobs)
+        return cls.from_records(jobs)
+
+
+def _failure_streaks(columns: JobColumns, failed: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute per-job failure streaks.
+
+    Rows are ordered by job, then run time (unknown times last, then input
+    order). A streak is the number of consecutive failed runs.
+
+    Returns:
+        (job names, current streak ending at each job's latest run, longest streak) per job
+    """
+    names, job_index = np.unique(np.asarray(columns.job_names, dtype=object), return_inverse=True)
+    order = np.lexsort((np.arange(len(columns)), columns.run_epochs, job_index))
+    job_sorted = job_index[order]
+    failed_sorted = failed[order]
+
+    group_start = np.empty(len(order), dtype=bool)
+    group_start[0] = True
+    group_start[1:] = job_sorted[1:] != job_sorted[:-1]
+
+    # streak[i] = failures since the last non-failed row (or group start) up to i
+    failed_cumsum = np.cumsum(failed_sorted)
+    breaks = ~failed_sorted | group_start
+    base = np.where(failed_sorted, failed_cumsum - 1, failed_cumsum)
+    last_break = np.maximum.accumulate(np.where(breaks, np.arange(len(order)), 0))
+    streak = failed_cumsum - base[last_break]
+
+    starts = np.flatnonzero(group_start)
+    ends = np.r_[starts[1:] - 1, len(order) - 1]
+    return names, streak[ends], np.maximum.reduceat(streak, starts)
+
+
+def analyze_jobs(jobs: JobsInput, streak_limit: int = 10, cluster_limit: int = 10) -> Dict[str, Any]:
+    """
+    Analyze job execution patterns.
+
+    Args:
+        jobs: JobStatusBatch, agent record dictionaries or JobStatusRecord objects
+        streak_limit: Maximum number of jobs listed in failure_streaks
+        cluster_limit: Maximum number of distinct errors listed in error_clusters
+
+    Returns:
+        Dictionary with status counts and rates, duration statistics, failed
+        job names, per-job failure streaks, error category counts and the
+        most frequent error signatures
+    """
+    columns = JobColumns.from_jobs(jobs)
+    total_jobs = len(columns)
+
+    counts = np.bincount(columns.status_codes, minlength=len(STATUS_CODES))
+    status_counts = {status.value: int(counts[code]) for code, status in enumerate(STATUS_CODES)}
+    successful_jobs = status_counts[JobStatus.SUCCESS.value]
+    failed_jobs = status_counts[JobStatus.FAILED.value]
+
+    def rate(count: int) -> float:
+        return round(count / total_jobs * 100, 2) if total_jobs else 0.0
+
+    # Durations: zero or unknown durations carry no timing information
+    durations = columns.durations[columns.durations > 0]
+    duration_stats: Dict[str, Optional[float]] = {"avg_duration_seconds": 0.0}
+    percentile_keys = [f"p{p}_duration_seconds" for p in DURATION_PERCENTILES]
+    if durations.size:
+        duration_stats["avg_duration_seconds"] = round(float(durations.mean()), 2)
+        for key, value in zip(percentile_keys, np.percentile(durations, DURATION_PERCENTILES)):
+            duration_stats[key] = round(float(value), 2)
+        duration_stats["max_duration_seconds"] = round(float(durations.max()), 2)
+    else:
+        duration_stats.update({key: None for key in percentile_keys})
+        duration_stats["max_duration_seconds"] = None
+
+    failed = columns.status_codes == FAILED_CODE
+
+    # Error categories and signatures for failed rows that carry a message
+    category_codes: List[int] = []
+    clusters: Dict[str, Dict[str, Any]] = {}
+    for row, message in columns.error_messages.items():
+        if not failed[row]:
+            continue
+        category = categorize_error(message)
+        category_codes.append(_CATEGORY_INDEX[category])
+        signature, template = fingerprint_error(message)
+        cluster = clusters.get(signature)
+        if cluster is None:
+            cluster = clusters[signature] = {
+                "signature": signature,
+                "template": template,
+                "category": category,
+                "count": 0,
+                "example_job": columns.job_names[row],
+            }
+        cluster["count"] += 1
+    category_counts = np.bincount(np.array(category_codes, dtype=np.int64), minlength=len(CATEGORY_NAMES))
+    error_patterns = {name: int(n) for name, n in zip(CATEGORY_NAMES, category_counts) if n}
+    error_clusters = sorted(clusters.values(), key=lambda c: c["count"], reverse=True)[:cluster_limit]
+
+    failure_streaks: List[Dict[str, Any]] = []
+    failed_job_names: List[str] = []
+    if failed.any():
+        names, current, longest = _failure_streaks(columns, failed)
+        failed_job_names = [str(name) for name in names[longest > 0]]
+        ranked = np.argsort(-current, kind="stable")
+        failure_streaks = [
+            {"job_name": str(names[i]), "current_streak": int(current[i]), "longest_streak": int(longest[i])}
+            for i in ranked[:streak_limit]
+            if current[i] > 0
+        ]
+
+    return {
+        "total_jobs": total_jobs,
+        "successful_jobs": successful_jobs,
+        "failed_jobs": failed_jobs,
+        "running_jobs": status_counts[JobStatus.RUNNING.value],
+        "status_counts": status_counts,
+        "success_rate": rate(successful_jobs),
+        "failure_rate": rate(failed_jobs),
+        **duration_stats,
+        "failed_job_names": failed_job_names,
+        "failure_streaks": failure_streaks,
+        "error_patterns": error_patterns,
+        "error_clusters": error_clusters,
+        "analysis_timestamp": utc_now().isoformat(),
+    }
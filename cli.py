@@ -22,6 +22,7 @@ from pydantic_ai import Agent
 from agents.orchestrator_agent import orchestrator_agent
 from agents.dependencies import OrchestratorDependencies
 from config.settings import settings
+from tools.local_history import LocalHistoryError, get_local_history_store
 
 console = Console()
 
@@ -161,6 +162,7 @@ def show_help():
 • [yellow]help[/yellow] - Show this help message
 • [yellow]config[/yellow] - Show current configuration
 • [yellow]test connection[/yellow] - Test API connections
+• [yellow]history [hours][/yellow] - Show jobs with the most failures from local history
 • [yellow]exit[/yellow] or [yellow]quit[/yellow] - Exit the CLI
 
 [bold green]Example Usage:[/bold green]
@@ -201,6 +203,44 @@ def show_config():
     console.print(config_table)
 
 
+def show_history(hours_back: int = 168):
+    """Display the most failing jobs from the local history store."""
+    try:
+        store = get_local_history_store()
+        failures = store.failure_summary(hours_back=hours_back)
+        sessions = store.recent_sessions(limit=5)
+    except LocalHistoryError as e:
+        console.print(f"[red]❌ Local history unavailable: {e}[/red]")
+        return
+    
+    history_table = Table(title=f"Failing Jobs (last {hours_back} hours, local history)")
+    history_table.add_column("Platform", style="cyan")
+    history_table.add_column("Job", style="white")
+    history_table.add_column("Failures", style="red", justify="right")
+    history_table.add_column("Runs", justify="right")
+    history_table.add_column("Failure Rate", justify="right")
+    history_table.add_column("Last Failure", style="dim")
+    
+    for row in failures:
+        history_table.add_row(
+            row["platform"],
+            row["job_name"],
+            str(row["failures"]),
+            str(row["runs"]),
+            f"{row['failure_rate']:.1f}%",
+            row["last_failure"] or "-",
+        )
+    
+    console.print(history_table)
+    if sessions:
+        console.print(
+            f"[dim]Last cycle: {sessions[0]['monitoring_id']} at {sessions[0]['started_at']} "
+            f"({sessions[0]['failed_jobs']}/{sessions[0]['total_jobs']} failed)[/dim]"
+        )
+    else:
+        console.print("[dim]No monitoring cycles recorded locally yet[/dim]")
+
+
 async def main():
     """Main conversation loop."""
     
@@ -235,6 +275,11 @@ async def main():
             if user_input.lower() == 'config':
                 show_config()
                 continue
+            
+            if user_input.lower().startswith('history'):
+                parts = user_input.split()
+                show_history(int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 168)
+                continue
                 
             if not user_input:
                 continue
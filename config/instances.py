@@ -0,0 +1,128 @@
+"""
+Platform instance configuration for multi-workspace monitoring.
+
+One process can monitor several instances of each platform (Airbyte
+workspaces, Databricks workspaces, Graph tenants, Snowflake accounts). The
+instances are declared in a JSON file and collected next to the platforms
+configured by the global settings; without a file none are added.
+
+Example:
+    {
+        "instances": [
+            {
+                "name": "dbx-prod",
+                "platform": "databricks",
+                "max_concurrency": 4,
+                "options": {"api_key": "${DATABRICKS_PROD_TOKEN}", "base_url": "https://prod.cloud.databricks.com"}
+            }
+        ]
+    }
+
+String options may reference environment variables as ${NAME}, so secrets
+stay out of the file. A bad instance (invalid fields, a repeated name or an
+unset variable) is logged and left out; an unreadable file disables all
+instances. Neither stops monitoring of the configured platforms.
+"""
+
+import json
+import logging
+import os
+import re
+from typing import Any, Dict, List
+
+from pydantic import ValidationError
+
+from models.platform_instances import PlatformInstance
+
+logger = logging.getLogger(__name__)
+
+_INSTANCE_NAME = re.compile(r"^[A-Za-z0-9_.-]+$")
+_ENV_REFERENCE = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+def _expand_env(value: Any) -> Any:
+    """Replace ${NAME} references in strings with environment variables."""
+    if isinstance(value, str):
+        def _lookup(match: "re.Match[str]") -> str:
+            name = match.group(1)
+            if name not in os.environ:
+                raise ValueError(f"Environment variable {name} is not set")
+            return os.environ[name]
+        return _ENV_REFERENCE.sub(_lookup, value)
+    if isinstance(value, list):
+        return [_expand_env(item) for item in value]
+    return value
+
+
+def _parse_instance(entry: Any) -> PlatformInstance:
+    """
+    Build one instance from its declarative form.
+
+    Raises:
+        ValueError: On invalid fields or names, or unset environment variables
+    """
+    if not isinstance(entry, dict):
+        raise ValueError(f"Instance entries must be objects, got {entry!r}")
+    try:
+        instance = PlatformInstance(**entry)
+    except ValidationError as e:
+        raise ValueError(f"Invalid instance {entry.get('name')!r}: {e}") from e
+    if not _INSTANCE_NAME.match(instance.name):
+        raise ValueError(f"Invalid instance name {instance.name!r}, use letters, digits, '.', '_' or '-'")
+    try:
+        instance.options = {option: _expand_env(value) for option, value in instance.options.items()}
+    except ValueError as e:
+        raise ValueError(f"Instance {instance.name!r}: {e}") from e
+    return instance
+
+
+def parse_instances(config: Dict[str, Any]) -> List[PlatformInstance]:
+    """
+    Build instances from their declarative form.
+
+    Invalid instances and names repeated within a platform are logged and
+    skipped, so one bad entry does not disable the others.
+    """
+    instances = []
+    seen = set()
+    for entry in config.get("instances", []):
+        try:
+            instance = _parse_instance(entry)
+        except ValueError as e:
+            logger.error(f"Skipping platform instance: {e}")
+            continue
+        key = (instance.platform, instance.name)
+        if key in seen:
+            logger.error(f"Skipping duplicate {instance.platform.value} instance name {instance.name!r}")
+            continue
+        seen.add(key)
+        instances.append(instance)
+    return instances
+
+
+def load_instances(path: str) -> List[PlatformInstance]:
+    """
+    Load instances from a JSON file.
+
+    Returns:
+        The valid instances; none if the file cannot be read or is not an instance definition
+    """
+    try:
+        with open(path) as f:
+            config = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error(f"Failed to load platform instances from {path}: {e}")
+        return []
+    if not isinstance(config, dict):
+        logger.error(f"Failed to load platform instances from {path}: expected an object with an 'instances' list")
+        return []
+    instances = parse_instances(config)
+    logger.info(f"Loaded {len(instances)} platform instances from {path}")
+    return instances
+
+
+def get_instances(settings: Any) -> List[PlatformInstance]:
+    """Enabled instances from settings.instances_path; none if it is not set."""
+    if not settings.instances_path:
+        return []
+    return [instance for instance in load_instances(settings.instances_path) if instance.enabled]
@@ -35,11 +35,23 @@ class Settings(BaseSettings):
         default="https://api.airbyte.com/v1"
     )
     airbyte_workspace_id: Optional[str] = Field(None)
+    airbyte_catalog_ttl_seconds: float = Field(default=300.0, gt=0)
     
     # Databricks Configuration
     databricks_api_key: str = Field(...)
     databricks_base_url: str = Field(...)  # e.g., https://your-workspace.cloud.databricks.com
     databricks_workspace_id: Optional[str] = Field(None)
+    databricks_incremental: bool = Field(default=True)
+    databricks_run_watermark_path: str = Field(default="monitoring_state/databricks_run_watermark.json")
+    databricks_max_lookback_hours: float = Field(default=24.0, gt=0)
+    databricks_enrich_failures: bool = Field(default=True)
+    databricks_enrichment_concurrency: int = Field(default=4, ge=1)
+    databricks_run_detail_cache_path: str = Field(default="monitoring_state/databricks_run_details.json")
+    databricks_expand_tasks: bool = Field(default=True)
+    databricks_max_task_expansions: int = Field(default=50, ge=0)
+    databricks_cluster_state_path: str = Field(default="monitoring_state/databricks_clusters.json")
+    databricks_cluster_events: bool = Field(default=True)
+    databricks_cluster_events_per_cluster: int = Field(default=20, ge=1)
     
     # Power Automate Configuration
     power_automate_client_id: str = Field(...)
@@ -57,6 +69,13 @@ class Settings(BaseSettings):
     snowflake_schema: str = Field(default="AUDIT_JOB_HUB")
     snowflake_warehouse: str = Field(default="COMPUTE_WH")
     snowflake_role: Optional[str] = Field(None)
+    snowflake_task_incremental: bool = Field(default=True)
+    snowflake_task_watermark_path: str = Field(default="monitoring_state/snowflake_task_watermark.json")
+    snowflake_task_result_limit: int = Field(default=1000, ge=1, le=10000)
+    snowflake_task_scopes: str = Field(default="")
+    snowflake_task_max_sessions: int = Field(default=4, ge=1)
+    snowflake_task_catalog_path: str = Field(default="monitoring_state/snowflake_task_catalog.json")
+    snowflake_task_catalog_refresh_minutes: int = Field(default=0, ge=0)
     
     # Email Configuration (Outlook/Microsoft Graph)
     outlook_client_id: str = Field(...)
@@ -73,7 +92,39 @@ class Settings(BaseSettings):
     health_check_timeout_seconds: int = Field(default=30)
     max_retries: int = Field(default=3)
     retry_delay_seconds: int = Field(default=5)
+
+    # Circuit Breaker Configuration
+    circuit_breaker_failure_threshold: int = Field(default=5, ge=1)
+    circuit_breaker_recovery_seconds: float = Field(default=60.0, gt=0)
+    
+    # Cycle Deadline Configuration
+    monitoring_cycle_timeout_seconds: int = Field(default=600, ge=30)
+    monitoring_finalize_reserve_seconds: int = Field(default=60, ge=5)
+    
+    # Request Coalescing Configuration
+    request_memo_ttl_seconds: float = Field(default=30.0, ge=0)
+    
+    # Duration Anomaly Detection Configuration
+    duration_baseline_path: str = Field(default="monitoring_state/duration_baselines.json")
+    duration_ewma_alpha: float = Field(default=0.1, gt=0, le=1)
+    duration_anomaly_sigmas: float = Field(default=3.0, gt=0)
+    duration_anomaly_min_samples: int = Field(default=5, ge=1)
     
+    # Error Fingerprinting Configuration
+    error_fingerprint_path: str = Field(default="monitoring_state/error_fingerprints.json")
+    
+    # Local History Configuration
+    local_history_enabled: bool = Field(default=True)
+    local_history_path: str = Field(default="monitoring_state/history.sqlite3")
+    local_history_retention_days: int = Field(default=30, ge=1)
+    
+    # Pipeline Dependency Configuration
+    pipeline_graph_path: str = Field(default="")
+    
+    # Multi-Instance Configuration
+    instances_path: str = Field(default="")
+    instance_collection_concurrency: int = Field(default=4, ge=1)
+
     @field_validator("llm_api_key", "databricks_api_key")
     @classmethod
     def validate_required_api_keys(cls, v):
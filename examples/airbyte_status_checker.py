@@ -10,8 +10,9 @@ import asyncio
 import json
 import os
 import sys
+import time
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Any
 import logging
 
 import httpx
@@ -29,7 +30,13 @@ from mcp.types import (
     EmbeddedResource,
     LoggingLevel
 )
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.platform_models import AirbyteConnectionResponse
+from tools.connection_catalog import ConnectionCatalog
 
 # Configure logging to avoid stdout interference
 logging.basicConfig(
@@ -52,6 +59,12 @@ class AirbyteConfig:
         self.client_secret = os.getenv("AIRBYTE_CLIENT_SECRET")
         self.auth_token = os.getenv("AIRBYTE_AUTH_TOKEN")
         self.token_expiry = None
+        self.catalog_ttl_seconds = float(os.getenv("AIRBYTE_CATALOG_TTL_SECONDS", "300"))
+        self.sweep_concurrency = int(os.getenv("AIRBYTE_SWEEP_CONCURRENCY", "16"))
+        self.sweep_connection_timeout = float(os.getenv("AIRBYTE_SWEEP_CONNECTION_TIMEOUT_SECONDS", "10"))
+        self.health_cache_ttl_seconds = float(os.getenv("AIRBYTE_HEALTH_CACHE_TTL_SECONDS", "60"))
+        self.bulk_trigger_concurrency = int(os.getenv("AIRBYTE_BULK_TRIGGER_CONCURRENCY", "4"))
+        self.bulk_trigger_rate_per_second = float(os.getenv("AIRBYTE_BULK_TRIGGER_RATE_PER_SECOND", "2"))
         
         if not all([self.workspace_id, self.client_id, self.client_secret, self.auth_token]):
             raise ValueError(f"Missing required Airbyte configuration. Check your .env file. workspace-{self.workspace_id}-{self.client_id}-{self.client_secret}")
@@ -77,6 +90,10 @@ class ConnectionJobStatus(BaseModel):
 class ConnectionNameInput(BaseModel):
     connection_name: str = Field(description="Name of the connection to operate on")
 
+class BulkTriggerInput(BaseModel):
+    connections: List[str] = Field(description="Names or IDs of the connections to sync")
+    skip_running: bool = Field(default=True, description="Skip connections that already have a running job")
+
 class JobIdInput(BaseModel):
     job_id: int = Field(description="Unique identifier of the job to retrieve details for")
 
@@ -86,12 +103,18 @@ class EmptyInput(BaseModel):
 # Global configuration instance
 config = AirbyteConfig()
 
+class WorkspaceConnection(AirbyteConnectionResponse):
+    """Catalog entry for a connection, keeping the full API payload for tool output"""
+    payload: Dict[str, Any] = Field(default_factory=dict, exclude=True)
+
 class AirbyteAPI:
     """Airbyte API client with token refresh capability"""
     
     def __init__(self, config: AirbyteConfig):
         self.config = config
         self.client = httpx.AsyncClient(timeout=30.0)
+        self.catalog = ConnectionCatalog(self.get_catalog_connections, config.catalog_ttl_seconds)
+        self._token_lock = asyncio.Lock()
 
     async def _refresh_token(self) -> str:
         """Refresh the authentication token"""
@@ -117,7 +140,10 @@ class AirbyteAPI:
     async def _get_headers(self) -> Dict[str, str]:
         """Get authorization headers with token refresh if needed"""
         if not self.config.auth_token or (self.config.token_expiry is None) or (datetime.now() >= self.config.token_expiry):
-            self.config.auth_token = await self._refresh_token()
+            # Concurrent requests share one refresh instead of each fetching a token
+            async with self._token_lock:
+                if not self.config.auth_token or (self.config.token_expiry is None) or (datetime.now() >= self.config.token_expiry):
+                    self.config.auth_token = await self._refresh_token()
         
         return {
             "Authorization": f"Bearer {self.config.auth_token}",
@@ -136,6 +162,8 @@ class AirbyteAPI:
             response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                self._invalidate_missing_connection(endpoint, kwargs.get("params"))
             if e.response.status_code == 401:
                 # Token might be expired, you can implement refresh logic here
                 logger.error("Authentication failed. Token may be expired.")
@@ -155,13 +183,55 @@ class AirbyteAPI:
         response = await self._make_request("GET", "connections", params=params)
         return response.get("data", [])
     
+    async def get_all_connections(self) -> List[Dict[str, Any]]:
+        """Get every connection in the workspace, following pagination"""
+        connections = []
+        offset = 0
+        while True:
+            params = {
+                "limit": 100,
+                "offset": offset
+            }
+            response = await self._make_request("GET", "connections", params=params)
+            page = response.get("data", [])
+            connections.extend(page)
+            if len(page) < 100:
+                return connections
+            offset += 100
+    
+    async def get_catalog_connections(self) -> List[WorkspaceConnection]:
+        """Load every connection as a catalog entry, skipping ones without ids"""
+        entries = []
+        for conn in await self.get_all_connections():
+            try:
+                entries.append(WorkspaceConnection(
+                    connectionId=conn.get("connectionId"),
+                    name=conn.get("name"),
+                    sourceId=conn.get("sourceId") or conn.get("source", {}).get("sourceId"),
+                    destinationId=conn.get("destinationId") or conn.get("destination", {}).get("destinationId"),
+                    status=conn.get("status"),
+                    payload=conn,
+                ))
+            except ValidationError as e:
+                logger.warning(f"Skipping connection {conn.get('connectionId')} in catalog: {str(e)}")
+        return entries
+    
     async def get_connection_by_name(self, connection_name: str) -> Optional[Dict[str, Any]]:
-        """Get connection details by name"""
-        connections = await self.get_connections(self.config.workspace_id)
-        for conn in connections:
-            if conn.get("name") == connection_name:
-                return conn
-        return None
+        """Get connection details by name from the connection catalog"""
+        connection = await self.catalog.get_by_name(connection_name)
+        return connection.payload if connection else None
+    
+    async def get_catalog_payloads(self) -> List[Dict[str, Any]]:
+        """Get the API payload of every connection in the catalog"""
+        return [connection.payload for connection in await self.catalog.all()]
+    
+    def _invalidate_missing_connection(self, endpoint: str, params: Optional[Dict[str, Any]]) -> None:
+        """Drop a connection that returned 404 from the connection catalog"""
+        parts = endpoint.strip("/").split("/")
+        if len(parts) >= 2 and parts[0] == "connections":
+            self.catalog.invalidate(parts[1])
+        elif params and params.get("connectionId"):
+            self.catalog.invalidate(params["connectionId"])
     
     async def get_jobs(self, connection_id: str, limit: int = 100) -> List[Dict[str, Any]]:
         """Get jobs for a specific connection"""
@@ -267,6 +337,26 @@ async def handle_list_tools() -> list[Tool]:
                 "required": ["connection_name"]
             }
         ),
+        Tool(
+            name="trigger_bulk_sync",
+            description="Trigger syncs for many connections at once, skipping connections that are already running",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "connections": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Names or IDs of the connections to sync"
+                    },
+                    "skip_running": {
+                        "type": "boolean",
+                        "description": "Skip connections that already have a running job",
+                        "default": True
+                    }
+                },
+                "required": ["connections"]
+            }
+        ),
         # Tool(
         #     name="list_all_streams",
         #     description="List all streams across all connections in the workspace",
@@ -353,6 +443,11 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
             result = await check_connection_status(arguments["connection_name"])
         elif name == "trigger_sync":
             result = await trigger_sync(arguments["connection_name"])
+        elif name == "trigger_bulk_sync":
+            result = await trigger_bulk_sync(
+                arguments["connections"],
+                arguments.get("skip_running", True)
+            )
         # elif name == "list_all_streams":
         #     result = await list_all_streams()
         elif name == "check_jobs_health":
@@ -374,7 +469,7 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
 async def list_all_connections() -> str:
     """List all connections in the workspace with their basic information"""
     try:
-        connections = await api_client.get_connections(config.workspace_id)
+        connections = await api_client.get_catalog_payloads()
         
         if not connections:
             return "No connections found in the workspace."
@@ -496,48 +591,234 @@ async def trigger_sync(connection_name: str) -> str:
     except Exception as e:
         return f"Error triggering sync: {str(e)}"
 
-async def check_jobs_health() -> str:
-    """Check the health status of recent jobs across all connections"""
+# Job statuses that mean a sync is already in progress
+RUNNING_JOB_STATUSES = {"pending", "running", "incomplete"}
+
+class RateLimiter:
+    """Spaces out calls to at most `rate_per_second`, shared by concurrent workers"""
+    
+    def __init__(self, rate_per_second: float):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self.next_allowed = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            wait = self.next_allowed - now
+            self.next_allowed = max(now, self.next_allowed) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+async def resolve_connection(name_or_id: str) -> Optional[Dict[str, Any]]:
+    """Find a connection in the catalog by name, falling back to id"""
+    connection = await api_client.catalog.get_by_name(name_or_id) or await api_client.catalog.get_by_id(name_or_id)
+    return connection.payload if connection else None
+
+async def trigger_bulk_sync(connection_refs: List[str], skip_running: bool = True) -> str:
+    """Trigger syncs for many connections through a rate-limited concurrent queue"""
     try:
-        connections = await api_client.get_connections(config.workspace_id)
+        results: List[Dict[str, Any]] = []
+        connections: Dict[str, Dict[str, Any]] = {}
+        
+        # Resolve and dedupe: a connection named twice (or by name and id) is triggered once
+        for ref in connection_refs:
+            connection = await resolve_connection(ref)
+            if connection is None:
+                results.append({"connection": ref, "status": "not_found"})
+            else:
+                connections.setdefault(connection.get("connectionId"), connection)
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        for connection in connections.values():
+            queue.put_nowait(connection)
+        
+        limiter = RateLimiter(config.bulk_trigger_rate_per_second)
+        report_progress = progress_reporter()
+        total = len(connections)
+        progress_total = len(results) + total
+        
+        async def trigger_one(connection: Dict[str, Any]) -> Dict[str, Any]:
+            connection_id = connection.get("connectionId")
+            entry = {"connection": connection.get("name"), "connection_id": connection_id}
+            try:
+                if skip_running:
+                    jobs = await api_client.get_jobs(connection_id, limit=1)
+                    if jobs and jobs[0].get("status") in RUNNING_JOB_STATUSES:
+                        entry.update(status="skipped_running", job_id=jobs[0].get("jobId"))
+                        return entry
+                
+                await limiter.acquire()
+                result = await api_client.trigger_sync(connection_id)
+                entry.update(status="triggered", job_id=result.get("jobId"))
+            except Exception as e:
+                logger.error(f"Failed to trigger sync for {connection.get('name')}: {str(e)}")
+                entry.update(status="failed", error=str(e))
+            return entry
+        
+        async def worker() -> None:
+            while True:
+                try:
+                    connection = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                results.append(await trigger_one(connection))
+                if report_progress:
+                    await report_progress(len(results), progress_total)
+        
+        workers = max(1, min(config.bulk_trigger_concurrency, total))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        
+        summary: Dict[str, int] = {}
+        for entry in results:
+            summary[entry["status"]] = summary.get(entry["status"], 0) + 1
         
-        if not connections:
-            return "No connections found in the workspace."
+        response = {
+            "requested": len(connection_refs),
+            "unique_connections": total,
+            "summary": summary,
+            "job_ids": {
+                entry["connection"]: entry.get("job_id")
+                for entry in results
+                if entry["status"] in ("triggered", "skipped_running")
+            },
+            "results": results
+        }
         
-        health_report = []
-        for conn in connections:
-            connection_name = conn.get("name")
-            connection_id = conn.get("connectionId")
-            
+        return json.dumps(response, indent=2)
+    except Exception as e:
+        return f"Error triggering bulk sync: {str(e)}"
+
+class HealthSweepCache:
+    """Short-lived cache of the last jobs health sweep, shared by concurrent tool calls"""
+    
+    def __init__(self, ttl_seconds: float = 60.0):
+        self.ttl_seconds = ttl_seconds
+        self.report: Optional[List[Dict[str, Any]]] = None
+        self.completed_at: Optional[float] = None
+        self.sweep: Optional[asyncio.Future] = None
+    
+    def get(self) -> Optional[List[Dict[str, Any]]]:
+        """Get the cached report if it is still fresh"""
+        if self.completed_at is None or time.monotonic() - self.completed_at >= self.ttl_seconds:
+            return None
+        return self.report
+    
+    def store(self, report: List[Dict[str, Any]]) -> None:
+        self.report = report
+        self.completed_at = time.monotonic()
+
+health_cache = HealthSweepCache(config.health_cache_ttl_seconds)
+
+async def connection_job_health(conn: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize the recent jobs of a single connection"""
+    connection_name = conn.get("name")
+    connection_id = conn.get("connectionId")
+    jobs = await api_client.get_jobs(connection_id, limit=5)
+    
+    if jobs:
+        latest_job = jobs[0]
+        return {
+            "connection_name": connection_name,
+            "connection_id": connection_id,
+            "latest_job_status": latest_job.get("status"),
+            "latest_job_time": latest_job.get("startTime"),
+            "recent_jobs_count": len(jobs),
+            "failed_jobs": len([j for j in jobs if j.get("status") == "failed"]),
+            "success_rate": f"{(len([j for j in jobs if j.get('status') == 'succeeded']) / len(jobs) * 100):.1f}%"
+        }
+    
+    return {
+        "connection_name": connection_name,
+        "connection_id": connection_id,
+        "latest_job_status": "no_jobs",
+        "latest_job_time": None,
+        "recent_jobs_count": 0,
+        "failed_jobs": 0,
+        "success_rate": "N/A"
+    }
+
+async def sweep_jobs_health(connections: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+    """Check connections concurrently, yielding each result as soon as it completes"""
+    semaphore = asyncio.Semaphore(config.sweep_concurrency)
+    
+    async def check(conn: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
             try:
-                jobs = await api_client.get_jobs(connection_id, limit=5)
-                
-                if jobs:
-                    latest_job = jobs[0]
-                    job_health = {
-                        "connection_name": connection_name,
-                        "connection_id": connection_id,
-                        "latest_job_status": latest_job.get("status"),
-                        "latest_job_time": latest_job.get("startTime"),
-                        "recent_jobs_count": len(jobs),
-                        "failed_jobs": len([j for j in jobs if j.get("status") == "failed"]),
-                        "success_rate": f"{(len([j for j in jobs if j.get('status') == 'succeeded']) / len(jobs) * 100):.1f}%"
-                    }
-                else:
-                    job_health = {
-                        "connection_name": connection_name,
-                        "connection_id": connection_id,
-                        "latest_job_status": "no_jobs",
-                        "latest_job_time": None,
-                        "recent_jobs_count": 0,
-                        "failed_jobs": 0,
-                        "success_rate": "N/A"
-                    }
-                
-                health_report.append(job_health)
+                return await asyncio.wait_for(
+                    connection_job_health(conn),
+                    timeout=config.sweep_connection_timeout
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"Timed out checking jobs for connection {conn.get('name')}")
+                error = f"Timed out after {config.sweep_connection_timeout}s"
             except Exception as e:
-                logger.error(f"Error checking jobs for connection {connection_name}: {str(e)}")
-                continue
+                logger.error(f"Error checking jobs for connection {conn.get('name')}: {str(e)}")
+                error = str(e)
+            return {
+                "connection_name": conn.get("name"),
+                "connection_id": conn.get("connectionId"),
+                "latest_job_status": "unknown",
+                "error": error
+            }
+    
+    tasks = [asyncio.ensure_future(check(conn)) for conn in connections]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+def progress_reporter() -> Optional[Callable[[int, int], Awaitable[None]]]:
+    """Get a callback sending MCP progress notifications for the current tool call, if requested"""
+    try:
+        ctx = server.request_context
+    except LookupError:
+        return None
+    
+    progress_token = ctx.meta.progressToken if ctx.meta else None
+    if progress_token is None:
+        return None
+    
+    async def report(done: int, total: int) -> None:
+        try:
+            await ctx.session.send_progress_notification(progress_token, done, total)
+        except Exception as e:
+            logger.debug(f"Failed to send progress notification: {str(e)}")
+    
+    return report
+
+async def run_health_sweep(report_progress: Optional[Callable[[int, int], Awaitable[None]]]) -> List[Dict[str, Any]]:
+    """Run a full sweep, streaming progress as connections complete, and cache the report"""
+    connections = await api_client.get_catalog_payloads()
+    total = len(connections)
+    started = time.monotonic()
+    
+    health_report = []
+    async for job_health in sweep_jobs_health(connections):
+        health_report.append(job_health)
+        if report_progress:
+            await report_progress(len(health_report), total)
+    
+    health_report.sort(key=lambda h: h.get("connection_name") or "")
+    health_cache.store(health_report)
+    logger.info(f"Checked {total} connections in {time.monotonic() - started:.1f}s")
+    return health_report
+
+async def check_jobs_health() -> str:
+    """Check the health status of recent jobs across all connections"""
+    try:
+        health_report = health_cache.get()
+        
+        if health_report is None:
+            # Callers arriving during a sweep wait for it instead of starting another
+            if health_cache.sweep is None or health_cache.sweep.done():
+                health_cache.sweep = asyncio.ensure_future(run_health_sweep(progress_reporter()))
+            health_report = await asyncio.shield(health_cache.sweep)
+        
+        if not health_report:
+            return "No connections found in the workspace."
         
         return json.dumps(health_report, indent=2)
     except Exception as e:
@@ -10,14 +10,30 @@ import os
 import logging
 from datetime import datetime, timezone
 from uuid import uuid4
-import json
 
 # Add current directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from agents.orchestrator_agent import orchestrator_agent
+from agents.email_agent import build_monitoring_notification
 from agents.dependencies import OrchestratorDependencies
 from config.settings import settings
+from analytics.dependency_graph import get_pipeline_graph
+from analytics.duration_anomaly import DurationAnomalyDetector
+from analytics.error_fingerprints import ErrorFingerprintStore
+from models.job_status import PlatformType, MonitoringResult
+from models.serialization import dump_file
+from models.status_mapping import reset_unmapped_status_counts
+from tools.deadline import Deadline, deadline_scope
+from tools.monitoring_cycle import (
+    MonitoringCycle,
+    cycle_scope,
+    STORAGE_STEP,
+    NOTIFICATION_STEP,
+)
+from tools.snowflake_db_api import store_job_status_records, store_monitoring_result
+from tools.local_history import LocalHistoryError, record_local_cycle
+from tools.outlook_api import send_notification_email
 
 # Configure logging
 logging.basicConfig(
@@ -70,11 +86,23 @@ async def run_full_monitoring_cycle(
             from_email=from_email
         )
         
+        # Configured workspaces/tenants/accounts are collected by one tool call
+        expected_platforms = [PlatformType.AIRBYTE]
+        instance_step = ""
+        if orchestrator_deps.instances:
+            for instance in orchestrator_deps.instances:
+                if instance.platform not in expected_platforms:
+                    expected_platforms.append(instance.platform)
+            instance_step = (
+                f"\n        1b. Monitor the {len(orchestrator_deps.instances)} configured platform instances "
+                f"with monitor_platform_instances"
+            )
+        
         # Run comprehensive monitoring workflow
         monitoring_prompt = f"""
         Execute a complete data pipeline monitoring cycle:
 
-        1. Monitor Airbyte platform - check all sync jobs and connections
+        1. Monitor Airbyte platform - check all sync jobs and connections{instance_step}
         2. Assess overall system health across all monitored platforms
         3. Store monitoring results in Snowflake database
         4. Send health notifications if issues are detected
@@ -93,12 +121,46 @@ async def run_full_monitoring_cycle(
         Focus on identifying actionable issues and ensuring all results are properly stored for compliance.
         """
         
-        # Execute monitoring with the orchestrator agent
-        result = await orchestrator_agent.run(
-            monitoring_prompt,
-            deps=orchestrator_deps
+        # The whole cycle shares one deadline; collection stops early enough
+        # to leave the finalize reserve for storage and notification
+        cycle = MonitoringCycle(
+            monitoring_id=monitoring_id,
+            deadline=Deadline(settings.monitoring_cycle_timeout_seconds),
+            expected_platforms=expected_platforms,
+            finalize_reserve_seconds=settings.monitoring_finalize_reserve_seconds,
+            request_memo_ttl=settings.request_memo_ttl_seconds,
+            duration_detector=_load_duration_detector(),
+            error_fingerprints=ErrorFingerprintStore.load(settings.error_fingerprint_path),
+            pipeline_graph=get_pipeline_graph(settings.pipeline_graph_path),
         )
         
+        # Count status mapping drift per cycle
+        reset_unmapped_status_counts()
+        
+        # Execute monitoring with the orchestrator agent
+        try:
+            with cycle_scope(cycle):
+                result = await asyncio.wait_for(
+                    orchestrator_agent.run(
+                        monitoring_prompt,
+                        deps=orchestrator_deps
+                    ),
+                    timeout=cycle.collection_deadline.remaining()
+                )
+        except asyncio.TimeoutError:
+            logger.warning(f"Monitoring cycle {monitoring_id} hit its deadline, finalizing partial results")
+            return await finalize_partial_cycle(
+                cycle,
+                orchestrator_deps,
+                notification_emails,
+                from_email
+            )
+        finally:
+            await _save_cycle_state(cycle)
+        
+        logger.info(f"Cycle request stats for {monitoring_id}: {cycle.request_coalescer.stats()}")
+        _log_unmapped_statuses(monitoring_id)
+        
         # Extract results
         monitoring_data = result.data if hasattr(result, 'data') else str(result)
         
@@ -109,6 +171,10 @@ async def run_full_monitoring_cycle(
             "monitoring_id": monitoring_id,
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "monitoring_data": monitoring_data,
+            "duration_anomalies": [a.model_dump(mode="json") for a in cycle.duration_anomalies],
+            "top_errors": _top_errors(cycle),
+            "pipeline_incidents": _pipeline_incidents(cycle),
+            "task_definition_changes": _definition_changes(cycle),
             "notification_recipients": notification_emails,
             "from_email": from_email
         }
@@ -125,6 +191,170 @@ async def run_full_monitoring_cycle(
         }
 
 
+async def finalize_partial_cycle(
+    cycle: MonitoringCycle,
+    orchestrator_deps: OrchestratorDependencies,
+    notification_emails: list,
+    from_email: str
+) -> dict:
+    """
+    Store and report whatever a timed-out monitoring cycle collected.
+    
+    Runs under the full cycle deadline, i.e. inside the finalize reserve, and
+    skips storage or notification if the orchestrator already finished them.
+    
+    Args:
+        cycle: Monitoring cycle that hit its collection deadline
+        orchestrator_deps: Orchestrator dependencies with storage and email credentials
+        notification_emails: List of email addresses for notifications
+        from_email: Email address to send notifications from
+        
+    Returns:
+        Dictionary with the partial monitoring results
+    """
+    monitoring_result = cycle.build_monitoring_result()
+    
+    with deadline_scope(cycle.deadline):
+        if STORAGE_STEP not in cycle.completed_steps:
+            try:
+                if monitoring_result.job_records:
+                    await store_job_status_records(
+                        records=monitoring_result.job_records,
+                        account=orchestrator_deps.snowflake_account,
+                        user=orchestrator_deps.snowflake_user,
+                        password=orchestrator_deps.snowflake_password,
+                        database=orchestrator_deps.snowflake_database,
+                        schema=orchestrator_deps.snowflake_schema,
+                        warehouse=orchestrator_deps.snowflake_warehouse,
+                        role=orchestrator_deps.snowflake_role,
+                    )
+                await store_monitoring_result(
+                    monitoring_result=monitoring_result,
+                    account=orchestrator_deps.snowflake_account,
+                    user=orchestrator_deps.snowflake_user,
+                    password=orchestrator_deps.snowflake_password,
+                    database=orchestrator_deps.snowflake_database,
+                    schema=orchestrator_deps.snowflake_schema,
+                    warehouse=orchestrator_deps.snowflake_warehouse,
+                    role=orchestrator_deps.snowflake_role,
+                )
+                cycle.mark_step_complete(STORAGE_STEP)
+            except Exception as e:
+                logger.error(f"Failed to store partial monitoring results: {e}")
+                monitoring_result.errors.append(f"Storage failed: {e}")
+        
+        if NOTIFICATION_STEP not in cycle.completed_steps:
+            try:
+                notification, _ = build_monitoring_notification(
+                    _notification_context(monitoring_result),
+                    notification_emails
+                )
+                await send_notification_email(
+                    notification=notification,
+                    client_id=orchestrator_deps.outlook_client_id,
+                    client_secret=orchestrator_deps.outlook_client_secret,
+                    tenant_id=orchestrator_deps.outlook_tenant_id,
+                    from_email=from_email,
+                )
+                cycle.mark_step_complete(NOTIFICATION_STEP)
+            except Exception as e:
+                logger.error(f"Failed to send partial monitoring notification: {e}")
+                monitoring_result.errors.append(f"Notification failed: {e}")
+    
+    logger.info(f"Monitoring cycle finalized with partial results: {cycle.monitoring_id}")
+    
+    return {
+        "success": True,
+        "partial": True,
+        "monitoring_id": cycle.monitoring_id,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "monitoring_data": monitoring_result.dict(),
+        "errors": monitoring_result.errors,
+        "completed_steps": sorted(cycle.completed_steps),
+        "request_stats": cycle.request_coalescer.stats(),
+        "unmapped_statuses": _log_unmapped_statuses(cycle.monitoring_id),
+        "duration_anomalies": [a.model_dump(mode="json") for a in cycle.duration_anomalies],
+        "top_errors": _top_errors(cycle),
+        "pipeline_incidents": _pipeline_incidents(cycle),
+        "task_definition_changes": _definition_changes(cycle),
+        "notification_recipients": notification_emails,
+        "from_email": from_email
+    }
+
+
+def _load_duration_detector() -> DurationAnomalyDetector:
+    """Load per-job duration baselines saved by earlier cycles."""
+    return DurationAnomalyDetector.load(
+        settings.duration_baseline_path,
+        alpha=settings.duration_ewma_alpha,
+        threshold_sigmas=settings.duration_anomaly_sigmas,
+        min_samples=settings.duration_anomaly_min_samples,
+    )
+
+
+async def _save_cycle_state(cycle: MonitoringCycle) -> None:
+    """Persist duration baselines, error signatures and local history; a failed save only loses this cycle's state."""
+    state = [
+        (cycle.duration_detector, settings.duration_baseline_path),
+        (cycle.error_fingerprints, settings.error_fingerprint_path),
+    ]
+    for store, path in state:
+        if store is None:
+            continue
+        try:
+            store.save(path)
+        except OSError as e:
+            logger.warning(f"Failed to save monitoring state to {path}: {e}")
+    
+    if settings.local_history_enabled:
+        try:
+            await record_local_cycle(cycle.monitoring_id, cycle.started_at, cycle.all_records(), cycle.errors)
+        except LocalHistoryError as e:
+            logger.warning(f"Failed to write local history: {e}")
+
+
+def _top_errors(cycle: MonitoringCycle, limit: int = 10) -> list:
+    """Most frequent error signatures across cycles."""
+    if cycle.error_fingerprints is None:
+        return []
+    return [c.model_dump() for c in cycle.error_fingerprints.ranked(limit)]
+
+
+def _pipeline_incidents(cycle: MonitoringCycle) -> dict:
+    """Correlated failures and stale jobs from the pipeline graph."""
+    analysis = cycle.analyze_dependencies()
+    return analysis.model_dump() if analysis is not None else {}
+
+
+def _definition_changes(cycle: MonitoringCycle) -> list:
+    """Snowflake task definitions created, modified or removed during the cycle."""
+    return [change.model_dump(mode="json") for change in cycle.definition_changes]
+
+
+def _log_unmapped_statuses(monitoring_id: str) -> dict:
+    """Log and return platform statuses that were reported as unknown during the cycle."""
+    unmapped = {
+        f"{platform}:{raw_status}": count
+        for (platform, raw_status), count in reset_unmapped_status_counts().items()
+    }
+    if unmapped:
+        logger.warning(f"Unmapped job statuses in {monitoring_id}: {unmapped}")
+    return unmapped
+
+
+def _notification_context(monitoring_result: MonitoringResult) -> dict:
+    """Build the email agent's monitoring context from a MonitoringResult."""
+    assessment = monitoring_result.overall_assessment
+    return {
+        "monitoring_id": monitoring_result.monitoring_id,
+        "failed_jobs_count": assessment.failed_jobs_count if assessment else 0,
+        "total_jobs_count": monitoring_result.total_jobs_monitored,
+        "risk_level": assessment.risk_level.value if assessment else "LOW",
+        "platform_summaries": [s.dict() for s in monitoring_result.platform_summaries],
+        "recommendations": assessment.recommendations if assessment else [],
+    }
+
+
 async def run_health_check() -> dict:
     """
     Run a quick health check across all platforms.
@@ -180,6 +410,8 @@ def print_summary(results: dict):
     print(f"Success: {'✅' if results.get('success') else '❌'}")
     
     if results.get('success'):
+        if results.get('partial'):
+            print(f"Partial results: {len(results.get('errors', []))} issue(s)")
         print(f"Recipients: {len(results.get('notification_recipients', []))}")
         print(f"From Email: {results.get('from_email', 'N/A')}")
         
@@ -246,8 +478,7 @@ async def main():
         
         # Save to file if requested
         if args.output_file:
-            with open(args.output_file, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            dump_file(results, args.output_file)
             print(f"Results saved to: {args.output_file}")
         
         # Exit with appropriate code
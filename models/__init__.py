@@ -11,6 +11,23 @@ from .job_status import (
     MonitoringResult,
 )
 
+from .job_batch import JobStatusBatch
+
+from .platform_instances import PlatformInstance
+
+from .serialization import JSONSerializer, get_serializer, set_json_backend
+
+from .state_file import PersistentState, StateRegistry, load_state, save_state
+
+from .timestamps import (
+    utc_now,
+    ensure_utc,
+    parse_timestamp,
+    try_parse_timestamp,
+    parse_timestamps,
+    duration_seconds,
+)
+
 from .notification_models import (
     EmailRecipient,
     EmailTemplate,
@@ -21,19 +38,30 @@ from .notification_models import (
     DEFAULT_EMAIL_TEMPLATES,
 )
 
+from .status_mapping import (
+    map_airbyte_status,
+    map_databricks_status,
+    map_powerautomate_status,
+    map_snowflake_task_status,
+    map_statuses,
+    unmapped_status_counts,
+    reset_unmapped_status_counts,
+)
+
 from .platform_models import (
     AirbyteJobResponse,
     AirbyteJobsListResponse,
     DatabricksJobRun,
+    DatabricksRunOutput,
     DatabricksJobRunsResponse,
     PowerAutomateFlowRun,
     PowerAutomateFlowRunsResponse,
     SnowflakeTaskHistory,
+    SnowflakeTaskDefinitionChange,
     APIErrorResponse,
-    map_airbyte_status,
-    map_databricks_status,
-    map_powerautomate_status,
-    map_snowflake_task_status,
+    get_type_adapter,
+    parse_response,
+    parse_rows,
 )
 
 __all__ = [
@@ -46,6 +74,7 @@ __all__ = [
     "HealthAssessment",
     "PlatformHealthSummary",
     "MonitoringResult",
+    "JobStatusBatch",
     
     # Notification models
     "EmailRecipient",
@@ -60,10 +89,12 @@ __all__ = [
     "AirbyteJobResponse",
     "AirbyteJobsListResponse",
     "DatabricksJobRun",
+    "DatabricksRunOutput",
     "DatabricksJobRunsResponse",
     "PowerAutomateFlowRun",
     "PowerAutomateFlowRunsResponse",
     "SnowflakeTaskHistory",
+    "SnowflakeTaskDefinitionChange",
     "APIErrorResponse",
     
     # Status mapping utilities
@@ -71,4 +102,34 @@ __all__ = [
     "map_databricks_status",
     "map_powerautomate_status",
     "map_snowflake_task_status",
+    "map_statuses",
+    "unmapped_status_counts",
+    "reset_unmapped_status_counts",
+    
+    # Platform instances
+    "PlatformInstance",
+    
+    # Serialization
+    "JSONSerializer",
+    "get_serializer",
+    "set_json_backend",
+    
+    # State files
+    "PersistentState",
+    "StateRegistry",
+    "load_state",
+    "save_state",
+    
+    # Timestamp utilities
+    "utc_now",
+    "ensure_utc",
+    "parse_timestamp",
+    "try_parse_timestamp",
+    "parse_timestamps",
+    "duration_seconds",
+    
+    # Response parsing
+    "get_type_adapter",
+    "parse_response",
+    "parse_rows",
 ]
\ No newline at end of file
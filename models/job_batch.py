@@ -0,0 +1,347 @@
+"""
+Columnar batch representation of job status records.
+
+A monitoring cycle can produce tens of thousands of job records. Holding each
+one as a JobStatusRecord (plus its dict and row copies) is expensive, so
+JobStatusBatch stores the same data as parallel columns: compact arrays for
+codes, epoch timestamps and durations, and sparse side tables for the rarely
+populated error messages and metadata.
+"""
+
+import logging
+import math
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .job_status import JobStatus, PlatformType, JobStatusRecord
+from .serialization import dumps, loads
+from .timestamps import parse_timestamp, utc_now
+
+logger = logging.getLogger(__name__)
+
+# Enum <-> small integer codes; order is part of the in-memory format only
+PLATFORM_CODES: Tuple[PlatformType, ...] = tuple(PlatformType)
+STATUS_CODES: Tuple[JobStatus, ...] = tuple(JobStatus)
+_PLATFORM_INDEX = {platform: i for i, platform in enumerate(PLATFORM_CODES)}
+_STATUS_INDEX = {status: i for i, status in enumerate(STATUS_CODES)}
+
+# Sentinels for missing values in the numeric columns
+NO_DURATION = -1
+NO_TIMESTAMP = math.nan
+
+
+def _to_epoch(value: Optional[datetime]) -> float:
+    """Convert a datetime to epoch seconds; naive values are taken as UTC."""
+    if value is None:
+        return NO_TIMESTAMP
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _from_epoch(value: float) -> Optional[datetime]:
+    """Convert epoch seconds back to an aware UTC datetime."""
+    if math.isnan(value):
+        return None
+    return datetime.fromtimestamp(value, tz=timezone.utc)
+
+
+class JobStatusBatch:
+    """Column-oriented collection of job status records."""
+
+    def __init__(self):
+        """Initialize an empty batch."""
+        self.job_ids: List[str] = []
+        self.job_names: List[str] = []
+        self.platform_codes = array('B')
+        self.status_codes = array('B')
+        self.last_run_epochs = array('d')
+        self.duration_seconds = array('q')
+        self.checked_at_epochs = array('d')
+        # Sparse side tables keyed by row index
+        self.error_messages: Dict[int, str] = {}
+        self.metadata: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def append(
+        self,
+        job_id: str,
+        platform: PlatformType,
+        job_name: str,
+        status: JobStatus,
+        last_run_time: Optional[datetime] = None,
+        duration_seconds: Optional[int] = None,
+        error_message: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        checked_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Append one record's values.
+
+        Values are checked as JobStatusRecord would check them, since rows
+        are later materialized without validation: job_id and job_name must
+        be strings and the duration an integer (numeric strings are coerced).
+
+        Raises:
+            ValueError: If platform or status is not a known enum value, or the duration is invalid or negative
+            TypeError: If job_id or job_name is not a string
+        """
+        if not isinstance(job_id, str) or not isinstance(job_name, str):
+            raise TypeError(f"job_id and job_name must be strings, got {job_id!r} and {job_name!r}")
+        # str-based enums hash like their values, so members and raw strings share one lookup
+        try:
+            platform_code = _PLATFORM_INDEX[platform]
+            status_code = _STATUS_INDEX[status]
+            duration = NO_DURATION if duration_seconds is None else int(duration_seconds)
+        except KeyError as e:
+            raise ValueError(f"Unknown platform or status for job {job_id}: {e}") from e
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid duration for job {job_id}: {duration_seconds!r}") from e
+        if duration_seconds is not None and duration < 0:
+            raise ValueError(f"Negative duration for job {job_id}: {duration_seconds}")
+
+        row = len(self.job_ids)
+        self.job_ids.append(job_id)
+        self.job_names.append(job_name)
+        self.platform_codes.append(platform_code)
+        self.status_codes.append(status_code)
+        self.last_run_epochs.append(_to_epoch(last_run_time))
+        self.duration_seconds.append(duration)
+        self.checked_at_epochs.append(_to_epoch(checked_at or utc_now()))
+        if error_message:
+            self.error_messages[row] = error_message
+        if metadata:
+            self.metadata[row] = metadata
+
+    def append_record(self, record: JobStatusRecord) -> None:
+        """Append a JobStatusRecord."""
+        self.append(
+            record.job_id,
+            record.platform,
+            record.job_name,
+            record.status,
+            record.last_run_time,
+            record.duration_seconds,
+            record.error_message,
+            record.metadata,
+            record.checked_at,
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[JobStatusRecord]) -> "JobStatusBatch":
+        """Build a batch from JobStatusRecord objects."""
+        batch = cls()
+        for record in records:
+            batch.append_record(record)
+        return batch
+
+    @classmethod
+    def from_dicts(
+        cls,
+        rows: Iterable[Dict[str, Any]],
+        skip_invalid: bool = False,
+    ) -> "JobStatusBatch":
+        """
+        Build a batch from record dictionaries (as returned by the agent tools).
+
+        Args:
+            rows: Dictionaries with JobStatusRecord field names; timestamps may be ISO strings
+            skip_invalid: Log and skip rows that fail conversion instead of raising
+
+        Returns:
+            JobStatusBatch with the converted rows
+        """
+        batch = cls()
+        for row in rows:
+            try:
+                batch.append(
+                    row["job_id"],
+                    row["platform"],
+                    row["job_name"],
+                    row["status"],
+                    parse_timestamp(row.get("last_run_time")),
+                    row.get("duration_seconds"),
+                    row.get("error_message"),
+                    row.get("metadata"),
+                    parse_timestamp(row.get("checked_at")),
+                )
+            except (KeyError, ValueError, TypeError) as e:
+                if not skip_invalid:
+                    raise ValueError(f"Invalid job record {row.get('job_id')}: {e}") from e
+                logger.warning(f"Failed to convert record data: {e}")
+        return batch
+
+    def extend(self, other: "JobStatusBatch") -> None:
+        """Append every row of another batch."""
+        offset = len(self)
+        self.job_ids.extend(other.job_ids)
+        self.job_names.extend(other.job_names)
+        self.platform_codes.extend(other.platform_codes)
+        self.status_codes.extend(other.status_codes)
+        self.last_run_epochs.extend(other.last_run_epochs)
+        self.duration_seconds.extend(other.duration_seconds)
+        self.checked_at_epochs.extend(other.checked_at_epochs)
+        self.error_messages.update({offset + i: v for i, v in other.error_messages.items()})
+        self.metadata.update({offset + i: v for i, v in other.metadata.items()})
+
+    def platform(self, row: int) -> PlatformType:
+        """Platform of a row."""
+        return PLATFORM_CODES[self.platform_codes[row]]
+
+    def status(self, row: int) -> JobStatus:
+        """Status of a row."""
+        return STATUS_CODES[self.status_codes[row]]
+
+    def duration(self, row: int) -> Optional[int]:
+        """Duration of a row in seconds, if known."""
+        value = self.duration_seconds[row]
+        return None if value == NO_DURATION else value
+
+    def status_counts(self) -> Dict[JobStatus, int]:
+        """Number of rows per status, computed on the code column."""
+        counts = [0] * len(STATUS_CODES)
+        for code in self.status_codes:
+            counts[code] += 1
+        return {STATUS_CODES[code]: n for code, n in enumerate(counts) if n}
+
+    def iter_records(self) -> Iterator[JobStatusRecord]:
+        """
+        Materialize rows as JobStatusRecord objects.
+
+        The batch only ever holds validated values, so records are built
+        without re-running validation.
+        """
+        for row in range(len(self)):
+            yield JobStatusRecord.model_construct(
+                job_id=self.job_ids[row],
+                platform=self.platform(row),
+                job_name=self.job_names[row],
+                status=self.status(row),
+                last_run_time=_from_epoch(self.last_run_epochs[row]),
+                duration_seconds=self.duration(row),
+                error_message=self.error_messages.get(row),
+                metadata=self.metadata.get(row, {}),
+                checked_at=_from_epoch(self.checked_at_epochs[row]),
+            )
+
+    def to_records(self) -> List[JobStatusRecord]:
+        """Materialize every row as a JobStatusRecord."""
+        return list(self.iter_records())
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert rows to the JSON-friendly dictionaries used by the agent tools."""
+        rows = []
+        for row in range(len(self)):
+            last_run_time = _from_epoch(self.last_run_epochs[row])
+            rows.append({
+                "job_id": self.job_ids[row],
+                "job_name": self.job_names[row],
+                "status": self.status(row).value,
+                "last_run_time": last_run_time.isoformat() if last_run_time else None,
+                "duration_seconds": self.duration(row),
+                "error_message": self.error_messages.get(row),
+                "platform": self.platform(row).value,
+                "metadata": self.metadata.get(row, {}),
+                "checked_at": _from_epoch(self.checked_at_epochs[row]).isoformat(),
+            })
+        return rows
+
+    def to_bind_rows(self) -> List[List[Any]]:
+        """
+        Convert rows to Snowflake bind parameters for JOB_STATUS_RECORDS.
+
+        Column order: RECORD_ID, JOB_ID, PLATFORM, JOB_NAME, STATUS,
+        LAST_RUN_TIME, DURATION_SECONDS, ERROR_MESSAGE, METADATA, CHECKED_AT.
+        """
+        platform_values = [p.value for p in PLATFORM_CODES]
+        status_values = [s.value for s in STATUS_CODES]
+        rows = []
+        for row in range(len(self)):
+            metadata = self.metadata.get(row)
+            checked_epoch = self.checked_at_epochs[row]
+            platform_value = platform_values[self.platform_codes[row]]
+            rows.append([
+                f"{platform_value}_{self.job_ids[row]}_{int(checked_epoch)}",
+                self.job_ids[row],
+                platform_value,
+                self.job_names[row],
+                status_values[self.status_codes[row]],
+                _from_epoch(self.last_run_epochs[row]),
+                self.duration(row),
+                self.error_messages.get(row),
+                dumps(metadata) if metadata else None,
+                _from_epoch(checked_epoch),
+            ])
+        return rows
+
+    def to_arrow(self) -> Any:
+        """
+        Convert the batch to a pyarrow Table.
+
+        Statuses and platforms become dictionary-encoded columns and metadata
+        a JSON string column.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("pyarrow is required for Arrow conversion: pip install pyarrow") from e
+
+        n = len(self)
+
+        def epochs_to_timestamps(values: array) -> Any:
+            micros = [None if math.isnan(v) else int(v * 1_000_000) for v in values]
+            return pa.array(micros, type=pa.timestamp("us", tz="UTC"))
+
+        def codes_to_dictionary(codes: array, enum_values: Tuple[Any, ...]) -> Any:
+            return pa.DictionaryArray.from_arrays(
+                pa.array(codes, type=pa.uint8()),
+                pa.array([e.value for e in enum_values], type=pa.string()),
+            )
+
+        return pa.table({
+            "job_id": pa.array(self.job_ids, type=pa.string()),
+            "platform": codes_to_dictionary(self.platform_codes, PLATFORM_CODES),
+            "job_name": pa.array(self.job_names, type=pa.string()),
+            "status": codes_to_dictionary(self.status_codes, STATUS_CODES),
+            "last_run_time": epochs_to_timestamps(self.last_run_epochs),
+            "duration_seconds": pa.array(
+                [None if d == NO_DURATION else d for d in self.duration_seconds], type=pa.int64()
+            ),
+            "error_message": pa.array([self.error_messages.get(i) for i in range(n)], type=pa.string()),
+            "metadata": pa.array(
+                [dumps(self.metadata[i]) if i in self.metadata else None for i in range(n)],
+                type=pa.string(),
+            ),
+            "checked_at": epochs_to_timestamps(self.checked_at_epochs),
+        })
+
+    @classmethod
+    def from_arrow(cls, table: Any) -> "JobStatusBatch":
+        """
+        Build a batch from a pyarrow Table produced by to_arrow.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        columns = table.to_pydict()
+        batch = cls()
+        for row in range(table.num_rows):
+            metadata = columns["metadata"][row]
+            batch.append(
+                columns["job_id"][row],
+                columns["platform"][row],
+                columns["job_name"][row],
+                columns["status"][row],
+                columns["last_run_time"][row],
+                columns["duration_seconds"][row],
+                columns["error_message"][row],
+                loads(metadata) if metadata else None,
+                columns["checked_at"][row],
+            )
+        return batch
@@ -7,6 +7,8 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
 
+from .timestamps import utc_now
+
 
 class JobStatus(str, Enum):
     """Enumeration of possible job statuses across all platforms."""
@@ -53,7 +55,7 @@ class JobStatusRecord(BaseModel):
     duration_seconds: Optional[int] = Field(None, description="Job duration in seconds", ge=0)
     error_message: Optional[str] = Field(None, description="Error details if failed")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Platform-specific metadata")
-    checked_at: datetime = Field(default_factory=datetime.utcnow, description="Status check timestamp")
+    checked_at: datetime = Field(default_factory=utc_now, description="Status check timestamp")
     
     class Config:
         """Pydantic configuration."""
@@ -84,7 +86,7 @@ class HealthAssessment(BaseModel):
         description="Priority for notification"
     )
     assessment_timestamp: datetime = Field(
-        default_factory=datetime.utcnow, 
+        default_factory=utc_now, 
         description="When the assessment was made"
     )
     jobs_analyzed: int = Field(0, description="Number of jobs analyzed", ge=0)
@@ -120,7 +122,7 @@ class PlatformHealthSummary(BaseModel):
     failed_jobs: int = Field(0, description="Number of failed jobs", ge=0)
     running_jobs: int = Field(0, description="Number of running jobs", ge=0)
     platform_status: str = Field(..., description="Overall platform status")
-    last_check: datetime = Field(default_factory=datetime.utcnow, description="Last check timestamp")
+    last_check: datetime = Field(default_factory=utc_now, description="Last check timestamp")
     issues: List[str] = Field(default_factory=list, description="Identified issues")
     
     @property
@@ -157,7 +159,7 @@ class MonitoringResult(BaseModel):
     """Complete monitoring result across all platforms."""
     
     monitoring_id: str = Field(..., description="Unique monitoring session ID")
-    started_at: datetime = Field(default_factory=datetime.utcnow, description="Monitoring start time")
+    started_at: datetime = Field(default_factory=utc_now, description="Monitoring start time")
     completed_at: Optional[datetime] = Field(None, description="Monitoring completion time")
     platform_summaries: List[PlatformHealthSummary] = Field(
         default_factory=list, 
@@ -5,6 +5,7 @@ Email notification data models for the monitoring framework.
 from pydantic import BaseModel, Field, EmailStr
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from .timestamps import utc_now
 from .job_status import HealthAssessment, PlatformHealthSummary, NotificationPriority
 
 
@@ -54,7 +55,7 @@ class EmailNotification(BaseModel):
     priority: NotificationPriority = Field(NotificationPriority.NORMAL, description="Notification priority")
     attachments: List[str] = Field(default_factory=list, description="File paths for attachments")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
+    created_at: datetime = Field(default_factory=utc_now, description="Creation timestamp")
     
     class Config:
         json_schema_extra = {
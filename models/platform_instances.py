@@ -0,0 +1,17 @@
+"""
+Platform instance model for multi-workspace monitoring.
+"""
+
+from pydantic import BaseModel, Field
+from typing import Any, Dict
+from .job_status import PlatformType
+
+
+class PlatformInstance(BaseModel):
+    """One monitored instance of a platform (a workspace, tenant or account)."""
+    
+    name: str = Field(..., description="Instance name, unique per platform; tags records and isolates state")
+    platform: PlatformType = Field(..., description="Platform the instance belongs to")
+    enabled: bool = Field(True, description="Whether the instance is collected")
+    max_concurrency: int = Field(2, ge=1, description="Maximum API requests in flight for this instance")
+    options: Dict[str, Any] = Field(default_factory=dict, description="Collector arguments (credentials, URLs)")
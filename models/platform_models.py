@@ -3,8 +3,10 @@ Platform-specific data models for API responses.
 These models represent the raw API responses from each platform before conversion to JobStatusRecord.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import List, Optional, Dict, Any, Type, TypeVar, Union
 
 
 # ===============================================================================
@@ -68,11 +70,23 @@ class DatabricksJobRun(BaseModel):
     setup_duration: Optional[int] = Field(None, alias="setup_duration")
     execution_duration: Optional[int] = Field(None, alias="execution_duration")
     cleanup_duration: Optional[int] = Field(None, alias="cleanup_duration")
+    tasks: Optional[List[Dict[str, Any]]] = Field(None, alias="tasks")
     
     class Config:
         allow_population_by_field_name = True
 
 
+class DatabricksRunOutput(BaseModel):
+    """Model for Databricks run output (/jobs/runs/get-output) response."""
+    
+    error: Optional[str] = Field(None, alias="error")
+    error_trace: Optional[str] = Field(None, alias="error_trace")
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+    notebook_output: Optional[Dict[str, Any]] = Field(None, alias="notebook_output")
+    
+    model_config = ConfigDict(populate_by_name=True)
+
+
 class DatabricksJobDetails(BaseModel):
     """Model for Databricks job details response."""
     
@@ -165,13 +179,13 @@ class PowerAutomateFlow(BaseModel):
 class SnowflakeTaskHistory(BaseModel):
     """Model for Snowflake task history response."""
     
-    name: str = Field(...)
+    name: str = Field(..., alias="NAME")
     database_name: str = Field(..., alias="DATABASE_NAME")
     schema_name: str = Field(..., alias="SCHEMA_NAME")
-    state: str = Field(...)
-    scheduled_time: Optional[str] = Field(None, alias="SCHEDULED_TIME")
-    started_time: Optional[str] = Field(None, alias="STARTED_TIME")
-    completed_time: Optional[str] = Field(None, alias="COMPLETED_TIME")
+    state: str = Field(..., alias="STATE")
+    scheduled_time: Optional[Union[datetime, str]] = Field(None, alias="SCHEDULED_TIME")
+    started_time: Optional[Union[datetime, str]] = Field(None, alias="STARTED_TIME")
+    completed_time: Optional[Union[datetime, str]] = Field(None, alias="COMPLETED_TIME")
     root_task_id: Optional[str] = Field(None, alias="ROOT_TASK_ID")
     graph_run_id: Optional[str] = Field(None, alias="GRAPH_RUN_ID")
     run_id: Optional[int] = Field(None, alias="RUN_ID")
@@ -179,25 +193,38 @@ class SnowflakeTaskHistory(BaseModel):
     error_message: Optional[str] = Field(None, alias="ERROR_MESSAGE")
     
     class Config:
-        allow_population_by_field_name = True
+        populate_by_name = True
 
 
 class SnowflakeTaskInfo(BaseModel):
-    """Model for Snowflake task information."""
+    """Model for Snowflake task information (INFORMATION_SCHEMA or SHOW TASKS rows)."""
     
-    name: str = Field(...)
+    name: str = Field(..., alias="NAME")
     database_name: str = Field(..., alias="DATABASE_NAME")
     schema_name: str = Field(..., alias="SCHEMA_NAME")
-    owner: Optional[str] = Field(None)
-    comment: Optional[str] = Field(None)
-    warehouse: Optional[str] = Field(None)
-    schedule: Optional[str] = Field(None)
-    state: str = Field(...)
-    definition: Optional[str] = Field(None)
-    condition: Optional[str] = Field(None)
+    owner: Optional[str] = Field(None, alias="OWNER")
+    comment: Optional[str] = Field(None, alias="COMMENT")
+    warehouse: Optional[str] = Field(None, alias="WAREHOUSE")
+    schedule: Optional[str] = Field(None, alias="SCHEDULE")
+    state: str = Field(..., alias="STATE")
+    definition: Optional[str] = Field(None, alias="DEFINITION")
+    condition: Optional[str] = Field(None, alias="CONDITION")
+    predecessors: Optional[str] = Field(None, alias="PREDECESSORS")
+    last_altered: Optional[Union[datetime, str]] = Field(None, alias="LAST_ALTERED")
     
     class Config:
-        allow_population_by_field_name = True
+        populate_by_name = True
+
+
+class SnowflakeTaskDefinitionChange(BaseModel):
+    """A task created, modified or dropped since the catalog last saw it."""
+    
+    task_name: str = Field(..., description="Fully qualified task name")
+    change_type: str = Field(..., description="'created', 'modified' or 'removed'")
+    previous_hash: Optional[str] = Field(None, description="Definition hash before the change")
+    definition_hash: Optional[str] = Field(None, description="Definition hash after the change")
+    changed_fields: List[str] = Field(default_factory=list, description="Definition fields that differ")
+    detected_at: datetime = Field(..., description="When the change was detected")
 
 
 # ===============================================================================
@@ -226,63 +253,47 @@ class PaginatedResponse(BaseModel):
 
 
 # ===============================================================================
-# Platform Status Mapping Utilities
+# Response Parsing
 # ===============================================================================
 
-def map_airbyte_status(airbyte_status: str) -> str:
-    """Map Airbyte status to standardized JobStatus."""
-    status_mapping = {
-        "succeeded": "success",
-        "failed": "failed",
-        "cancelled": "cancelled",
-        "running": "running",
-        "pending": "pending",
-        "incomplete": "running",
-    }
-    return status_mapping.get(airbyte_status.lower(), "unknown")
-
-
-def map_databricks_status(databricks_state: Dict[str, Any]) -> str:
-    """Map Databricks job run state to standardized JobStatus."""
-    life_cycle_state = databricks_state.get("life_cycle_state", "").lower()
-    result_state = databricks_state.get("result_state", "").lower()
-    
-    if life_cycle_state == "terminated":
-        if result_state == "success":
-            return "success"
-        elif result_state == "failed":
-            return "failed"
-        elif result_state == "canceled":
-            return "cancelled"
-        else:
-            return "unknown"
-    elif life_cycle_state in ["pending", "running"]:
-        return "running"
-    else:
-        return "unknown"
-
-
-def map_powerautomate_status(pa_status: str) -> str:
-    """Map Power Automate status to standardized JobStatus."""
-    status_mapping = {
-        "succeeded": "success",
-        "failed": "failed",
-        "cancelled": "cancelled",
-        "running": "running",
-        "waiting": "pending",
-        "suspended": "pending",
-    }
-    return status_mapping.get(pa_status.lower(), "unknown")
-
-
-def map_snowflake_task_status(snowflake_state: str) -> str:
-    """Map Snowflake task state to standardized JobStatus."""
-    status_mapping = {
-        "succeeded": "success",
-        "failed": "failed",
-        "cancelled": "cancelled",
-        "running": "running",
-        "scheduled": "pending",
-        "skipped": "cancelled",
-    }
-    return status_mapping.get(snowflake_state.lower(), "unknown")
\ No newline at end of file
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(tp: Any) -> TypeAdapter:
+    """Get a cached TypeAdapter; building one compiles a validator, so reuse it."""
+    return TypeAdapter(tp)
+
+
+def parse_response(model: Type[ModelT], payload: Union[bytes, str, Dict[str, Any]]) -> ModelT:
+    """
+    Parse an API response into a platform model.
+
+    Raw JSON bytes are validated directly by pydantic-core, without building
+    an intermediate dict first.
+
+    Args:
+        model: Response model class
+        payload: Raw JSON bytes/str, or already decoded JSON
+
+    Returns:
+        Parsed model instance
+    """
+    adapter = get_type_adapter(model)
+    if isinstance(payload, (bytes, str)):
+        return adapter.validate_json(payload)
+    return adapter.validate_python(payload)
+
+
+def parse_rows(model: Type[ModelT], rows: List[Dict[str, Any]]) -> List[ModelT]:
+    """
+    Parse a list of rows (e.g. query results or a response's data array) in one validator call.
+
+    Args:
+        model: Row model class
+        rows: Row dictionaries
+
+    Returns:
+        List of parsed model instances
+    """
+    return get_type_adapter(List[model]).validate_python(rows)
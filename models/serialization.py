@@ -0,0 +1,150 @@
+"""
+JSON serialization for record metadata, Snowflake VARIANT payloads and output files.
+
+orjson is used when it is installed and the standard library otherwise.
+Both backends produce compact output and encode datetimes (ISO-8601),
+dates, enums, sets and pydantic models without callers having to convert
+them first; anything else falls back to str().
+"""
+
+import json
+import logging
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Optional, Union
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Encode types neither backend handles natively."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return str(value)
+
+
+class JSONSerializer:
+    """JSON encoder/decoder with an orjson fast path and a standard library fallback."""
+
+    def __init__(self, backend: Optional[str] = None):
+        """
+        Initialize serializer.
+
+        Args:
+            backend: "orjson" or "json"; defaults to orjson when it is installed
+
+        Raises:
+            ValueError: If the backend is unknown or orjson is requested but not installed
+        """
+        if backend is None:
+            backend = "orjson" if orjson is not None else "json"
+        if backend not in ("orjson", "json"):
+            raise ValueError(f"Unknown JSON backend: {backend}")
+        if backend == "orjson" and orjson is None:
+            raise ValueError("orjson backend requested but orjson is not installed")
+        self.backend = backend
+
+    def dumps_bytes(self, value: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+        """
+        Encode a value as UTF-8 JSON bytes.
+
+        Args:
+            value: Value to encode
+            indent: Pretty-print with two-space indentation
+            sort_keys: Sort object keys (for stable cache keys and diffs)
+
+        Returns:
+            Encoded JSON
+        """
+        if self.backend == "orjson":
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            return orjson.dumps(value, default=_default, option=option)
+        return self._stdlib_dumps(value, indent, sort_keys).encode("utf-8")
+
+    def dumps(self, value: Any, indent: bool = False, sort_keys: bool = False) -> str:
+        """Encode a value as a JSON string (see dumps_bytes)."""
+        if self.backend == "orjson":
+            return self.dumps_bytes(value, indent, sort_keys).decode("utf-8")
+        return self._stdlib_dumps(value, indent, sort_keys)
+
+    @staticmethod
+    def _stdlib_dumps(value: Any, indent: bool, sort_keys: bool) -> str:
+        """Encode with the json module, matching orjson's output layout."""
+        return json.dumps(
+            value,
+            default=_default,
+            ensure_ascii=False,
+            sort_keys=sort_keys,
+            indent=2 if indent else None,
+            separators=None if indent else (",", ":"),
+        )
+
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        """Decode JSON bytes or text."""
+        if self.backend == "orjson":
+            return orjson.loads(data)
+        return json.loads(data)
+
+
+_serializer = JSONSerializer()
+
+
+def get_serializer() -> JSONSerializer:
+    """Get the process-wide serializer."""
+    return _serializer
+
+
+def set_json_backend(backend: Optional[str]) -> JSONSerializer:
+    """
+    Switch the process-wide serializer backend.
+
+    Args:
+        backend: "orjson", "json", or None for the default
+
+    Returns:
+        The new serializer
+    """
+    global _serializer
+    _serializer = JSONSerializer(backend)
+    logger.info(f"JSON serialization backend: {_serializer.backend}")
+    return _serializer
+
+
+def dumps(value: Any, indent: bool = False, sort_keys: bool = False) -> str:
+    """Encode a value as a JSON string with the process-wide serializer."""
+    return _serializer.dumps(value, indent, sort_keys)
+
+
+def dumps_bytes(value: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Encode a value as JSON bytes with the process-wide serializer."""
+    return _serializer.dumps_bytes(value, indent, sort_keys)
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Decode JSON with the process-wide serializer."""
+    return _serializer.loads(data)
+
+
+def dump_file(value: Any, path: str, indent: bool = True) -> None:
+    """Write a value to a JSON file."""
+    with open(path, "wb") as f:
+        f.write(dumps_bytes(value, indent=indent))
@@ -0,0 +1,114 @@
+"""
+JSON state files for state kept between monitoring cycles.
+
+Watermarks, caches, baselines and trackers serialize themselves with
+to_dict/load_state. PersistentState gives them an atomic save and a load
+that never fails on a missing or unreadable file, and StateRegistry shares
+one loaded instance per state file within the process.
+"""
+
+import logging
+import os
+from typing import Any, Callable, Dict, Generic, Type, TypeVar
+
+from .serialization import dumps_bytes, loads
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+S = TypeVar("S", bound="PersistentState")
+
+
+def save_state(path: str, state: Any) -> None:
+    """
+    Write state to a JSON file atomically.
+
+    The file is written next to its destination and renamed over it, so a
+    crash mid-write never leaves a truncated state file behind.
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(dumps_bytes(state))
+    os.replace(tmp_path, path)
+
+
+def load_state(path: str, cls: Type[S], **kwargs: Any) -> S:
+    """
+    Create a state object and restore it from a state file if one exists.
+
+    An unreadable file or invalid state is logged and ignored, so a corrupt
+    state file never blocks monitoring; the object starts empty instead.
+
+    Args:
+        path: State file
+        cls: PersistentState subclass to create
+        **kwargs: Constructor arguments
+
+    Returns:
+        The new object
+    """
+    instance = cls(**kwargs)
+    if os.path.exists(path):
+        try:
+            with open(path, "rb") as f:
+                instance.load_state(loads(f.read()))
+            logger.debug(f"Loaded {cls.state_name} from {path}")
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Failed to load {cls.state_name} from {path}: {e}")
+    return instance
+
+
+class PersistentState:
+    """
+    Base for state objects kept in a JSON state file.
+
+    Subclasses implement to_dict and load_state and name their state for
+    log messages in state_name.
+    """
+
+    state_name = "state"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the state."""
+        raise NotImplementedError
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        """Replace contents with serialized state from to_dict."""
+        raise NotImplementedError
+
+    def save(self, path: str) -> None:
+        """Write the state to a JSON state file atomically."""
+        save_state(path, self.to_dict())
+        logger.debug(f"Saved {self.state_name} to {path}")
+
+    @classmethod
+    def load(cls: Type[S], path: str, **kwargs: Any) -> S:
+        """Create an instance and restore it from a state file if one exists (see load_state)."""
+        return load_state(path, cls, **kwargs)
+
+
+class StateRegistry(Generic[T]):
+    """Process-wide objects, one per state file, loaded on first use."""
+
+    def __init__(self, loader: Callable[..., T]):
+        """
+        Initialize registry.
+
+        Args:
+            loader: Called as loader(path, **kwargs) the first time a path is requested
+        """
+        self.loader = loader
+        self._items: Dict[str, T] = {}
+
+    def get(self, path: str, **kwargs: Any) -> T:
+        """Get the object for a state file; kwargs only apply when it is first loaded."""
+        item = self._items.get(path)
+        if item is None:
+            item = self._items[path] = self.loader(path, **kwargs)
+        return item
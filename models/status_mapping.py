@@ -0,0 +1,171 @@
+"""
+Normalization of platform-specific job states to JobStatus.
+
+The lookup tables are built once at import time and frozen. Mappers return
+JobStatus members directly, and every raw state that falls through to
+UNKNOWN is counted per platform so mapping drift (a platform introducing a
+new state) shows up in cycle metrics instead of as silent unknowns.
+"""
+
+import logging
+import threading
+from collections import Counter
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .job_status import JobStatus, PlatformType
+
+logger = logging.getLogger(__name__)
+
+AIRBYTE_STATUS_MAP: Mapping[str, JobStatus] = MappingProxyType({
+    "succeeded": JobStatus.SUCCESS,
+    "failed": JobStatus.FAILED,
+    "cancelled": JobStatus.CANCELLED,
+    "running": JobStatus.RUNNING,
+    "pending": JobStatus.PENDING,
+    "incomplete": JobStatus.RUNNING,
+})
+
+POWER_AUTOMATE_STATUS_MAP: Mapping[str, JobStatus] = MappingProxyType({
+    "succeeded": JobStatus.SUCCESS,
+    "failed": JobStatus.FAILED,
+    "cancelled": JobStatus.CANCELLED,
+    "running": JobStatus.RUNNING,
+    "waiting": JobStatus.PENDING,
+    "suspended": JobStatus.PENDING,
+})
+
+SNOWFLAKE_TASK_STATUS_MAP: Mapping[str, JobStatus] = MappingProxyType({
+    "succeeded": JobStatus.SUCCESS,
+    "failed": JobStatus.FAILED,
+    "cancelled": JobStatus.CANCELLED,
+    "running": JobStatus.RUNNING,
+    "executing": JobStatus.RUNNING,
+    "scheduled": JobStatus.PENDING,
+    "skipped": JobStatus.CANCELLED,
+    "failed_and_auto_suspended": JobStatus.FAILED,
+})
+
+# Databricks reports a (life_cycle_state, result_state) pair
+DATABRICKS_RESULT_STATE_MAP: Mapping[str, JobStatus] = MappingProxyType({
+    "success": JobStatus.SUCCESS,
+    "failed": JobStatus.FAILED,
+    "timedout": JobStatus.FAILED,
+    "canceled": JobStatus.CANCELLED,
+    # Task runs that never ran because an upstream task did not succeed
+    "upstream_failed": JobStatus.CANCELLED,
+    "upstream_canceled": JobStatus.CANCELLED,
+    "excluded": JobStatus.CANCELLED,
+})
+
+DATABRICKS_ACTIVE_STATES = frozenset({"pending", "running"})
+
+# Task runs waiting on upstream tasks or a concurrency slot
+DATABRICKS_WAITING_STATES = frozenset({"blocked", "queued"})
+
+_unmapped_counts: Counter = Counter()
+_unmapped_lock = threading.Lock()
+
+
+def _record_unmapped(platform: PlatformType, raw_status: str) -> JobStatus:
+    """Count a state that has no mapping; warn the first time it is seen."""
+    key = (platform.value, raw_status)
+    with _unmapped_lock:
+        first_seen = key not in _unmapped_counts
+        _unmapped_counts[key] += 1
+    if first_seen:
+        logger.warning(f"Unmapped {platform.value} status '{raw_status}', reporting as unknown")
+    return JobStatus.UNKNOWN
+
+
+def _lookup(platform: PlatformType, table: Mapping[str, JobStatus], raw_status: Optional[str]) -> JobStatus:
+    """Map a raw status through a lookup table."""
+    key = (raw_status or "").lower()
+    status = table.get(key)
+    if status is None:
+        return _record_unmapped(platform, key)
+    return status
+
+
+def map_airbyte_status(airbyte_status: str) -> JobStatus:
+    """Map Airbyte status to standardized JobStatus."""
+    return _lookup(PlatformType.AIRBYTE, AIRBYTE_STATUS_MAP, airbyte_status)
+
+
+def map_powerautomate_status(pa_status: str) -> JobStatus:
+    """Map Power Automate status to standardized JobStatus."""
+    return _lookup(PlatformType.POWER_AUTOMATE, POWER_AUTOMATE_STATUS_MAP, pa_status)
+
+
+def map_snowflake_task_status(snowflake_state: str) -> JobStatus:
+    """Map Snowflake task state to standardized JobStatus."""
+    return _lookup(PlatformType.SNOWFLAKE_TASK, SNOWFLAKE_TASK_STATUS_MAP, snowflake_state)
+
+
+def map_databricks_status(databricks_state: Dict[str, Any]) -> JobStatus:
+    """Map Databricks job run state to standardized JobStatus."""
+    life_cycle_state = (databricks_state.get("life_cycle_state") or "").lower()
+    result_state = (databricks_state.get("result_state") or "").lower()
+
+    if life_cycle_state == "terminated" or (life_cycle_state == "skipped" and result_state):
+        status = DATABRICKS_RESULT_STATE_MAP.get(result_state)
+        if status is None:
+            return _record_unmapped(PlatformType.DATABRICKS, f"terminated/{result_state}")
+        return status
+    if life_cycle_state in DATABRICKS_ACTIVE_STATES:
+        return JobStatus.RUNNING
+    if life_cycle_state in DATABRICKS_WAITING_STATES:
+        return JobStatus.PENDING
+    return _record_unmapped(PlatformType.DATABRICKS, life_cycle_state)
+
+
+_MAPPERS = {
+    PlatformType.AIRBYTE: map_airbyte_status,
+    PlatformType.DATABRICKS: map_databricks_status,
+    PlatformType.POWER_AUTOMATE: map_powerautomate_status,
+    PlatformType.SNOWFLAKE_TASK: map_snowflake_task_status,
+}
+
+
+def map_statuses(platform: PlatformType, raw_statuses: Iterable[Any]) -> List[JobStatus]:
+    """
+    Map a whole column of raw statuses for one platform.
+
+    Each distinct raw status is mapped once; Databricks state dicts are keyed
+    by their (life_cycle_state, result_state) pair.
+
+    Args:
+        platform: Platform the statuses come from
+        raw_statuses: Raw status strings (or Databricks state dicts)
+
+    Returns:
+        JobStatus members in input order
+    """
+    mapper = _MAPPERS[PlatformType(platform)]
+    mapped: Dict[Any, JobStatus] = {}
+    results = []
+    for raw in raw_statuses:
+        key = (raw.get("life_cycle_state"), raw.get("result_state")) if isinstance(raw, dict) else raw
+        status = mapped.get(key)
+        if status is None:
+            status = mapper(raw)
+            mapped[key] = status
+        elif status is JobStatus.UNKNOWN:
+            # Keep the drift counter exact for repeated unmapped values
+            mapper(raw)
+        results.append(status)
+    return results
+
+
+def unmapped_status_counts() -> Dict[Tuple[str, str], int]:
+    """Snapshot of (platform, raw status) -> times it was reported as unknown."""
+    with _unmapped_lock:
+        return dict(_unmapped_counts)
+
+
+def reset_unmapped_status_counts() -> Dict[Tuple[str, str], int]:
+    """Return the current unmapped counts and start counting from zero."""
+    with _unmapped_lock:
+        counts = dict(_unmapped_counts)
+        _unmapped_counts.clear()
+    return counts
@@ -0,0 +1,116 @@
+"""
+Timestamp parsing and normalization shared by all collectors.
+
+Platforms report times as ISO-8601 strings (with or without a trailing Z),
+epoch seconds or epoch milliseconds, and Snowflake returns naive datetimes.
+Everything parsed here comes back as an aware UTC datetime so records from
+different platforms can be compared and stored consistently.
+"""
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+# Multipliers from an epoch unit to seconds
+EPOCH_UNITS: Dict[str, float] = {
+    "s": 1.0,
+    "ms": 1e-3,
+    "us": 1e-6,
+}
+
+
+def utc_now() -> datetime:
+    """Current time as an aware UTC datetime (replacement for datetime.utcnow)."""
+    return datetime.now(timezone.utc)
+
+
+def ensure_utc(value: datetime) -> datetime:
+    """Convert a datetime to UTC; naive values are taken to already be UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    if value.utcoffset():
+        return value.astimezone(timezone.utc)
+    return value
+
+
+@lru_cache(maxsize=8192)
+def _parse_iso(value: str) -> datetime:
+    """
+    Parse an ISO-8601 string; memoized because job listings repeat the same
+    created/updated/scheduled times many times over.
+    """
+    text = value.strip()
+    if text.endswith(("Z", "z")):
+        text = text[:-1] + "+00:00"
+    return ensure_utc(datetime.fromisoformat(text))
+
+
+def parse_timestamp(value: Any, unit: str = "s") -> Optional[datetime]:
+    """
+    Parse a timestamp into an aware UTC datetime.
+
+    Args:
+        value: ISO-8601 string, epoch number, datetime or None
+        unit: Epoch unit for numeric values ("s", "ms" or "us")
+
+    Returns:
+        UTC datetime, or None for empty values
+
+    Raises:
+        ValueError: If the value cannot be parsed
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return ensure_utc(value)
+    if isinstance(value, str):
+        return _parse_iso(value)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        try:
+            return datetime.fromtimestamp(value * EPOCH_UNITS[unit], tz=timezone.utc)
+        except KeyError:
+            raise ValueError(f"Unknown epoch unit: {unit}")
+        except (OverflowError, OSError) as e:
+            raise ValueError(f"Epoch value out of range: {value}") from e
+    raise ValueError(f"Unsupported timestamp value: {value!r}")
+
+
+def try_parse_timestamp(value: Any, unit: str = "s") -> Optional[datetime]:
+    """Like parse_timestamp, but returns None instead of raising."""
+    try:
+        return parse_timestamp(value, unit)
+    except ValueError:
+        return None
+
+
+def parse_timestamps(values: Iterable[Any], unit: str = "s") -> List[Optional[datetime]]:
+    """
+    Parse a whole column of timestamps.
+
+    Repeated values within the column are converted once. Unparseable values
+    become None rather than failing the column.
+
+    Args:
+        values: Column of ISO strings, epoch numbers, datetimes or None
+        unit: Epoch unit for numeric values
+
+    Returns:
+        UTC datetimes (or None) in input order
+    """
+    seen: Dict[Any, Optional[datetime]] = {}
+    parsed = []
+    for value in values:
+        if isinstance(value, (str, int, float)):
+            if value not in seen:
+                seen[value] = try_parse_timestamp(value, unit)
+            parsed.append(seen[value])
+        else:
+            parsed.append(try_parse_timestamp(value, unit))
+    return parsed
+
+
+def duration_seconds(start: Optional[datetime], end: Optional[datetime]) -> Optional[int]:
+    """Whole seconds between two parsed timestamps, or None if either is missing."""
+    if start is None or end is None:
+        return None
+    return int((end - start).total_seconds())
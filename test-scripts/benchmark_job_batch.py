@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark JobStatusBatch against lists of JobStatusRecord models.
+Measures memory use and conversion time for a large synthetic record set.
+
+The batch's gain is memory: at 100k records it retains about 5 MiB against
+about 125 MiB for the model list. Conversion times stay in the same range
+as the model list (the timestamps are still parsed per row) and vary with
+the machine, so do not expect a fixed speed-up.
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from models.job_status import JobStatusRecord, JobStatus, PlatformType
+from models.job_batch import JobStatusBatch
+
+
+def make_dicts(count: int) -> list:
+    """Build agent-style record dictionaries."""
+    platforms = list(PlatformType)
+    statuses = list(JobStatus)
+    base = datetime(2024, 1, 15, tzinfo=timezone.utc)
+    rows = []
+    for i in range(count):
+        rows.append({
+            "job_id": f"job_{i}",
+            "platform": platforms[i % len(platforms)].value,
+            "job_name": f"Pipeline {i % 500}",
+            "status": statuses[i % len(statuses)].value,
+            "last_run_time": (base + timedelta(seconds=i)).isoformat(),
+            "duration_seconds": i % 3600,
+            "error_message": "Timeout" if i % 50 == 0 else None,
+            "metadata": {"connection_id": f"conn_{i % 500}"} if i % 10 == 0 else {},
+            "checked_at": (base + timedelta(seconds=i + 60)).isoformat(),
+        })
+    return rows
+
+
+def measure(label: str, func):
+    """Time func, then rerun it under tracemalloc to measure the memory its result keeps."""
+    gc.collect()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<45} {elapsed * 1000:>10.1f} ms {current / 1024 / 1024:>10.1f} MiB")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JobStatusBatch benchmark")
+    parser.add_argument("--records", type=int, default=100_000, help="Number of records (default: 100000)")
+    args = parser.parse_args()
+
+    rows = make_dicts(args.records)
+    print(f"{args.records} records\n")
+    print(f"{'Operation':<45} {'Time':>13} {'Retained':>14}")
+
+    records = measure("dicts -> List[JobStatusRecord]", lambda: [JobStatusRecord(**r) for r in rows])
+    batch = measure("dicts -> JobStatusBatch", lambda: JobStatusBatch.from_dicts(rows))
+    measure("List[JobStatusRecord] -> JobStatusBatch", lambda: JobStatusBatch.from_records(records))
+
+    measure("List[JobStatusRecord] -> dicts (model_dump)", lambda: [r.model_dump(mode="json") for r in records])
+    measure("JobStatusBatch -> dicts", batch.to_dicts)
+    measure("JobStatusBatch -> List[JobStatusRecord]", batch.to_records)
+    measure("JobStatusBatch -> Snowflake bind rows", batch.to_bind_rows)
+
+    try:
+        measure("JobStatusBatch -> Arrow table", batch.to_arrow)
+    except ImportError as e:
+        print(f"Skipping Arrow conversion: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark platform response parsing.
+Compares Model(**response.json()) with the cached TypeAdapter JSON path and
+unvalidated model_construct on large synthetic Airbyte and Databricks responses.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from models.platform_models import (
+    AirbyteJobsListResponse,
+    DatabricksJobRunsResponse,
+    parse_response,
+)
+
+
+def airbyte_payload(count: int) -> bytes:
+    """Build an Airbyte /jobs response body."""
+    jobs = [
+        {
+            "jobId": str(i),
+            "configId": f"conn_{i % 500}",
+            "configName": f"Connection {i % 500}",
+            "jobType": "sync",
+            "status": "succeeded" if i % 7 else "failed",
+            "createdAt": "2024-01-15T10:00:00Z",
+            "updatedAt": "2024-01-15T10:05:00Z",
+            "startedAt": "2024-01-15T10:00:05Z",
+            "endedAt": "2024-01-15T10:05:00Z",
+        }
+        for i in range(count)
+    ]
+    return json.dumps({"data": jobs, "hasMore": False}).encode()
+
+
+def databricks_payload(count: int) -> bytes:
+    """Build a Databricks /jobs/runs/list response body."""
+    runs = [
+        {
+            "run_id": i,
+            "job_id": i % 300,
+            "run_name": f"Job {i % 300}",
+            "state": {"life_cycle_state": "TERMINATED", "result_state": "SUCCESS"},
+            "start_time": 1705312800000 + i,
+            "end_time": 1705313100000 + i,
+            "setup_duration": 1000,
+            "execution_duration": 280000,
+            "cleanup_duration": 500,
+        }
+        for i in range(count)
+    ]
+    return json.dumps({"runs": runs, "has_more": False}).encode()
+
+
+def construct_response(model, data: dict):
+    """Build a list response with model_construct, skipping validation entirely."""
+    items_field = "data" if model is AirbyteJobsListResponse else "runs"
+    item_model = model.model_fields[items_field].annotation.__args__[0]
+    return model.model_construct(**{
+        **data,
+        items_field: [item_model.model_construct(**item) for item in data[items_field]],
+    })
+
+
+def timed(func, repeat: int) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Response parsing benchmark")
+    parser.add_argument("--jobs", type=int, default=10_000, help="Jobs per response (default: 10000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (default: 5)")
+    args = parser.parse_args()
+
+    cases = [
+        ("Airbyte jobs", AirbyteJobsListResponse, airbyte_payload(args.jobs)),
+        ("Databricks runs", DatabricksJobRunsResponse, databricks_payload(args.jobs)),
+    ]
+
+    print(f"{args.jobs} jobs per response, best of {args.repeat}\n")
+    print(f"{'Response':<18} {'Model(**json)':>15} {'validate_json':>15} {'model_construct':>15}")
+
+    for label, model, body in cases:
+        before = timed(lambda: model(**json.loads(body)), args.repeat)
+        adapter = timed(lambda: parse_response(model, body), args.repeat)
+        construct = timed(lambda: construct_response(model, json.loads(body)), args.repeat)
+        print(f"{label:<18} {before:>12.1f} ms {adapter:>12.1f} ms {construct:>12.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the per-platform circuit breakers.
+Run with pytest or directly; no credentials or network access are needed.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import Optional
+from unittest import mock
+
+import httpx
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    PlatformUnavailableError,
+)
+from tools.deadline import DeadlineExceededError
+from tools.outlook_api import OutlookAPIClient, OutlookAPIError
+from tools.powerautomate_api import PowerAutomateAPIClient, PowerAutomateAPIError
+
+
+async def unavailable():
+    raise PlatformUnavailableError("503")
+
+
+async def rejected():
+    raise ValueError("bad request")
+
+
+async def answered():
+    return "ok"
+
+
+def call(breaker: CircuitBreaker, func):
+    """Run one request through the breaker; return its result or the exception type."""
+    try:
+        return asyncio.run(breaker.call(func))
+    except Exception as e:
+        return type(e)
+
+
+def test_breaker_opens_after_threshold_and_recovers_through_one_probe():
+    """Consecutive outages open the circuit; after the timeout one probe decides."""
+    breaker = CircuitBreaker("databricks", "host", failure_threshold=2, recovery_timeout=60)
+    assert call(breaker, unavailable) is PlatformUnavailableError
+    assert breaker.state == CircuitState.CLOSED
+    assert call(breaker, unavailable) is PlatformUnavailableError
+    assert breaker.state == CircuitState.OPEN and breaker.is_open
+    assert call(breaker, answered) is CircuitOpenError
+
+    # Recovery timeout elapsed: the first caller probes, others are still rejected
+    breaker.opened_at -= 61
+    assert not breaker.is_open
+    assert breaker.allow_request()
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert not breaker.allow_request()
+    breaker.release()
+
+    # A failed probe opens the circuit again at once, a successful one closes it
+    assert call(breaker, unavailable) is PlatformUnavailableError
+    assert breaker.state == CircuitState.OPEN
+    breaker.opened_at -= 61
+    assert call(breaker, answered) == "ok"
+    assert breaker.state == CircuitState.CLOSED and breaker.failure_count == 0
+
+
+def test_breaker_ignores_request_errors_and_deadlines():
+    """Errors the platform answered reset the count; a deadline frees the probe slot."""
+    breaker = CircuitBreaker("airbyte", "host", failure_threshold=2)
+    assert call(breaker, unavailable) is PlatformUnavailableError
+    assert call(breaker, rejected) is ValueError
+    assert call(breaker, unavailable) is PlatformUnavailableError
+    assert breaker.state == CircuitState.CLOSED
+
+    async def deadline():
+        raise DeadlineExceededError("cycle deadline")
+
+    breaker.record_failure("503")
+    breaker.opened_at -= breaker.recovery_timeout + 1
+    assert call(breaker, deadline) is DeadlineExceededError
+    assert breaker.state == CircuitState.HALF_OPEN and not breaker.is_open
+
+
+def token_endpoint(status_code: Optional[int]):
+    """Patch httpx so every client answers token requests with status_code, or fails to connect for None."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if status_code is None:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(status_code, text="token endpoint")
+
+    real_client = httpx.AsyncClient
+    transport = httpx.MockTransport(handler)
+    return mock.patch.object(httpx, "AsyncClient", lambda **kwargs: real_client(transport=transport, **kwargs))
+
+
+def test_token_endpoint_outages_count_against_the_circuit():
+    """Connection errors, 5xx and 429 from the token endpoint are outages; other rejections are client errors."""
+    clients = [
+        (PowerAutomateAPIClient("id", "secret", "tenant-pa"), PowerAutomateAPIError),
+        (OutlookAPIClient("id", "secret", "tenant-ol"), OutlookAPIError),
+    ]
+    for client, api_error in clients:
+        cases = ((None, PlatformUnavailableError), (503, PlatformUnavailableError), (429, PlatformUnavailableError), (400, api_error))
+        for status_code, expected in cases:
+            with token_endpoint(status_code):
+                try:
+                    asyncio.run(client._get_access_token())
+                except Exception as e:
+                    assert type(e) is expected, (client, status_code, e)
+                else:
+                    raise AssertionError(f"token request with {status_code} succeeded")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
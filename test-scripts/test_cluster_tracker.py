@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the Databricks cluster state tracker and incremental event pulls.
+Run with pytest or directly; no credentials or network access are needed.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.databricks_api import pull_cluster_events
+from tools.databricks_cluster_tracker import ClusterStateTracker
+
+NOW = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+
+def cluster(cluster_id: str, state: str = "RUNNING", num_workers: int = 2, **extra) -> dict:
+    return dict(cluster_id=cluster_id, cluster_name=f"cluster-{cluster_id}", state=state, num_workers=num_workers, **extra)
+
+
+def event(timestamp: int, kind: str = "RUNNING") -> dict:
+    return {"type": kind, "timestamp": timestamp, "details": {"current_num_workers": 2}}
+
+
+class FakeEventsClient:
+    """Serves /clusters/events pages from a fixed list, recording each request."""
+
+    def __init__(self, events, page_size: int = 2):
+        self.events = events
+        self.page_size = page_size
+        self.requests = []
+
+    async def get_cluster_events(self, cluster_id: str, start_time: int, offset: int = 0):
+        self.requests.append((cluster_id, start_time, offset))
+        if cluster_id == "broken":
+            raise RuntimeError("403")
+        matching = [e for e in self.events if e["timestamp"] >= start_time]
+        page = matching[offset:offset + self.page_size]
+        more = offset + self.page_size < len(matching)
+        return {"events": page, "next_page": {"offset": offset + self.page_size} if more else None}
+
+
+def test_first_snapshot_is_the_baseline_and_later_ones_yield_changes():
+    """Only state changes, resizes, error terminations and created or deleted clusters are reported."""
+    tracker = ClusterStateTracker()
+    assert tracker.update([cluster("a"), cluster("b"), cluster("c")], NOW) == []
+    assert tracker.update([cluster("a"), cluster("b"), cluster("c")], NOW) == []
+
+    transitions = tracker.update([
+        cluster("a", state="TERMINATED", termination_reason={"code": "DRIVER_UNREACHABLE", "type": "CLOUD_FAILURE"}),
+        cluster("b", num_workers=4),
+        cluster("d", state="PENDING"),
+    ], NOW)
+    kinds = {t["cluster_id"]: t["type"] for t in transitions}
+    assert kinds == {"a": "ERROR_TERMINATION", "b": "RESIZED", "d": "CREATED", "c": "DELETED"}
+
+    by_id = {t["cluster_id"]: t for t in transitions}
+    assert by_id["a"]["is_error"] and by_id["a"]["termination_code"] == "DRIVER_UNREACHABLE"
+    assert (by_id["b"]["from_workers"], by_id["b"]["to_workers"]) == (2, 4)
+    assert by_id["c"]["to_state"] is None and by_id["c"]["cluster_name"] == "cluster-c"
+
+    assert tracker.update([cluster("a", state="PENDING")], NOW)[0]["type"] == "STATE_CHANGE"
+    assert [e["type"] for e in tracker.recent_events("a")] == ["ERROR_TERMINATION", "STATE_CHANGE"]
+    assert tracker.recent_events("c") == [] and len(tracker) == 1
+
+
+def test_events_ring_buffer_and_offsets_survive_a_restart():
+    """Each cluster keeps its newest events; offsets and the baseline round-trip through the state file."""
+    tracker = ClusterStateTracker(events_per_cluster=3)
+    tracker.update([cluster("a")], NOW)
+    tracker.add_events("a", [event(ts) for ts in (100, 200, 300, 400)])
+    assert [e["timestamp"] for e in tracker.recent_events("a")] == [200, 300, 400]
+    assert tracker.event_offsets == {"a": 400}
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "clusters.json")
+        tracker.save(path)
+        restored = ClusterStateTracker.load(path, events_per_cluster=3)
+
+    assert restored.to_dict() == tracker.to_dict()
+    assert restored.update([cluster("a")], NOW) == []
+    restored.add_events("a", [event(500)])
+    assert [e["timestamp"] for e in restored.recent_events("a")] == [300, 400, 500]
+
+
+def test_event_pulls_resume_after_the_last_event_seen():
+    """Pages are followed by offset, and the next pull starts after the stored offset."""
+    tracker = ClusterStateTracker()
+    client = FakeEventsClient([event(ts) for ts in (1000, 2000, 3000)])
+
+    assert asyncio.run(pull_cluster_events(client, tracker, ["a", "broken"], since_ms=500)) == 3
+    assert client.requests == [("a", 500, 0), ("a", 500, 2), ("broken", 500, 0)]
+    assert tracker.event_offsets == {"a": 3000}
+
+    client.requests = []
+    assert asyncio.run(pull_cluster_events(client, tracker, ["a"], since_ms=500)) == 0
+    assert client.requests == [("a", 3001, 0)]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the Airbyte connection catalog (TTL and lookup indexes).
+Run with pytest or directly; no credentials or network access are needed.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from models.platform_models import AirbyteConnectionResponse
+from tools.connection_catalog import ConnectionCatalog
+
+
+def connection(connection_id: str, name: str, source_id: str = "src", destination_id: str = "dst") -> AirbyteConnectionResponse:
+    return AirbyteConnectionResponse(
+        connectionId=connection_id, name=name, sourceId=source_id, destinationId=destination_id, status="active",
+    )
+
+
+class Workspace:
+    """Loader returning the current connections and counting loads."""
+
+    def __init__(self, connections):
+        self.connections = list(connections)
+        self.loads = 0
+
+    async def __call__(self):
+        self.loads += 1
+        return list(self.connections)
+
+
+def test_lookups_use_one_load_and_the_indexes():
+    """Every lookup is answered from one load."""
+    workspace = Workspace([connection("1", "Salesforce"), connection("2", "Hubspot", destination_id="dst2")])
+    catalog = ConnectionCatalog(workspace, ttl_seconds=300)
+
+    async def main():
+        assert (await catalog.get_by_id("1")).name == "Salesforce"
+        assert (await catalog.get_by_name("Hubspot")).connection_id == "2"
+        assert await catalog.get_by_name("Missing") is None
+        assert [c.connection_id for c in await catalog.get_by_source("src")] == ["1", "2"]
+        assert [c.connection_id for c in await catalog.get_by_destination("dst2")] == ["2"]
+        assert len(await catalog.all()) == 2
+
+    asyncio.run(main())
+    assert workspace.loads == 1
+
+
+def test_stale_catalog_refreshes_in_background_until_the_hard_expiry():
+    """Past the TTL stale data is served while reloading; past the hard expiry lookups wait."""
+    workspace = Workspace([connection("1", "Salesforce")])
+    catalog = ConnectionCatalog(workspace, ttl_seconds=10, max_stale_seconds=20)
+
+    async def main():
+        await catalog.all()
+        workspace.connections = [connection("1", "Salesforce"), connection("2", "Hubspot")]
+
+        catalog.loaded_at -= 15
+        assert len(await catalog.all()) == 1
+        await catalog._refresh_task
+        assert len(await catalog.all()) == 2
+
+        workspace.connections = [connection("3", "Stripe")]
+        catalog.loaded_at -= 25
+        assert [c.name for c in await catalog.all()] == ["Stripe"]
+
+    asyncio.run(main())
+    assert workspace.loads == 3
+
+
+def test_invalidated_connection_leaves_every_index():
+    """A connection reported missing is dropped at once and the next lookup reloads."""
+    workspace = Workspace([connection("1", "Salesforce"), connection("2", "Hubspot")])
+    catalog = ConnectionCatalog(workspace)
+
+    async def main():
+        await catalog.all()
+        workspace.connections = [connection("2", "Hubspot")]
+        catalog.invalidate("1")
+        assert catalog._by_name.keys() == {"Hubspot"}
+        assert [c.connection_id for c in catalog._by_source["src"]] == ["2"]
+        assert await catalog.get_by_id("1") is None
+
+    asyncio.run(main())
+    assert workspace.loads == 2
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
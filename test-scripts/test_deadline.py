@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Offline tests for cycle deadlines and partial-result assembly.
+Run with pytest or directly; no credentials or network access are needed.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from models.job_status import JobStatus, JobStatusRecord, PlatformType
+from tools.deadline import (
+    Deadline,
+    DeadlineExceededError,
+    deadline_scope,
+    request_timeout,
+    sleep_before_retry,
+    statement_timeout,
+)
+from tools.monitoring_cycle import MonitoringCycle, cycle_scope, report_platform_records
+
+
+def raises_deadline(func, *args) -> bool:
+    """Whether calling func raises DeadlineExceededError."""
+    try:
+        func(*args)
+    except DeadlineExceededError:
+        return True
+    return False
+
+
+def test_timeouts_are_clamped_to_the_current_deadline():
+    """Inside a scope timeouts shrink to the time left; outside they are unchanged."""
+    assert request_timeout(30.0, "GET /jobs") == 30.0
+    assert statement_timeout("query") is None
+
+    with deadline_scope(Deadline(5.0)):
+        assert 4.0 < request_timeout(30.0, "GET /jobs") <= 5.0
+        assert request_timeout(1.0, "GET /jobs") == 1.0
+        assert statement_timeout("query") in (4, 5)
+
+    with deadline_scope(Deadline(0.0)):
+        assert raises_deadline(request_timeout, 30.0, "GET /jobs")
+        assert raises_deadline(statement_timeout, "query")
+
+
+def test_reserve_and_retry_backoff_respect_the_budget():
+    """A reserve ends early; a backoff longer than the time left fails at once."""
+    deadline = Deadline(10.0)
+    collection = deadline.reserve(4.0, "collection")
+    assert collection.expires_at == deadline.expires_at - 4.0
+    assert collection.label == "collection"
+    assert deadline.reserve(20.0).expired
+
+    async def retry():
+        with deadline_scope(Deadline(0.5)):
+            await sleep_before_retry(0.01, "GET /jobs")
+            await sleep_before_retry(1.0, "GET /jobs")
+
+    try:
+        asyncio.run(retry())
+    except DeadlineExceededError as e:
+        assert "retry GET /jobs" in str(e)
+    else:
+        raise AssertionError("backoff past the deadline was allowed")
+
+
+def test_partial_result_lists_missing_platforms():
+    """A cycle cut short reports what it collected and which platforms are missing."""
+    cycle = MonitoringCycle(
+        monitoring_id="mon_test",
+        deadline=Deadline(60.0),
+        expected_platforms=[PlatformType.AIRBYTE, PlatformType.DATABRICKS],
+        finalize_reserve_seconds=10.0,
+    )
+    with cycle_scope(cycle):
+        assert 49.0 < request_timeout(60.0, "GET /jobs") <= 50.0
+        report_platform_records(PlatformType.AIRBYTE, [
+            JobStatusRecord(job_id="1", platform=PlatformType.AIRBYTE, job_name="Sync", status=JobStatus.FAILED),
+            JobStatusRecord(job_id="2", platform=PlatformType.AIRBYTE, job_name="Load", status=JobStatus.SUCCESS),
+        ])
+
+    result = cycle.build_monitoring_result()
+    assert result.errors == ["Missing databricks results: cycle deadline reached"]
+    assert result.overall_assessment.failed_jobs_count == 1
+    assert result.overall_assessment.requires_notification
+    assert [s.issues for s in result.platform_summaries] == [["Sync failed"]]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the cross-platform pipeline dependency graph.
+Run with pytest or directly; no credentials or network access are needed.
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from analytics.dependency_graph import PipelineGraph
+from models.job_status import JobStatus, JobStatusRecord, PlatformType
+
+BASE = datetime(2024, 1, 15, tzinfo=timezone.utc)
+NOW = BASE + timedelta(hours=12)
+
+GRAPH = {
+    "jobs": [{"job": "airbyte:Other", "max_staleness_minutes": 60}],
+    "dependencies": [
+        ["airbyte:Sync", "databricks:Transform"],
+        ["airbyte:Other", "databricks:Transform"],
+        ["databricks:Transform", "snowflake_task:Publish"],
+        ["snowflake_task:Publish", "power_automate:Notify"],
+    ],
+}
+
+
+def run(platform: PlatformType, job_name: str, hours: float, status: JobStatus, error=None) -> JobStatusRecord:
+    return JobStatusRecord(
+        job_id=f"{job_name}_{hours}", platform=platform, job_name=job_name, status=status,
+        last_run_time=BASE + timedelta(hours=hours), error_message=error,
+    )
+
+
+def test_downstream_failures_fold_into_one_incident():
+    """A failed source and the failure it caused are one incident; unfinished jobs are at risk."""
+    analysis = PipelineGraph.from_dict(GRAPH).analyze([
+        run(PlatformType.AIRBYTE, "Sync", 10, JobStatus.SUCCESS),
+        run(PlatformType.AIRBYTE, "Sync", 11, JobStatus.FAILED, "source unreachable"),
+        run(PlatformType.DATABRICKS, "Transform", 11.5, JobStatus.FAILED, "missing input"),
+        run(PlatformType.AIRBYTE, "Other", 11.5, JobStatus.SUCCESS),
+        run(PlatformType.AIRBYTE, "Unrelated", 11, JobStatus.FAILED),
+    ], now=NOW)
+
+    assert len(analysis.incidents) == 1
+    incident = analysis.incidents[0]
+    assert (incident.root_cause, incident.root_error) == ("airbyte:Sync", "source unreachable")
+    assert incident.failed_downstream == ["databricks:Transform"]
+    assert incident.impacted_downstream == ["snowflake_task:Publish", "power_automate:Notify"]
+    assert incident.platforms == ["airbyte", "databricks"]
+    assert incident.describe() == "airbyte:Sync failed, causing 1 downstream failures, 2 more downstream jobs at risk"
+    assert analysis.stale_jobs == []
+    assert analysis.unmonitored_jobs == ["snowflake_task:Publish", "power_automate:Notify"]
+
+
+def test_stale_jobs_are_reported_with_everything_downstream():
+    """A job without a recent success is stale, and its descendants list it as a stale upstream."""
+    analysis = PipelineGraph.from_dict(GRAPH).analyze([
+        run(PlatformType.AIRBYTE, "Other", 9, JobStatus.SUCCESS),
+        run(PlatformType.AIRBYTE, "Other", 11.5, JobStatus.FAILED),
+        run(PlatformType.AIRBYTE, "Sync", 11, JobStatus.SUCCESS),
+    ], now=NOW)
+
+    assert analysis.stale_jobs == ["airbyte:Other"]
+    assert analysis.stale_upstream == {
+        "databricks:Transform": ["airbyte:Other"],
+        "snowflake_task:Publish": ["airbyte:Other"],
+        "power_automate:Notify": ["airbyte:Other"],
+    }
+    assert [i.root_cause for i in analysis.incidents] == ["airbyte:Other"]
+
+
+def test_invalid_definitions_are_rejected():
+    """Cycles, unknown platforms and malformed references fail to load."""
+    for config in (
+        {"dependencies": [["airbyte:A", "databricks:B"], ["databricks:B", "airbyte:A"]]},
+        {"dependencies": [["mainframe:A", "databricks:B"]]},
+        {"jobs": [{"job": "airbyte"}]},
+    ):
+        try:
+            PipelineGraph.from_dict(config)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{config} was accepted")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Offline tests for error fingerprinting and clustering.
+Run with pytest or directly; no credentials or network access are needed.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from analytics.error_fingerprints import (
+    ErrorFingerprintStore,
+    categorize_error,
+    cluster_errors,
+    fingerprint_error,
+    normalize_error,
+)
+from models.job_status import JobStatus, JobStatusRecord, PlatformType
+
+
+def failure(job_id: str, message: str, platform: PlatformType = PlatformType.DATABRICKS) -> JobStatusRecord:
+    return JobStatusRecord(
+        job_id=job_id, platform=platform, job_name=f"job-{job_id}", status=JobStatus.FAILED, error_message=message,
+    )
+
+
+def test_variable_tokens_are_normalized():
+    """IDs, times, paths, URLs, numbers and quoted values become placeholders."""
+    message = (
+        "Run 8f14e45f-ceea-467f-a9f5-6e2b8d9a7c01 failed at 2024-01-15T12:00:00Z reading "
+        "/mnt/raw/orders.csv from https://host/api?id=7 for 'acme':   exit 137 (0xdeadbeef1)"
+    )
+    assert normalize_error(message) == (
+        "run <uuid> failed at <ts> reading <path> from <url> for <str>: exit <num> (<hex>)"
+    )
+    assert normalize_error("User ops@example.com from 10.0.0.12:443") == "user <email> from <ip>"
+
+
+def test_messages_differing_only_in_variables_share_a_signature():
+    first, template = fingerprint_error("Timeout after 30s on cluster 0115-a1b2c3")
+    second, _ = fingerprint_error("TIMEOUT after 45s on cluster 0116-ffee99")
+    other, _ = fingerprint_error("Table 'orders' not found")
+    assert first == second != other
+    assert len(first) == 16 and template == "timeout after <num>s on cluster <num>-<hex>"
+
+
+def test_categories_follow_priority_order():
+    assert categorize_error("Connection timed out") == "timeout"
+    assert categorize_error("HTTP 429 Too Many Requests") == "rate_limit"
+    assert categorize_error("403 Forbidden") == "permission"
+    assert categorize_error("java.lang.OutOfMemoryError: Java heap space") == "out_of_memory"
+    assert categorize_error("something odd") == "other"
+
+
+def test_clusters_rank_failures_and_store_skips_seen_runs():
+    records = [
+        failure("1", "Timeout after 30s"),
+        failure("2", "Timeout after 60s", PlatformType.AIRBYTE),
+        failure("3", "Table 'orders' not found"),
+        JobStatusRecord(job_id="4", platform=PlatformType.AIRBYTE, job_name="ok", status=JobStatus.SUCCESS, error_message="ignored"),
+    ]
+    clusters = cluster_errors(records)
+    assert [c.count for c in clusters] == [2, 1]
+    assert clusters[0].platforms == ["databricks", "airbyte"]
+    assert clusters[0].job_names == ["job-1", "job-2"]
+
+    store = ErrorFingerprintStore()
+    store.observe_records(records)
+    store.observe_records(records + [failure("5", "Timeout after 90s")])
+    assert [c.count for c in store.ranked()] == [3, 1]
+
+    restored = ErrorFingerprintStore()
+    restored.load_state(store.to_dict())
+    assert restored.observe_records(records) == []
+    assert [c.count for c in restored.ranked()] == [3, 1]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
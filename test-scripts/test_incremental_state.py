@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the incremental polling state (watermarks and caches).
+Run with pytest or directly; no credentials or network access are needed.
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from analytics.duration_anomaly import DurationAnomalyDetector
+from models.job_status import JobStatus, JobStatusRecord, PlatformType
+from models.platform_models import DatabricksJobRun, SnowflakeTaskHistory, SnowflakeTaskInfo
+from models.timestamps import utc_now
+from tools.databricks_api import RunWatermark, run_watermark_path
+from tools.local_history import LocalHistoryStore
+from tools.snowflake_task_api import TaskHistoryWatermark
+from tools.snowflake_task_catalog import TaskCatalog
+
+BASE = datetime(2024, 1, 15, tzinfo=timezone.utc)
+
+
+def task_run(name: str, minute: int, state: str = "SUCCEEDED") -> SnowflakeTaskHistory:
+    """One finished run of a task, scheduled at BASE + minute."""
+    scheduled = BASE + timedelta(minutes=minute)
+    return SnowflakeTaskHistory(
+        name=name,
+        database_name="DB",
+        schema_name="S",
+        state=state,
+        scheduled_time=scheduled,
+        completed_time=scheduled + timedelta(seconds=30),
+    )
+
+
+def newest_first(rows: list) -> list:
+    """Rows in TASK_HISTORY order (ORDER BY SCHEDULED_TIME DESC)."""
+    return sorted(rows, key=lambda row: row.scheduled_time, reverse=True)
+
+
+def poll(watermark: TaskHistoryWatermark, rows: list, minute: int) -> list:
+    """Filter a poll, then advance the watermark past it as a reported cycle does."""
+    emitted = watermark.filter_new(newest_first(rows))
+    watermark.advance(rows, BASE + timedelta(minutes=minute))
+    return emitted
+
+
+def test_snowflake_watermark_keeps_every_run_of_a_task():
+    """Several runs of one task in a poll are all emitted, including older failures."""
+    watermark = TaskHistoryWatermark()
+    first = [task_run("T", minute, "FAILED" if minute == 2 else "SUCCEEDED") for minute in range(6)]
+    
+    # Nothing moves until the poll is advanced
+    assert len(watermark.filter_new(newest_first(first))) == 6
+    emitted = poll(watermark, first, 10)
+    assert len(emitted) == 6
+    assert [row.state for row in emitted].count("FAILED") == 1
+    
+    # The next poll re-reads the overlap and sees three new runs, one failed
+    second = first + [task_run("T", minute, "FAILED" if minute == 7 else "SUCCEEDED") for minute in (6, 7, 8)]
+    emitted = poll(watermark, second, 20)
+    assert sorted(row.scheduled_time for row in emitted) == [BASE + timedelta(minutes=m) for m in (6, 7, 8)]
+    assert [row.state for row in emitted].count("FAILED") == 1
+    
+    # Nothing new: nothing emitted
+    assert poll(watermark, second, 30) == []
+
+
+def test_snowflake_watermark_emits_runs_without_completed_time_once():
+    """A finished run without a completed time is emitted once, also after a restart."""
+    watermark = TaskHistoryWatermark()
+    cancelled = task_run("T", 1, "CANCELLED")
+    cancelled.completed_time = None
+    assert poll(watermark, [cancelled], 10) == [cancelled]
+    
+    restored = TaskHistoryWatermark()
+    restored.load_state(watermark.to_dict())
+    assert poll(restored, [cancelled], 20) == []
+
+
+def test_databricks_watermark_advances_only_when_told():
+    """filter_new leaves the watermark alone until the poll is advanced."""
+    def run(run_id: int, life_cycle_state: str) -> DatabricksJobRun:
+        return DatabricksJobRun(
+            run_id=run_id, job_id=1, state={"life_cycle_state": life_cycle_state},
+            start_time=int(BASE.timestamp() * 1000),
+        )
+    
+    now = BASE + timedelta(minutes=10)
+    watermark = RunWatermark(max_lookback_hours=1)
+    listed = [run(1, "TERMINATED"), run(2, "RUNNING"), run(1, "TERMINATED")]
+    assert [r.run_id for r in watermark.filter_new(listed)] == [1, 2]
+    # A cycle that failed before advancing sees the same runs again
+    assert [r.run_id for r in watermark.filter_new(listed)] == [1, 2]
+    
+    watermark.advance(listed, now)
+    assert watermark.filter_new(listed) == []
+    assert [r.run_id for r in watermark.filter_new([run(2, "TERMINATED")])] == [2]
+    
+    assert run_watermark_path("state/w.json") == "state/w.json"
+    assert run_watermark_path("state/w.json", 42) == "state/w.job_42.json"
+
+
+def test_local_history_counts_each_run_once():
+    """A run re-collected every cycle counts once in the failure summary."""
+    store = LocalHistoryStore(":memory:")
+    now = utc_now()
+    for cycle in range(5):
+        checked_at = now - timedelta(minutes=15 * (5 - cycle))
+        records = [
+            JobStatusRecord(
+                job_id="airbyte_1", platform=PlatformType.AIRBYTE, job_name="Sync",
+                status=JobStatus.FAILED, checked_at=checked_at,
+            ),
+            JobStatusRecord(
+                job_id="airbyte_2", platform=PlatformType.AIRBYTE, job_name="Sync",
+                status=JobStatus.RUNNING if cycle < 2 else JobStatus.SUCCESS, checked_at=checked_at,
+            ),
+        ]
+        store.record_cycle(f"mon_{cycle}", checked_at, records)
+    
+    summary = store.failure_summary(hours_back=24)
+    assert len(summary) == 1
+    assert (summary[0]["runs"], summary[0]["failures"]) == (2, 1)
+    store.close()
+
+
+def test_task_catalog_keeps_definition_changes_as_events():
+    """Definition changes go to the catalog's event list and survive a restart."""
+    def task(definition: str) -> SnowflakeTaskInfo:
+        return SnowflakeTaskInfo(name="T", database_name="DB", schema_name="S", state="started", definition=definition)
+    
+    catalog = TaskCatalog()
+    assert catalog.update([task("SELECT 1")]) == []
+    changes = catalog.update([task("SELECT 2")])
+    assert [(c.task_name, c.change_type, c.changed_fields) for c in changes] == [("DB.S.T", "modified", ["definition"])]
+    catalog.remove_missing([], lambda name: True)
+    assert [c.change_type for c in catalog.recent_changes()] == ["modified", "removed"]
+    assert catalog.recent_changes(since=changes[0].detected_at) == catalog.recent_changes()[1:]
+    
+    now = utc_now()
+    assert not catalog.refresh_due(now, 0)
+    assert catalog.refresh_due(now, 60)
+    catalog.refreshed_at = now
+    assert not catalog.refresh_due(now + timedelta(minutes=59), 60)
+    assert catalog.refresh_due(now + timedelta(minutes=60), 60)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "catalog.json")
+        catalog.save(path)
+        restored = TaskCatalog.load(path)
+    assert [c.change_type for c in restored.recent_changes()] == ["modified", "removed"]
+    assert restored.refreshed_at == now
+
+
+def test_duration_baselines_skip_failed_and_cancelled_runs():
+    """Only successful runs are checked against and learned into a baseline."""
+    detector = DurationAnomalyDetector(min_samples=3)
+    
+    def observe(minute: int, status: JobStatus, duration: float):
+        return detector.observe(JobStatusRecord(
+            job_id=f"airbyte_{minute}", platform=PlatformType.AIRBYTE, job_name="Sync", status=status,
+            last_run_time=BASE + timedelta(minutes=minute), duration_seconds=duration,
+        ))
+    
+    for minute in range(5):
+        assert observe(minute, JobStatus.SUCCESS, 100.0 + minute) is None
+    # A run that failed after a few seconds or was cancelled mid-run is not a duration anomaly
+    assert observe(5, JobStatus.FAILED, 2.0) is None
+    assert observe(6, JobStatus.CANCELLED, 900.0) is None
+    assert observe(7, JobStatus.SUCCESS, 900.0).direction == "slow"
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
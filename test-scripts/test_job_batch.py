@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the columnar JobStatusBatch.
+Run with pytest or directly; no credentials or network access are needed.
+"""
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from models.job_batch import JobStatusBatch
+from models.job_status import JobStatus, JobStatusRecord, PlatformType
+
+CHECKED_AT = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+
+def sample_records() -> list:
+    return [
+        JobStatusRecord(
+            job_id="101", platform=PlatformType.DATABRICKS, job_name="Transform",
+            status=JobStatus.FAILED, last_run_time=datetime(2024, 1, 15, 11, 0, tzinfo=timezone.utc),
+            duration_seconds=120, error_message="OOM", metadata={"cluster": "c1"}, checked_at=CHECKED_AT,
+        ),
+        JobStatusRecord(
+            job_id="sync-1", platform=PlatformType.AIRBYTE, job_name="Salesforce",
+            status=JobStatus.SUCCESS, checked_at=CHECKED_AT,
+        ),
+    ]
+
+
+def test_records_and_dicts_round_trip():
+    """Records survive batch -> records and batch -> dicts -> batch unchanged."""
+    records = sample_records()
+    batch = JobStatusBatch.from_records(records)
+    assert len(batch) == 2
+    assert [r.model_dump() for r in batch.to_records()] == [r.model_dump() for r in records]
+
+    rows = batch.to_dicts()
+    assert rows[0]["last_run_time"] == "2024-01-15T11:00:00+00:00"
+    assert rows[1]["duration_seconds"] is None and rows[1]["metadata"] == {}
+    assert JobStatusBatch.from_dicts(rows).to_dicts() == rows
+
+    assert batch.status_counts() == {JobStatus.FAILED: 1, JobStatus.SUCCESS: 1}
+    batch.extend(JobStatusBatch.from_records(records[:1]))
+    assert batch.error_messages == {0: "OOM", 2: "OOM"}
+
+
+def test_bind_rows_follow_the_table_columns():
+    """Bind rows carry the record ID, enum values and JSON metadata."""
+    row = JobStatusBatch.from_records(sample_records()).to_bind_rows()[0]
+    assert row[0] == f"databricks_101_{int(CHECKED_AT.timestamp())}"
+    assert row[1:5] == ["101", "databricks", "Transform", "failed"]
+    assert row[6:9] == [120, "OOM", '{"cluster":"c1"}']
+    assert row[9] == CHECKED_AT
+
+
+def test_invalid_rows_are_rejected_like_the_model_would():
+    """Missing names, unknown enums and bad durations are skipped; numeric strings are coerced."""
+    base = {"job_id": "1", "platform": "airbyte", "job_name": "Sync", "status": "success"}
+    rows = [
+        dict(base, duration_seconds="120"),
+        dict(base, job_name=None),
+        dict(base, job_id=7),
+        dict(base, status="exploded"),
+        dict(base, duration_seconds="slow"),
+        dict(base, duration_seconds=-5),
+    ]
+    batch = JobStatusBatch.from_dicts(rows, skip_invalid=True)
+    assert len(batch) == 1 and batch.duration(0) == 120
+
+    try:
+        JobStatusBatch.from_dicts(rows[1:2])
+    except ValueError as e:
+        assert "Invalid job record" in str(e)
+    else:
+        raise AssertionError("row without job_name was accepted")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
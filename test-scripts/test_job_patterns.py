@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the vectorized job pattern analysis.
+Run with pytest or directly; no credentials or network access are needed.
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from analytics.job_patterns import analyze_jobs
+from models.job_batch import JobStatusBatch
+from models.job_status import JobStatus, JobStatusRecord, PlatformType
+
+BASE = datetime(2024, 1, 15, tzinfo=timezone.utc)
+
+
+def run(job_name: str, hour: int, status: JobStatus, duration=None, error=None) -> JobStatusRecord:
+    return JobStatusRecord(
+        job_id=f"{job_name}_{hour}", platform=PlatformType.DATABRICKS, job_name=job_name, status=status,
+        last_run_time=BASE + timedelta(hours=hour), duration_seconds=duration, error_message=error,
+        checked_at=BASE,
+    )
+
+
+def sample_records() -> list:
+    """Load ends on two failures in a row; Extract failed once and recovered; Report is running."""
+    return [
+        run("Load", 3, JobStatus.FAILED, 30, "Timeout after 45s on cluster 0115-a1b2c3"),
+        run("Extract", 1, JobStatus.FAILED, 40, "Permission denied for user 'etl'"),
+        run("Load", 1, JobStatus.SUCCESS, 10),
+        run("Load", 2, JobStatus.FAILED, 20, "Timeout after 30s on cluster 0115-d4e5f6"),
+        run("Extract", 2, JobStatus.SUCCESS, 50),
+        run("Report", 3, JobStatus.RUNNING),
+    ]
+
+
+def without_timestamp(result: dict) -> dict:
+    return {key: value for key, value in result.items() if key != "analysis_timestamp"}
+
+
+def test_counts_durations_streaks_and_errors():
+    result = analyze_jobs(sample_records())
+    assert (result["total_jobs"], result["successful_jobs"], result["failed_jobs"], result["running_jobs"]) == (6, 2, 3, 1)
+    assert (result["success_rate"], result["failure_rate"]) == (33.33, 50.0)
+    assert result["avg_duration_seconds"] == 30.0
+    assert result["p50_duration_seconds"] == 30.0 and result["max_duration_seconds"] == 50.0
+
+    # Streaks follow run time, not input order
+    assert result["failed_job_names"] == ["Extract", "Load"]
+    assert result["failure_streaks"] == [{"job_name": "Load", "current_streak": 2, "longest_streak": 2}]
+
+    assert result["error_patterns"] == {"timeout": 2, "permission": 1}
+    top = result["error_clusters"][0]
+    assert (top["category"], top["count"]) == ("timeout", 2)
+
+
+def test_every_input_form_gives_the_same_analysis():
+    """Records, agent dictionaries and a JobStatusBatch are analyzed identically."""
+    records = sample_records()
+    batch = JobStatusBatch.from_records(records)
+    expected = without_timestamp(analyze_jobs(records))
+    assert without_timestamp(analyze_jobs(batch)) == expected
+    assert without_timestamp(analyze_jobs(batch.to_dicts())) == expected
+
+
+def test_empty_and_unknown_input():
+    """No jobs gives zero rates; unrecognized statuses count as unknown."""
+    empty = analyze_jobs([])
+    assert empty["total_jobs"] == 0 and empty["success_rate"] == 0.0
+    assert empty["p95_duration_seconds"] is None and empty["failure_streaks"] == []
+
+    result = analyze_jobs([{"job_name": "x", "status": "exploded", "duration_seconds": 0}])
+    assert result["status_counts"]["unknown"] == 1
+    assert result["avg_duration_seconds"] == 0.0
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Offline tests for multi-instance monitoring (instance scoping and configuration).
+Run with pytest or directly; no credentials or network access are needed.
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from analytics.dependency_graph import PipelineGraph
+from analytics.duration_anomaly import DurationAnomalyDetector
+from config.instances import parse_instances
+from models.job_status import JobStatus, JobStatusRecord, PlatformType
+from tools.deadline import Deadline
+from tools.instance_context import (
+    current_instance,
+    instance_key,
+    instance_scope,
+    instance_state_path,
+    run_limited,
+    tag_instance_records,
+)
+from tools.monitoring_cycle import MonitoringCycle, cycle_scope, report_platform_records
+
+
+def record(job_id: str, **metadata) -> JobStatusRecord:
+    """A failed Databricks record with optional metadata."""
+    return JobStatusRecord(
+        job_id=job_id, platform=PlatformType.DATABRICKS, job_name="Job",
+        status=JobStatus.FAILED, metadata=metadata,
+    )
+
+
+def test_instance_scope_isolates_state_keys_and_job_ids():
+    """Inside a scope, state paths, keys and job IDs carry the instance; outside nothing changes."""
+    path = os.path.join("monitoring_state", "watermark.json")
+    assert current_instance() is None
+    assert instance_state_path(path) == path
+    assert instance_key("databricks@host") == "databricks@host"
+
+    # "default" is an ordinary name and must not share the unscoped state
+    for name in ("dbx-prod", "default"):
+        with instance_scope(name):
+            assert current_instance() == name
+            assert instance_state_path(path) == os.path.join("monitoring_state", name, "watermark.json")
+            assert instance_key("databricks@host") == f"databricks@host#{name}"
+            records = [record("databricks_1_task", parent_job_id="databricks_1")]
+            tag_instance_records(records)
+            tag_instance_records(records)
+            assert records[0].job_id == f"{name}:databricks_1_task"
+            assert records[0].metadata["parent_job_id"] == f"{name}:databricks_1"
+            assert records[0].metadata["instance"] == name
+    assert current_instance() is None
+
+
+def test_run_limited_bounds_requests_per_instance():
+    """At most max_concurrency requests of an instance are in flight."""
+    in_flight = peak = 0
+
+    async def request(_):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    async def main():
+        with instance_scope("a", max_concurrency=2):
+            await asyncio.gather(*(run_limited(request, i) for i in range(6)))
+
+    asyncio.run(main())
+    assert peak == 2
+
+
+def test_parse_instances_skips_bad_entries():
+    """Bad entries are left out; valid ones get their ${VAR} references expanded."""
+    os.environ["TEST_INSTANCE_TOKEN"] = "secret"
+    os.environ.pop("TEST_INSTANCE_MISSING", None)
+    instances = parse_instances({"instances": [
+        {"name": "prod", "platform": "databricks", "options": {"api_key": "${TEST_INSTANCE_TOKEN}"}},
+        {"name": "prod", "platform": "databricks"},
+        {"name": "prod", "platform": "airbyte"},
+        {"name": "bad name", "platform": "airbyte"},
+        {"name": "unset", "platform": "airbyte", "options": {"api_key": "${TEST_INSTANCE_MISSING}"}},
+        {"name": "x", "platform": "unknown"},
+        "not an object",
+    ]})
+    assert [(i.platform, i.name) for i in instances] == [
+        (PlatformType.DATABRICKS, "prod"),
+        (PlatformType.AIRBYTE, "prod"),
+    ]
+    assert instances[0].options == {"api_key": "secret"}
+
+
+def test_duration_baselines_are_kept_per_instance():
+    """The same job in two instances learns separate baselines, and v1 state loads as unscoped."""
+    detector = DurationAnomalyDetector(min_samples=3)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for i in range(5):
+        for instance, duration in (("fast", 60), ("slow", 600)):
+            run = JobStatusRecord(
+                job_id=f"{instance}:databricks_{i}", platform=PlatformType.DATABRICKS, job_name="Job",
+                status=JobStatus.SUCCESS, duration_seconds=duration,
+                last_run_time=start + timedelta(hours=i), metadata={"instance": instance},
+            )
+            assert detector.observe(run) is None
+    assert set(detector.baselines) == {("databricks", "fast", "Job"), ("databricks", "slow", "Job")}
+
+    restored = DurationAnomalyDetector()
+    restored.load_state(detector.to_dict())
+    assert set(restored.baselines) == set(detector.baselines)
+    restored.load_state({"version": 1, "baselines": [["databricks", "Job", 60.0, 0.0, 5, 0.0]]})
+    assert list(restored.baselines) == [("databricks", "", "Job")]
+
+
+def test_graph_nodes_are_matched_per_instance():
+    """A failure in one instance does not mark the same-named job of another instance failed."""
+    graph = PipelineGraph.from_dict({
+        "jobs": [{"job": "databricks@dbx-prod:Job"}, {"job": "databricks@dbx-dev:Job"}],
+        "dependencies": [["databricks@dbx-prod:Job", "airbyte:Sync"]],
+    })
+    analysis = graph.analyze([
+        record("dbx-prod:databricks_1", instance="dbx-prod"),
+        JobStatusRecord(
+            job_id="dbx-dev:databricks_1", platform=PlatformType.DATABRICKS, job_name="Job",
+            status=JobStatus.SUCCESS, metadata={"instance": "dbx-dev"},
+        ),
+    ])
+    assert [i.root_cause for i in analysis.incidents] == ["databricks@dbx-prod:Job"]
+    assert analysis.incidents[0].impacted_downstream == ["airbyte:Sync"]
+    assert analysis.unmonitored_jobs == ["airbyte:Sync"]
+
+
+def test_correlated_failures_are_reported_once_per_instance():
+    """A failure explained by a failed upstream in the same instance is reported under the root cause only."""
+    graph = PipelineGraph.from_dict({
+        "dependencies": [["databricks@dbx-prod:Job", "databricks@dbx-prod:Publish"]],
+    })
+    cycle = MonitoringCycle("mon_test", Deadline(60.0), [PlatformType.DATABRICKS], pipeline_graph=graph)
+    with cycle_scope(cycle), instance_scope("dbx-prod"):
+        report_platform_records(PlatformType.DATABRICKS, [
+            record("databricks_1"),
+            JobStatusRecord(
+                job_id="databricks_2", platform=PlatformType.DATABRICKS, job_name="Publish",
+                status=JobStatus.FAILED,
+            ),
+        ])
+    result = cycle.build_monitoring_result()
+    assert result.platform_summaries[0].issues == ["Job failed"]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Offline tests for request coalescing and the per-cycle response memo.
+Run with pytest or directly; no credentials or network access are needed.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools.request_coalescing import (
+    RequestCoalescer,
+    coalesce_request,
+    coalescing_scope,
+    wait_for_shared_requests,
+)
+
+URL = "https://example.com/api/jobs"
+
+
+class FakeClient:
+    """Client whose requests take a moment and fail once it is closed."""
+
+    def __init__(self):
+        self.calls = 0
+        self.closed = False
+
+    async def send(self, method: str):
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        if self.closed:
+            raise RuntimeError("client closed")
+        return {"jobs": [1, 2], "method": method}
+
+    def request(self, method: str = "GET", **kwargs):
+        return coalesce_request(method, URL, {"limit": 2}, "identity", self.send, method, **kwargs)
+
+    async def close(self):
+        await wait_for_shared_requests(self)
+        self.closed = True
+
+
+def test_identical_requests_share_one_call_and_get_own_copies():
+    """Concurrent GETs make one call; POSTs are never shared."""
+    client = FakeClient()
+    coalescer = RequestCoalescer()
+
+    async def main():
+        with coalescing_scope(coalescer):
+            first, second = await asyncio.gather(client.request(), client.request())
+            first["jobs"].append(3)
+            assert second["jobs"] == [1, 2]
+            await asyncio.gather(client.request("POST"), client.request("POST"))
+
+    asyncio.run(main())
+    assert client.calls == 3
+    assert coalescer.stats() == {"network_calls": 1, "coalesced_calls": 1, "memo_hits": 0}
+
+
+def test_memo_reuses_responses_until_the_ttl_expires():
+    """Repeat requests within the TTL are served from the memo."""
+    client = FakeClient()
+    coalescer = RequestCoalescer(memo_ttl=60)
+
+    async def main():
+        with coalescing_scope(coalescer):
+            await client.request()
+            await client.request()
+            for key, (_, value) in coalescer._memo.items():
+                coalescer._memo[key] = (0.0, value)
+            await client.request()
+
+    asyncio.run(main())
+    assert client.calls == 2
+    assert coalescer.memo_hits == 1
+
+
+def test_shared_request_survives_its_first_caller():
+    """Cancelling the caller that started a request, or closing its client, does not fail the others."""
+    owner, other = FakeClient(), FakeClient()
+    coalescer = RequestCoalescer()
+
+    async def cancelled_caller():
+        try:
+            await asyncio.wait_for(owner.request(owner=owner), timeout=0.005)
+        finally:
+            await owner.close()
+
+    async def main():
+        with coalescing_scope(coalescer):
+            started = asyncio.ensure_future(cancelled_caller())
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(other.request())
+            results = await asyncio.gather(started, waiter, return_exceptions=True)
+            assert isinstance(results[0], asyncio.TimeoutError)
+            assert results[1]["jobs"] == [1, 2]
+
+    asyncio.run(main())
+    assert owner.calls == 1 and other.calls == 0
+    assert owner.closed
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the JSON serialization layer.
+Run with pytest or directly; no credentials or network access are needed.
+"""
+
+import os
+import sys
+import tempfile
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from models.job_status import JobStatus, JobStatusRecord, PlatformType
+from models.serialization import JSONSerializer, dump_file, orjson, set_json_backend
+
+PAYLOAD = {
+    "job": JobStatusRecord(
+        job_id="1", platform=PlatformType.AIRBYTE, job_name="Sync", status=JobStatus.SUCCESS,
+        checked_at=datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc),
+    ),
+    "status": JobStatus.FAILED,
+    "run_date": date(2024, 1, 15),
+    "started": datetime(2024, 1, 15, 12, 0, 30, tzinfo=timezone.utc),
+    "tags": {"nightly"},
+    "name": "Zürich ✓",
+    "raw": b"bytes",
+    "nested": {"b": [1, 2.5, None, True], "a": {}},
+}
+
+
+def backends() -> list:
+    """Serializers for every backend available here."""
+    return [JSONSerializer("json")] + ([JSONSerializer("orjson")] if orjson is not None else [])
+
+
+def test_backends_produce_identical_output():
+    """Both backends encode every supported type the same way, in every layout."""
+    outputs = {
+        (serializer.backend, indent, sort_keys): serializer.dumps_bytes(PAYLOAD, indent=indent, sort_keys=sort_keys)
+        for serializer in backends()
+        for indent in (False, True)
+        for sort_keys in (False, True)
+    }
+    for (backend, indent, sort_keys), output in outputs.items():
+        assert output == outputs[("json", indent, sort_keys)], (backend, indent, sort_keys)
+
+    decoded = JSONSerializer("json").loads(outputs[("json", False, True)])
+    assert decoded["status"] == "failed"
+    assert decoded["started"] == "2024-01-15T12:00:30+00:00"
+    assert decoded["job"]["platform"] == "airbyte"
+    assert decoded["tags"] == ["nightly"] and decoded["raw"] == "bytes"
+    assert list(decoded["nested"]) == ["a", "b"]
+
+
+def test_round_trip_through_a_file_with_either_backend():
+    """Files written by one backend load with the other."""
+    serializers = backends()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "results.json")
+        for writer in serializers:
+            set_json_backend(writer.backend)
+            try:
+                dump_file({"name": "Zürich", "counts": [1, 2]}, path)
+            finally:
+                set_json_backend(None)
+            for reader in serializers:
+                with open(path, "rb") as f:
+                    assert reader.loads(f.read()) == {"name": "Zürich", "counts": [1, 2]}
+
+
+def test_unknown_backend_is_rejected():
+    try:
+        JSONSerializer("yaml")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown backend accepted")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Offline tests for platform status mapping and drift counting.
+Run with pytest or directly; no credentials or network access are needed.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from models.job_status import JobStatus, PlatformType
+from models.status_mapping import (
+    AIRBYTE_STATUS_MAP,
+    map_airbyte_status,
+    map_databricks_status,
+    map_powerautomate_status,
+    map_snowflake_task_status,
+    map_statuses,
+    reset_unmapped_status_counts,
+    unmapped_status_counts,
+)
+
+
+def test_mappers_return_job_status_members():
+    """Raw states map case-insensitively to JobStatus members."""
+    assert map_airbyte_status("SUCCEEDED") is JobStatus.SUCCESS
+    assert map_airbyte_status("incomplete") is JobStatus.RUNNING
+    assert map_powerautomate_status("Waiting") is JobStatus.PENDING
+    assert map_snowflake_task_status("FAILED_AND_AUTO_SUSPENDED") is JobStatus.FAILED
+    assert map_snowflake_task_status("SKIPPED") is JobStatus.CANCELLED
+
+    assert map_databricks_status({"life_cycle_state": "TERMINATED", "result_state": "TIMEDOUT"}) is JobStatus.FAILED
+    assert map_databricks_status({"life_cycle_state": "RUNNING"}) is JobStatus.RUNNING
+    assert map_databricks_status({"life_cycle_state": "QUEUED"}) is JobStatus.PENDING
+    assert map_databricks_status({"life_cycle_state": "SKIPPED", "result_state": "UPSTREAM_FAILED"}) is JobStatus.CANCELLED
+
+    try:
+        AIRBYTE_STATUS_MAP["new"] = JobStatus.SUCCESS
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("status tables must be read-only")
+
+
+def test_unmapped_statuses_are_counted_per_platform():
+    """Every unknown state is counted, including repeats within a column."""
+    reset_unmapped_status_counts()
+    assert map_airbyte_status("exploded") is JobStatus.UNKNOWN
+    assert map_databricks_status({"life_cycle_state": "TERMINATED", "result_state": "MYSTERY"}) is JobStatus.UNKNOWN
+    assert map_statuses(PlatformType.AIRBYTE, ["succeeded", "exploded", None, "exploded"]) == [
+        JobStatus.SUCCESS, JobStatus.UNKNOWN, JobStatus.UNKNOWN, JobStatus.UNKNOWN,
+    ]
+    assert unmapped_status_counts() == {
+        ("airbyte", "exploded"): 3,
+        ("airbyte", ""): 1,
+        ("databricks", "terminated/mystery"): 1,
+    }
+    assert reset_unmapped_status_counts()[("airbyte", "exploded")] == 3
+    assert unmapped_status_counts() == {}
+
+
+def test_column_mapping_matches_single_mapping():
+    """map_statuses gives the same answer as the single-value mappers, Databricks dicts included."""
+    states = [
+        {"life_cycle_state": "TERMINATED", "result_state": "SUCCESS"},
+        {"life_cycle_state": "PENDING"},
+        {"life_cycle_state": "TERMINATED", "result_state": "SUCCESS"},
+    ]
+    assert map_statuses(PlatformType.DATABRICKS, states) == [map_databricks_status(s) for s in states]
+    assert map_statuses("snowflake_task", ["SCHEDULED", "EXECUTING"]) == [JobStatus.PENDING, JobStatus.RUNNING]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
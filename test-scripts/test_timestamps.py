@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the shared timestamp parsing utility.
+Run with pytest or directly; no credentials or network access are needed.
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from models.timestamps import (
+    duration_seconds,
+    ensure_utc,
+    parse_timestamp,
+    parse_timestamps,
+    try_parse_timestamp,
+)
+
+NOON = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+
+def test_every_platform_format_parses_to_aware_utc():
+    """ISO strings (Z, offsets, naive), epochs in each unit and naive datetimes agree."""
+    values = [
+        ("2024-01-15T12:00:00Z", "s"),
+        ("2024-01-15T14:00:00+02:00", "s"),
+        (" 2024-01-15T12:00:00 ", "s"),
+        (NOON.timestamp(), "s"),
+        (int(NOON.timestamp() * 1000), "ms"),
+        (int(NOON.timestamp() * 1_000_000), "us"),
+        (datetime(2024, 1, 15, 12, 0), "s"),
+        (NOON.astimezone(timezone(timedelta(hours=-5))), "s"),
+    ]
+    for value, unit in values:
+        parsed = parse_timestamp(value, unit)
+        assert parsed == NOON and parsed.tzinfo == timezone.utc, (value, parsed)
+
+    assert ensure_utc(datetime(2024, 1, 15, 12, 0)) == NOON
+    assert parse_timestamp(None) is None and parse_timestamp("") is None
+
+
+def test_bad_values_raise_or_become_none():
+    """parse_timestamp raises ValueError; the lenient variants return None."""
+    for value, unit in (("yesterday", "s"), (True, "s"), (1e20, "s"), (1, "ns")):
+        try:
+            parse_timestamp(value, unit)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{value!r} ({unit}) was parsed")
+        assert try_parse_timestamp(value, unit) is None
+
+    column = ["2024-01-15T12:00:00Z", "garbage", None, "2024-01-15T12:00:00Z", NOON.timestamp() * 1000]
+    assert parse_timestamps(column, unit="ms") == [NOON, None, None, NOON, NOON]
+
+
+def test_duration_between_parsed_timestamps():
+    """Durations are whole seconds and None when either end is missing."""
+    assert duration_seconds(NOON, NOON + timedelta(seconds=90.7)) == 90
+    assert duration_seconds(None, NOON) is None
+    assert duration_seconds(NOON, None) is None
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"✅ {name}")
@@ -1,17 +1,50 @@
 """API tools for data platform integrations."""
 
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+    CircuitOpenError,
+    PlatformUnavailableError,
+    get_circuit_breaker,
+    get_circuit_breaker_states,
+)
+
+from .deadline import (
+    Deadline,
+    DeadlineExceededError,
+    deadline_scope,
+    get_current_deadline,
+)
+
+from .monitoring_cycle import (
+    MonitoringCycle,
+    cycle_scope,
+    get_current_cycle,
+)
+
+from .request_coalescing import (
+    RequestCoalescer,
+    coalescing_scope,
+    get_current_coalescer,
+)
+
 from .airbyte_api import (
     AirbyteAPIClient,
     AirbyteAPIError,
     get_airbyte_job_status,
     get_airbyte_connection_health,
+    get_airbyte_connection_catalog,
+    find_airbyte_connection,
 )
 
+from .connection_catalog import ConnectionCatalog
+
 from .databricks_api import (
     DatabricksAPIClient,
     DatabricksAPIError,
     get_databricks_job_status,
     get_databricks_cluster_health,
+    get_databricks_cluster_transitions,
 )
 
 from .powerautomate_api import (
@@ -23,6 +56,7 @@ from .powerautomate_api import (
 from .snowflake_task_api import (
     SnowflakeTaskAPIClient,
     SnowflakeTaskAPIError,
+    get_snowflake_task_definition_changes,
     get_snowflake_task_status,
 )
 
@@ -30,6 +64,7 @@ from .snowflake_db_api import (
     SnowflakeDBAPIClient,
     SnowflakeDBAPIError,
     store_job_status_records,
+    store_job_status_batch,
     store_monitoring_result,
 )
 
@@ -40,18 +75,47 @@ from .outlook_api import (
     create_notification_draft,
 )
 
+from .instance_context import instance_scope, current_instance
+from .instance_scheduler import InstanceCollection, InstanceResult, collect_instances
+
 __all__ = [
+    # Circuit breakers
+    "CircuitBreaker",
+    "CircuitState",
+    "CircuitOpenError",
+    "PlatformUnavailableError",
+    "get_circuit_breaker",
+    "get_circuit_breaker_states",
+    
+    # Cycle deadlines
+    "Deadline",
+    "DeadlineExceededError",
+    "deadline_scope",
+    "get_current_deadline",
+    "MonitoringCycle",
+    "cycle_scope",
+    "get_current_cycle",
+    
+    # Request coalescing
+    "RequestCoalescer",
+    "coalescing_scope",
+    "get_current_coalescer",
+    
     # Airbyte
     "AirbyteAPIClient",
     "AirbyteAPIError", 
     "get_airbyte_job_status",
     "get_airbyte_connection_health",
+    "get_airbyte_connection_catalog",
+    "find_airbyte_connection",
+    "ConnectionCatalog",
     
     # Databricks
     "DatabricksAPIClient",
     "DatabricksAPIError",
     "get_databricks_job_status", 
     "get_databricks_cluster_health",
+    "get_databricks_cluster_transitions",
     
     # Power Automate
     "PowerAutomateAPIClient",
@@ -61,12 +125,14 @@ __all__ = [
     # Snowflake Task
     "SnowflakeTaskAPIClient",
     "SnowflakeTaskAPIError",
+    "get_snowflake_task_definition_changes",
     "get_snowflake_task_status",
     
     # Snowflake Database
     "SnowflakeDBAPIClient",
     "SnowflakeDBAPIError",
     "store_job_status_records",
+    "store_job_status_batch",
     "store_monitoring_result",
     
     # Outlook
@@ -74,4 +140,11 @@ __all__ = [
     "OutlookAPIError",
     "send_notification_email",
     "create_notification_draft",
+    
+    # Platform instances
+    "instance_scope",
+    "current_instance",
+    "InstanceCollection",
+    "InstanceResult",
+    "collect_instances",
 ]
\ No newline at end of file
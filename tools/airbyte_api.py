@@ -2,22 +2,31 @@
 Airbyte API integration tools for job status monitoring.
 """
 
-import asyncio
 import logging
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timezone, timedelta
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import timedelta
 import httpx
 
 from models.job_status import JobStatusRecord, PlatformType
+from .circuit_breaker import CircuitOpenError, PlatformUnavailableError, get_circuit_breaker
+from .deadline import request_timeout, sleep_before_retry
+from .request_coalescing import coalesce_request, request_identity, wait_for_shared_requests
+from .connection_catalog import ConnectionCatalog
+from .monitoring_cycle import report_platform_records, report_platform_error
+from models.timestamps import duration_seconds, try_parse_timestamp, utc_now
+from models.status_mapping import map_airbyte_status
 from models.platform_models import (
     AirbyteJobsListResponse,
     AirbyteJobResponse,
     AirbyteConnectionResponse,
-    map_airbyte_status,
+    parse_response,
+    parse_rows,
 )
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BASE_URL = "https://api.airbyte.com/v1"
+
 
 class AirbyteAPIError(Exception):
     """Custom exception for Airbyte API errors."""
@@ -32,7 +41,7 @@ class AirbyteAPIClient:
         api_key: Optional[str] = None,
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
-        base_url: str = "https://api.airbyte.com/v1",
+        base_url: str = DEFAULT_BASE_URL,
         timeout: float = 30.0,
         max_retries: int = 3,
         retry_delay: float = 1.0,
@@ -71,6 +80,8 @@ class AirbyteAPIClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.circuit_breaker = get_circuit_breaker("airbyte", self.base_url)
+        self.request_identity = request_identity(self.api_key, self.client_id)
         
         # Initialize HTTP client
         self.client = httpx.AsyncClient(timeout=timeout)
@@ -81,10 +92,11 @@ class AirbyteAPIClient:
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        await self.client.aclose()
+        await self.close()
     
     async def close(self):
-        """Close the HTTP client"""
+        """Close the HTTP client once requests shared with other callers have finished"""
+        await wait_for_shared_requests(self)
         await self.client.aclose()
     
     async def _refresh_token(self) -> str:
@@ -112,7 +124,7 @@ class AirbyteAPIClient:
             response = await self.client.post(
                 auth_url, 
                 json=payload,
-                timeout=self.timeout
+                timeout=request_timeout(self.timeout, "token refresh")
             )
             response.raise_for_status()
             
@@ -121,7 +133,7 @@ class AirbyteAPIClient:
             
             # Set token expiry (default 1 hour with 5 min buffer)
             expires_in = token_data.get("expires_in", 3600)
-            self.token_expiry = datetime.now() + timedelta(seconds=expires_in - 300)
+            self.token_expiry = utc_now() + timedelta(seconds=expires_in - 300)
             
             logger.info("Successfully refreshed Airbyte API token")
             return self.api_key
@@ -148,7 +160,7 @@ class AirbyteAPIClient:
         # For OAuth2 mode, refresh token if we don't have one or if it's expired
         if self.use_oauth and (not self.api_key or 
                               (self.token_expiry is None) or 
-                              (datetime.now() >= self.token_expiry)):
+                              (utc_now() >= self.token_expiry)):
             await self._refresh_token()
         
         return {
@@ -163,21 +175,52 @@ class AirbyteAPIClient:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+        raw: bool = False,
+    ) -> Any:
         """
-        Make HTTP request with retry logic and error handling.
+        Make HTTP request through the platform circuit breaker.
         
         Args:
             method: HTTP method
             endpoint: API endpoint
             params: Query parameters
             json_data: JSON request body
+            raw: Return the undecoded response body for parse_response
             
         Returns:
-            Response JSON data
+            Response JSON data, or the raw body bytes when raw is set
             
         Raises:
-            AirbyteAPIError: On API errors or failures
+            AirbyteAPIError: On API errors, failures, or an open circuit
+        """
+        try:
+            return await coalesce_request(
+                method,
+                f"{self.base_url}/{endpoint.lstrip('/')}",
+                params,
+                self.request_identity,
+                self.circuit_breaker.call,
+                self._send_request, method, endpoint, params, json_data, raw,
+                response_format="raw" if raw else "json",
+                owner=self,
+            )
+        except (CircuitOpenError, PlatformUnavailableError) as e:
+            raise AirbyteAPIError(str(e)) from e
+    
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        raw: bool = False,
+    ) -> Any:
+        """
+        Make HTTP request with retry logic and error handling.
+        
+        Raises:
+            PlatformUnavailableError: When rate limiting, server or network errors outlast the retries
+            AirbyteAPIError: On other API errors
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         
@@ -190,7 +233,7 @@ class AirbyteAPIClient:
                     headers=headers,
                     params=params,
                     json=json_data,
-                    timeout=self.timeout,
+                    timeout=request_timeout(self.timeout, f"{method} {endpoint}"),
                 )
                 
                 # Handle rate limiting with exponential backoff
@@ -198,10 +241,10 @@ class AirbyteAPIClient:
                     if attempt < self.max_retries:
                         delay = self.retry_delay * (2 ** attempt)
                         logger.warning(f"Rate limited, retrying in {delay}s (attempt {attempt + 1})")
-                        await asyncio.sleep(delay)
+                        await sleep_before_retry(delay, f"{method} {endpoint}")
                         continue
                     else:
-                        raise AirbyteAPIError("Rate limit exceeded. Check your Airbyte API quota.")
+                        raise PlatformUnavailableError("Rate limit exceeded. Check your Airbyte API quota.")
                 
                 # Handle authentication errors with token refresh retry
                 if response.status_code == 401:
@@ -220,6 +263,7 @@ class AirbyteAPIClient:
                 
                 # Handle not found
                 if response.status_code == 404:
+                    self._invalidate_missing_connection(endpoint, params)
                     raise AirbyteAPIError(f"Resource not found: {endpoint}")
                 
                 # Handle server errors with retry
@@ -227,10 +271,10 @@ class AirbyteAPIClient:
                     if attempt < self.max_retries:
                         delay = self.retry_delay * (2 ** attempt)
                         logger.warning(f"Server error {response.status_code}, retrying in {delay}s")
-                        await asyncio.sleep(delay)
+                        await sleep_before_retry(delay, f"{method} {endpoint}")
                         continue
                     else:
-                        raise AirbyteAPIError(f"Server error: {response.status_code} - {response.text}")
+                        raise PlatformUnavailableError(f"Server error: {response.status_code} - {response.text}")
                 
                 # Handle other client errors
                 if 400 <= response.status_code < 500:
@@ -243,7 +287,7 @@ class AirbyteAPIClient:
                 
                 # Handle success
                 if response.status_code == 200:
-                    return response.json()
+                    return response.content if raw else response.json()
                 
                 # Handle unexpected status codes
                 raise AirbyteAPIError(f"Unexpected status code: {response.status_code}")
@@ -252,13 +296,31 @@ class AirbyteAPIClient:
                 if attempt < self.max_retries:
                     delay = self.retry_delay * (2 ** attempt)
                     logger.warning(f"Request error {e}, retrying in {delay}s")
-                    await asyncio.sleep(delay)
+                    await sleep_before_retry(delay, f"{method} {endpoint}")
                     continue
                 else:
-                    raise AirbyteAPIError(f"Request failed after {self.max_retries} retries: {str(e)}")
+                    raise PlatformUnavailableError(f"Request failed after {self.max_retries} retries: {str(e)}")
         
         raise AirbyteAPIError("Unexpected error in request handling")
     
+    def _invalidate_missing_connection(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Drop a connection that returned 404 from the cached connection catalogs."""
+        parts = endpoint.strip("/").split("/")
+        if len(parts) >= 2 and parts[0] == "connections":
+            connection_id = parts[1]
+        elif params and params.get("connectionId"):
+            connection_id = str(params["connectionId"])
+        else:
+            return
+        
+        for (base_url, identity, _), catalog in _connection_catalogs.items():
+            if base_url == self.base_url and identity == self.request_identity:
+                catalog.invalidate(connection_id)
+    
     async def get_jobs(
         self,
         workspace_id: Optional[str] = None,
@@ -291,8 +353,8 @@ class AirbyteAPIClient:
         logger.info(f"Fetching Airbyte jobs with params: {params}")
         
         try:
-            response_data = await self._make_request("GET", "/jobs", params=params)
-            return AirbyteJobsListResponse(**response_data)
+            response_body = await self._make_request("GET", "/jobs", params=params, raw=True)
+            return parse_response(AirbyteJobsListResponse, response_body)
         except Exception as e:
             logger.error(f"Failed to get Airbyte jobs: {e}")
             raise AirbyteAPIError(f"Failed to get jobs: {str(e)}")
@@ -346,10 +408,95 @@ class AirbyteAPIClient:
         try:
             response_data = await self._make_request("GET", "/connections", params=params)
             connections_data = response_data.get("data", [])
-            return [AirbyteConnectionResponse(**conn) for conn in connections_data]
+            return parse_rows(AirbyteConnectionResponse, connections_data)
         except Exception as e:
             logger.error(f"Failed to get Airbyte connections: {e}")
             raise AirbyteAPIError(f"Failed to get connections: {str(e)}")
+    
+    async def list_all_connections(
+        self,
+        workspace_id: Optional[str] = None,
+        page_size: int = 100,
+    ) -> List[AirbyteConnectionResponse]:
+        """
+        Get every connection, following pagination.
+        
+        Args:
+            workspace_id: Optional workspace ID filter
+            page_size: Number of connections per request (max 100)
+            
+        Returns:
+            List of AirbyteConnectionResponse objects
+        """
+        page_size = min(max(page_size, 1), 100)
+        connections: List[AirbyteConnectionResponse] = []
+        offset = 0
+        
+        while True:
+            page = await self.get_connections(
+                workspace_id=workspace_id,
+                limit=page_size,
+                offset=offset
+            )
+            connections.extend(page)
+            if len(page) < page_size:
+                return connections
+            offset += page_size
+
+
+_connection_catalogs: Dict[Tuple[str, str, Optional[str]], ConnectionCatalog] = {}
+
+
+def get_airbyte_connection_catalog(
+    api_key: Optional[str] = None,
+    client_id: Optional[str] = None,
+    client_secret: Optional[str] = None,
+    workspace_id: Optional[str] = None,
+    base_url: str = DEFAULT_BASE_URL,
+    ttl_seconds: Optional[float] = None,
+) -> ConnectionCatalog:
+    """
+    Get the shared connection catalog for an Airbyte workspace.
+    
+    Args:
+        api_key: Static Airbyte API access token (for backwards compatibility)
+        client_id: OAuth2 client ID for token refresh
+        client_secret: OAuth2 client secret for token refresh
+        workspace_id: Optional workspace ID
+        base_url: Airbyte API base URL
+        ttl_seconds: Optional TTL override (defaults to settings)
+        
+    Returns:
+        ConnectionCatalog for the workspace and credentials
+    """
+    base_url = base_url.rstrip('/')
+    # Same identity the client derives, so 404 invalidation finds the catalog
+    if api_key and api_key.strip():
+        identity = request_identity(api_key.strip(), None)
+    else:
+        identity = request_identity(None, client_id.strip() if client_id else None)
+    key = (base_url, identity, workspace_id)
+    
+    catalog = _connection_catalogs.get(key)
+    if catalog is None:
+        from config.settings import settings
+        
+        async def load_connections() -> List[AirbyteConnectionResponse]:
+            async with AirbyteAPIClient(
+                api_key=api_key,
+                client_id=client_id,
+                client_secret=client_secret,
+                base_url=base_url
+            ) as client:
+                return await client.list_all_connections(workspace_id=workspace_id)
+        
+        catalog = ConnectionCatalog(
+            load_connections,
+            ttl_seconds=ttl_seconds or settings.airbyte_catalog_ttl_seconds,
+        )
+        _connection_catalogs[key] = catalog
+    
+    return catalog
 
 
 # Convenience functions for use in agents
@@ -374,67 +521,62 @@ async def get_airbyte_job_status(
         
     Returns:
         List of JobStatusRecord objects
+        
+    Raises:
+        CircuitOpenError: If the Airbyte circuit is open
     """
-    client = AirbyteAPIClient(
+    async with AirbyteAPIClient(
         api_key=api_key,
         client_id=client_id,
         client_secret=client_secret
-    )
-    
-    try:
-        jobs_response = await client.get_jobs(
-            workspace_id=workspace_id,
-            job_type=job_type,
-            limit=limit
-        )
+    ) as client:
+        # Fail fast while the platform circuit is open
+        if client.circuit_breaker.is_open:
+            raise CircuitOpenError(client.circuit_breaker)
         
-        job_records = []
-        for job in jobs_response.data:
-            # Parse timestamps
-            last_run_time = None
-            if job.started_at:
-                try:
-                    last_run_time = datetime.fromisoformat(
-                        job.started_at.replace('Z', '+00:00')
-                    )
-                except ValueError:
-                    logger.warning(f"Failed to parse start time for job {job.job_id}")
+        try:
+            jobs_response = await client.get_jobs(
+                workspace_id=workspace_id,
+                job_type=job_type,
+                limit=limit
+            )
             
-            # Calculate duration
-            duration_seconds = None
-            if job.started_at and job.ended_at:
-                try:
-                    start_time = datetime.fromisoformat(job.started_at.replace('Z', '+00:00'))
-                    end_time = datetime.fromisoformat(job.ended_at.replace('Z', '+00:00'))
-                    duration_seconds = int((end_time - start_time).total_seconds())
-                except ValueError:
-                    logger.warning(f"Failed to calculate duration for job {job.job_id}")
+            job_records = []
+            checked_at = utc_now()
+            for job in jobs_response.data:
+                # Parse timestamps once; the duration reuses the parsed start time
+                last_run_time = try_parse_timestamp(job.started_at)
+                if job.started_at and last_run_time is None:
+                    logger.warning(f"Failed to parse start time for job {job.job_id}")
+                ended_at = try_parse_timestamp(job.ended_at)
+                
+                # Create job status record
+                record = JobStatusRecord(
+                    job_id=job.job_id,
+                    platform=PlatformType.AIRBYTE,
+                    job_name=job.config_name or f"Job {job.job_id}",
+                    status=map_airbyte_status(job.status),
+                    last_run_time=last_run_time,
+                    duration_seconds=duration_seconds(last_run_time, ended_at),
+                    error_message=None,  # Airbyte API doesn't always provide error details
+                    metadata={
+                        "config_id": job.config_id,
+                        "job_type": job.job_type,
+                        "created_at": job.created_at,
+                        "updated_at": job.updated_at,
+                    },
+                    checked_at=checked_at,
+                )
+                job_records.append(record)
             
-            # Create job status record
-            record = JobStatusRecord(
-                job_id=job.job_id,
-                platform=PlatformType.AIRBYTE,
-                job_name=job.config_name or f"Job {job.job_id}",
-                status=map_airbyte_status(job.status),
-                last_run_time=last_run_time,
-                duration_seconds=duration_seconds,
-                error_message=None,  # Airbyte API doesn't always provide error details
-                metadata={
-                    "config_id": job.config_id,
-                    "job_type": job.job_type,
-                    "created_at": job.created_at,
-                    "updated_at": job.updated_at,
-                },
-                checked_at=datetime.now(timezone.utc),
-            )
-            job_records.append(record)
+            logger.info(f"Successfully retrieved {len(job_records)} Airbyte job records")
+            report_platform_records(PlatformType.AIRBYTE, job_records)
+            return job_records
         
-        logger.info(f"Successfully retrieved {len(job_records)} Airbyte job records")
-        return job_records
-        
-    except Exception as e:
-        logger.error(f"Failed to get Airbyte job status: {e}")
-        raise AirbyteAPIError(f"Failed to get job status: {str(e)}")
+        except Exception as e:
+            logger.error(f"Failed to get Airbyte job status: {e}")
+            report_platform_error(PlatformType.AIRBYTE, str(e))
+            raise AirbyteAPIError(f"Failed to get job status: {str(e)}")
 
 
 async def get_airbyte_connection_health(
@@ -454,15 +596,23 @@ async def get_airbyte_connection_health(
         
     Returns:
         List of connection health dictionaries
+        
+    Raises:
+        CircuitOpenError: If the Airbyte circuit is open
     """
-    client = AirbyteAPIClient(
-        api_key=api_key,
-        client_id=client_id,
-        client_secret=client_secret
-    )
+    # Fail fast while the platform circuit is open; the catalog brings its own client
+    circuit_breaker = get_circuit_breaker("airbyte", DEFAULT_BASE_URL)
+    if circuit_breaker.is_open:
+        raise CircuitOpenError(circuit_breaker)
     
     try:
-        connections = await client.get_connections(workspace_id=workspace_id)
+        catalog = get_airbyte_connection_catalog(
+            api_key=api_key,
+            client_id=client_id,
+            client_secret=client_secret,
+            workspace_id=workspace_id,
+        )
+        connections = await catalog.all()
         
         connection_health = []
         for conn in connections:
@@ -478,7 +628,54 @@ async def get_airbyte_connection_health(
         
         logger.info(f"Retrieved health info for {len(connection_health)} connections")
         return connection_health
-        
+    
     except Exception as e:
         logger.error(f"Failed to get Airbyte connection health: {e}")
-        raise AirbyteAPIError(f"Failed to get connection health: {str(e)}")
\ No newline at end of file
+        raise AirbyteAPIError(f"Failed to get connection health: {str(e)}")
+
+
+async def find_airbyte_connection(
+    name_or_id: str,
+    api_key: Optional[str] = None,
+    client_id: Optional[str] = None,
+    client_secret: Optional[str] = None,
+    workspace_id: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Look up an Airbyte connection by name or id in the connection catalog.
+    
+    Args:
+        name_or_id: Connection name or connection ID
+        api_key: Static Airbyte API access token (for backwards compatibility)
+        client_id: OAuth2 client ID for token refresh
+        client_secret: OAuth2 client secret for token refresh
+        workspace_id: Optional workspace ID
+        
+    Returns:
+        Connection dictionary, or None if no connection matches
+    """
+    catalog = get_airbyte_connection_catalog(
+        api_key=api_key,
+        client_id=client_id,
+        client_secret=client_secret,
+        workspace_id=workspace_id
+    )
+    
+    try:
+        conn = await catalog.get_by_name(name_or_id) or await catalog.get_by_id(name_or_id)
+    except Exception as e:
+        logger.error(f"Failed to look up Airbyte connection {name_or_id}: {e}")
+        raise AirbyteAPIError(f"Failed to look up connection: {str(e)}")
+    
+    if conn is None:
+        return None
+    
+    return {
+        "connection_id": conn.connection_id,
+        "connection_name": conn.name,
+        "status": conn.status,
+        "source_id": conn.source_id,
+        "destination_id": conn.destination_id,
+        "source_connections": [c.name for c in await catalog.get_by_source(conn.source_id)],
+        "destination_connections": [c.name for c in await catalog.get_by_destination(conn.destination_id)],
+    }
\ No newline at end of file
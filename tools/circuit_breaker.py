@@ -0,0 +1,252 @@
+"""
+Per-platform circuit breakers for the HTTP API clients.
+
+A breaker is shared by every client that talks to the same platform and host,
+so once a platform is known to be down every collector fails fast instead of
+spending the full retry/backoff sequence on each call.
+"""
+
+import logging
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+from urllib.parse import urlparse
+
+from .deadline import DeadlineExceededError
+from .instance_context import instance_key
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RECOVERY_TIMEOUT = 60.0
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class PlatformUnavailableError(Exception):
+    """Raised by API clients when a platform is unreachable or failing server-side."""
+    pass
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is short-circuited by an open breaker."""
+
+    def __init__(self, breaker: "CircuitBreaker"):
+        self.summary = breaker.unavailable_summary()
+        super().__init__(
+            f"{breaker.platform} unavailable at {breaker.host}: circuit open, "
+            f"retry in {self.summary['retry_after_seconds']}s"
+        )
+
+
+class CircuitBreaker:
+    """Closed / open / half-open circuit breaker for a single platform host."""
+
+    def __init__(
+        self,
+        platform: str,
+        host: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            platform: Platform name (airbyte, databricks, ...)
+            host: Host the breaker guards
+            failure_threshold: Consecutive failures before the circuit opens
+            recovery_timeout: Seconds to wait before probing an open circuit
+        """
+        if failure_threshold < 1:
+            raise ValueError("Failure threshold must be at least 1")
+
+        self.platform = platform
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._probe_in_flight = False
+        self._summary: Optional[Dict[str, Any]] = None
+
+    def _retry_after(self) -> float:
+        """Seconds left until the next recovery probe is allowed."""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.recovery_timeout - time.monotonic())
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests are currently being rejected, without claiming the probe slot."""
+        if self.state == CircuitState.OPEN:
+            return self._retry_after() > 0
+        if self.state == CircuitState.HALF_OPEN:
+            return self._probe_in_flight
+        return False
+
+    def allow_request(self) -> bool:
+        """
+        Decide whether a request may proceed.
+
+        Once the recovery timeout has elapsed an open circuit moves to half-open
+        and exactly one caller is let through as the recovery probe.
+        """
+        if self.state == CircuitState.CLOSED:
+            return True
+
+        if self.state == CircuitState.OPEN:
+            if self._retry_after() > 0:
+                return False
+            self.state = CircuitState.HALF_OPEN
+            logger.info(f"Circuit for {self.platform} at {self.host} half-open, probing recovery")
+
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """Record a request the platform answered."""
+        if self.state != CircuitState.CLOSED:
+            logger.info(f"Circuit for {self.platform} at {self.host} closed, platform recovered")
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.opened_at = None
+        self.last_error = None
+        self._probe_in_flight = False
+        self._summary = None
+
+    def record_failure(self, error: Optional[str] = None) -> None:
+        """Record a request that failed because the platform is unavailable."""
+        self.failure_count += 1
+        self.last_error = error
+        self._probe_in_flight = False
+
+        if self.state == CircuitState.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            self.state = CircuitState.OPEN
+            self.opened_at = time.monotonic()
+            self._summary = None
+            logger.warning(
+                f"Circuit for {self.platform} at {self.host} opened after "
+                f"{self.failure_count} failures: {error}"
+            )
+
+    def release(self) -> None:
+        """Free the half-open probe slot when a request ended without a verdict."""
+        self._probe_in_flight = False
+
+    def unavailable_summary(self) -> Dict[str, Any]:
+        """
+        Get the cached "platform unavailable" summary returned while the circuit is open.
+
+        Returns:
+            Summary dictionary shaped like the agents' error results
+        """
+        if self._summary is None:
+            self._summary = {
+                "platform": self.platform,
+                "host": self.host,
+                "error": f"{self.platform} unavailable: circuit open after {self.failure_count} failures",
+                "circuit_state": self.state.value,
+                "failure_count": self.failure_count,
+                "last_error": self.last_error,
+                "is_healthy": False,
+            }
+        summary = dict(self._summary)
+        summary["retry_after_seconds"] = round(self._retry_after(), 1)
+        return summary
+
+    async def call(self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a request coroutine through the breaker.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if not self.allow_request():
+            raise CircuitOpenError(self)
+
+        try:
+            result = await func(*args, **kwargs)
+        except PlatformUnavailableError as e:
+            self.record_failure(str(e))
+            raise
+        except DeadlineExceededError:
+            # Running out of cycle budget says nothing about the platform
+            self.release()
+            raise
+        except Exception:
+            # The platform answered; the error is specific to this request
+            self.record_success()
+            raise
+        except BaseException:
+            self.release()
+            raise
+
+        self.record_success()
+        return result
+
+
+_breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+
+
+def get_circuit_breaker(
+    platform: str,
+    base_url: str,
+    failure_threshold: Optional[int] = None,
+    recovery_timeout: Optional[float] = None,
+) -> CircuitBreaker:
+    """
+    Get the shared circuit breaker for a platform and host.
+
+    Inside an instance scope the breaker is also specific to the instance.
+
+    Args:
+        platform: Platform name
+        base_url: Base URL of the API; only the host is used as the key
+        failure_threshold: Optional threshold override (defaults to settings)
+        recovery_timeout: Optional recovery timeout override (defaults to settings)
+
+    Returns:
+        CircuitBreaker for the platform and host
+    """
+    # Instances sharing a host (e.g. Graph tenants) still get their own breaker
+    host = instance_key(urlparse(base_url).netloc or base_url)
+    key = (platform, host)
+
+    breaker = _breakers.get(key)
+    if breaker is None:
+        from config.settings import settings
+
+        breaker = CircuitBreaker(
+            platform=platform,
+            host=host,
+            failure_threshold=failure_threshold or settings.circuit_breaker_failure_threshold,
+            recovery_timeout=recovery_timeout or settings.circuit_breaker_recovery_seconds,
+        )
+        _breakers[key] = breaker
+
+    return breaker
+
+
+def get_circuit_breaker_states() -> Dict[str, Dict[str, Any]]:
+    """Get the state of every registered breaker, keyed by platform and host."""
+    return {
+        f"{platform}@{host}": {
+            "state": breaker.state.value,
+            "failure_count": breaker.failure_count,
+            "last_error": breaker.last_error,
+        }
+        for (platform, host), breaker in _breakers.items()
+    }
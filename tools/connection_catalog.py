@@ -0,0 +1,158 @@
+"""
+In-memory catalog of Airbyte connection metadata.
+
+Connections rarely change between monitoring cycles, so the catalog keeps the
+full list with O(1) indexes by id, name, source and destination. Stale entries
+are served while a background refresh runs; a hard expiry or an invalidation
+(e.g. a 404 for a known connection) forces a reload.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from models.platform_models import AirbyteConnectionResponse
+
+logger = logging.getLogger(__name__)
+
+ConnectionLoader = Callable[[], Awaitable[List[AirbyteConnectionResponse]]]
+
+
+class ConnectionCatalog:
+    """TTL cache of Airbyte connections with lookup indexes."""
+
+    def __init__(
+        self,
+        loader: ConnectionLoader,
+        ttl_seconds: float = 300.0,
+        max_stale_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize connection catalog.
+
+        Args:
+            loader: Coroutine function returning every connection in the workspace
+            ttl_seconds: Age after which a background refresh is started
+            max_stale_seconds: Age after which lookups wait for a reload (defaults to 2x TTL)
+        """
+        self.loader = loader
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds if max_stale_seconds is not None else ttl_seconds * 2
+
+        self.loaded_at: Optional[float] = None
+        self._by_id: Dict[str, AirbyteConnectionResponse] = {}
+        self._by_name: Dict[str, AirbyteConnectionResponse] = {}
+        self._by_source: Dict[str, List[AirbyteConnectionResponse]] = {}
+        self._by_destination: Dict[str, List[AirbyteConnectionResponse]] = {}
+        self._refresh_task: Optional["asyncio.Task[None]"] = None
+
+    def _age(self) -> Optional[float]:
+        """Seconds since the last successful load, or None if never loaded."""
+        if self.loaded_at is None:
+            return None
+        return time.monotonic() - self.loaded_at
+
+    def _index(self, connections: List[AirbyteConnectionResponse]) -> None:
+        """Rebuild every index from a fresh connection list."""
+        by_id: Dict[str, AirbyteConnectionResponse] = {}
+        by_name: Dict[str, AirbyteConnectionResponse] = {}
+        by_source: Dict[str, List[AirbyteConnectionResponse]] = {}
+        by_destination: Dict[str, List[AirbyteConnectionResponse]] = {}
+
+        for conn in connections:
+            by_id[conn.connection_id] = conn
+            by_name[conn.name] = conn
+            by_source.setdefault(conn.source_id, []).append(conn)
+            by_destination.setdefault(conn.destination_id, []).append(conn)
+
+        # Swap all indexes at once so readers never see a half-built catalog
+        self._by_id, self._by_name = by_id, by_name
+        self._by_source, self._by_destination = by_source, by_destination
+        self.loaded_at = time.monotonic()
+
+    async def _load(self) -> None:
+        """Load connections and rebuild the indexes."""
+        connections = await self.loader()
+        self._index(connections)
+        logger.info(f"Connection catalog loaded {len(connections)} connections")
+
+    def _start_refresh(self) -> "asyncio.Task[None]":
+        """Start a refresh unless one is already running."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._load())
+            self._refresh_task.add_done_callback(self._log_refresh_failure)
+        return self._refresh_task
+
+    @staticmethod
+    def _log_refresh_failure(task: "asyncio.Task[None]") -> None:
+        """Log a failed background refresh; the stale catalog stays in use."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Connection catalog refresh failed: {task.exception()}")
+
+    async def ensure_loaded(self) -> None:
+        """
+        Make sure the catalog is usable.
+
+        Waits for a load when the catalog is empty or past its hard expiry;
+        otherwise serves the cached data and refreshes in the background once
+        the TTL has passed.
+        """
+        age = self._age()
+        if age is None or age >= self.max_stale_seconds:
+            await asyncio.shield(self._start_refresh())
+        elif age >= self.ttl_seconds:
+            self._start_refresh()
+
+    async def refresh(self) -> None:
+        """Reload the catalog now."""
+        await asyncio.shield(self._start_refresh())
+
+    def invalidate(self, connection_id: Optional[str] = None) -> None:
+        """
+        Drop a connection (or the whole catalog) so the next lookup reloads.
+
+        Args:
+            connection_id: Connection that no longer exists; None invalidates everything
+        """
+        if connection_id is not None:
+            conn = self._by_id.get(connection_id)
+            if conn is None:
+                return
+            self._by_id.pop(conn.connection_id, None)
+            if self._by_name.get(conn.name) is conn:
+                self._by_name.pop(conn.name, None)
+            for index, key in ((self._by_source, conn.source_id), (self._by_destination, conn.destination_id)):
+                remaining = [c for c in index.get(key, []) if c is not conn]
+                if remaining:
+                    index[key] = remaining
+                else:
+                    index.pop(key, None)
+            logger.info(f"Connection {connection_id} removed from catalog")
+        # Force the next lookup to wait for a reload
+        self.loaded_at = None
+
+    async def all(self) -> List[AirbyteConnectionResponse]:
+        """Get every cached connection."""
+        await self.ensure_loaded()
+        return list(self._by_id.values())
+
+    async def get_by_id(self, connection_id: str) -> Optional[AirbyteConnectionResponse]:
+        """Look up a connection by id."""
+        await self.ensure_loaded()
+        return self._by_id.get(connection_id)
+
+    async def get_by_name(self, name: str) -> Optional[AirbyteConnectionResponse]:
+        """Look up a connection by name."""
+        await self.ensure_loaded()
+        return self._by_name.get(name)
+
+    async def get_by_source(self, source_id: str) -> List[AirbyteConnectionResponse]:
+        """Get all connections reading from a source."""
+        await self.ensure_loaded()
+        return list(self._by_source.get(source_id, []))
+
+    async def get_by_destination(self, destination_id: str) -> List[AirbyteConnectionResponse]:
+        """Get all connections writing to a destination."""
+        await self.ensure_loaded()
+        return list(self._by_destination.get(destination_id, []))
@@ -4,20 +4,57 @@ Databricks API integration tools for job status monitoring.
 
 import asyncio
 import logging
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timezone
+import os
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 import httpx
 
+from .circuit_breaker import CircuitOpenError, PlatformUnavailableError, get_circuit_breaker
+from .deadline import request_timeout, sleep_before_retry
+from .request_coalescing import coalesce_request, request_identity
+from .monitoring_cycle import report_platform_records, report_platform_error
+from .instance_context import instance_state_path
+from .databricks_cluster_tracker import HEALTHY_CLUSTER_STATES, ClusterStateTracker, get_cluster_tracker
 from models.job_status import JobStatusRecord, PlatformType
+from models.state_file import PersistentState, StateRegistry
+from models.timestamps import ensure_utc, try_parse_timestamp, utc_now
+from models.status_mapping import map_databricks_status
 from models.platform_models import (
     DatabricksJobRun,
+    DatabricksRunOutput,
     DatabricksJobRunsResponse,
     DatabricksJobDetails,
-    map_databricks_status,
+    parse_response,
+    parse_rows,
 )
 
 logger = logging.getLogger(__name__)
 
+# Largest page /jobs/runs/list returns
+MAX_RUNS_PAGE_SIZE = 25
+
+# Largest page /clusters/events returns
+MAX_CLUSTER_EVENTS_PAGE_SIZE = 500
+
+# Run life cycle states after which a run never changes again
+TERMINAL_LIFE_CYCLE_STATES = frozenset({"TERMINATED", "SKIPPED", "INTERNAL_ERROR"})
+
+RUN_WATERMARK_STATE_VERSION = 1
+RUN_DETAIL_CACHE_VERSION = 1
+
+# Result states whose cause is worth fetching from the run output
+FAILED_RESULT_STATES = frozenset({"FAILED", "TIMEDOUT"})
+
+# Longest error trace kept per failed task
+MAX_ERROR_TRACE_LENGTH = 2000
+
+# Task run fields kept when a run's task list is cached
+TASK_FIELDS = (
+    "task_key", "run_id", "state", "start_time", "end_time",
+    "setup_duration", "execution_duration", "cleanup_duration", "attempt_number",
+)
+
 
 class DatabricksAPIError(Exception):
     """Custom exception for Databricks API errors."""
@@ -55,6 +92,8 @@ class DatabricksAPIClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.circuit_breaker = get_circuit_breaker("databricks", self.base_url)
+        self.request_identity = request_identity(self.api_key)
         
         # Default headers for all requests
         self.headers = {
@@ -69,21 +108,51 @@ class DatabricksAPIClient:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+        raw: bool = False,
+    ) -> Any:
         """
-        Make HTTP request with retry logic and error handling.
+        Make HTTP request through the platform circuit breaker.
         
         Args:
             method: HTTP method
             endpoint: API endpoint
             params: Query parameters
             json_data: JSON request body
+            raw: Return the undecoded response body for parse_response
             
         Returns:
-            Response JSON data
+            Response JSON data, or the raw body bytes when raw is set
             
         Raises:
-            DatabricksAPIError: On API errors or failures
+            DatabricksAPIError: On API errors, failures, or an open circuit
+        """
+        try:
+            return await coalesce_request(
+                method,
+                f"{self.base_url}/{endpoint.lstrip('/')}",
+                params,
+                self.request_identity,
+                self.circuit_breaker.call,
+                self._send_request, method, endpoint, params, json_data, raw,
+                response_format="raw" if raw else "json",
+            )
+        except (CircuitOpenError, PlatformUnavailableError) as e:
+            raise DatabricksAPIError(str(e)) from e
+    
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        raw: bool = False,
+    ) -> Any:
+        """
+        Make HTTP request with retry logic and error handling.
+        
+        Raises:
+            PlatformUnavailableError: When rate limiting, server or network errors outlast the retries
+            DatabricksAPIError: On other API errors
         """
         # Ensure endpoint starts with /api/
         if not endpoint.startswith('/api/'):
@@ -100,7 +169,7 @@ class DatabricksAPIClient:
                         headers=self.headers,
                         params=params,
                         json=json_data,
-                        timeout=self.timeout,
+                        timeout=request_timeout(self.timeout, f"{method} {endpoint}"),
                     )
                     
                     # Handle rate limiting with exponential backoff
@@ -108,10 +177,10 @@ class DatabricksAPIClient:
                         if attempt < self.max_retries:
                             delay = self.retry_delay * (2 ** attempt)
                             logger.warning(f"Rate limited, retrying in {delay}s (attempt {attempt + 1})")
-                            await asyncio.sleep(delay)
+                            await sleep_before_retry(delay, f"{method} {endpoint}")
                             continue
                         else:
-                            raise DatabricksAPIError("Rate limit exceeded. Check your Databricks API quota.")
+                            raise PlatformUnavailableError("Rate limit exceeded. Check your Databricks API quota.")
                     
                     # Handle authentication errors
                     if response.status_code == 401:
@@ -130,10 +199,10 @@ class DatabricksAPIClient:
                         if attempt < self.max_retries:
                             delay = self.retry_delay * (2 ** attempt)
                             logger.warning(f"Server error {response.status_code}, retrying in {delay}s")
-                            await asyncio.sleep(delay)
+                            await sleep_before_retry(delay, f"{method} {endpoint}")
                             continue
                         else:
-                            raise DatabricksAPIError(f"Server error: {response.status_code} - {response.text}")
+                            raise PlatformUnavailableError(f"Server error: {response.status_code} - {response.text}")
                     
                     # Handle other client errors
                     if 400 <= response.status_code < 500:
@@ -146,7 +215,7 @@ class DatabricksAPIClient:
                     
                     # Handle success
                     if response.status_code == 200:
-                        return response.json()
+                        return response.content if raw else response.json()
                     
                     # Handle unexpected status codes
                     raise DatabricksAPIError(f"Unexpected status code: {response.status_code}")
@@ -155,10 +224,10 @@ class DatabricksAPIClient:
                 if attempt < self.max_retries:
                     delay = self.retry_delay * (2 ** attempt)
                     logger.warning(f"Request error {e}, retrying in {delay}s")
-                    await asyncio.sleep(delay)
+                    await sleep_before_retry(delay, f"{method} {endpoint}")
                     continue
                 else:
-                    raise DatabricksAPIError(f"Request failed after {self.max_retries} retries: {str(e)}")
+                    raise PlatformUnavailableError(f"Request failed after {self.max_retries} retries: {str(e)}")
         
         raise DatabricksAPIError("Unexpected error in request handling")
     
@@ -169,41 +238,98 @@ class DatabricksAPIClient:
         completed_only: bool = False,
         limit: int = 25,
         offset: int = 0,
+        start_time_from: Optional[int] = None,
+        start_time_to: Optional[int] = None,
+        page_token: Optional[str] = None,
     ) -> DatabricksJobRunsResponse:
         """
-        Get list of job runs from Databricks API.
+        Get one page of job runs from Databricks API.
         
         Args:
             job_id: Optional specific job ID to filter by
             active_only: Only return active runs
             completed_only: Only return completed runs
-            limit: Maximum number of results to return
-            offset: Pagination offset
+            limit: Maximum number of results to return (at most 25 per page)
+            offset: Pagination offset, used when no page token is given
+            start_time_from: Only runs started at or after this epoch time in milliseconds
+            start_time_to: Only runs started at or before this epoch time in milliseconds
+            page_token: next_page_token from the previous page
             
         Returns:
             DatabricksJobRunsResponse with job run data
         """
-        params = {
-            "limit": min(max(limit, 1), 1000),  # Databricks allows up to 1000
-            "offset": max(offset, 0),
-        }
+        params = {"limit": min(max(limit, 1), MAX_RUNS_PAGE_SIZE)}
         
+        if page_token:
+            params["page_token"] = page_token
+        else:
+            params["offset"] = max(offset, 0)
         if job_id is not None:
             params["job_id"] = job_id
         if active_only:
             params["active_only"] = "true"
         if completed_only:
             params["completed_only"] = "true"
+        if start_time_from is not None:
+            params["start_time_from"] = start_time_from
+        if start_time_to is not None:
+            params["start_time_to"] = start_time_to
         
         logger.info(f"Fetching Databricks job runs with params: {params}")
         
         try:
-            response_data = await self._make_request("GET", "/jobs/runs/list", params=params)
-            return DatabricksJobRunsResponse(**response_data)
+            response_body = await self._make_request("GET", "/jobs/runs/list", params=params, raw=True)
+            return parse_response(DatabricksJobRunsResponse, response_body)
         except Exception as e:
             logger.error(f"Failed to get Databricks job runs: {e}")
             raise DatabricksAPIError(f"Failed to get job runs: {str(e)}")
     
+    async def iter_job_runs(
+        self,
+        job_id: Optional[int] = None,
+        start_time_from: Optional[int] = None,
+        start_time_to: Optional[int] = None,
+        max_runs: Optional[int] = None,
+        page_size: int = MAX_RUNS_PAGE_SIZE,
+    ) -> AsyncIterator[DatabricksJobRun]:
+        """
+        Iterate over job runs across pages, newest first.
+        
+        Follows next_page_token while has_more is set (falling back to
+        offsets for workspaces that do not return tokens).
+        
+        Args:
+            job_id: Optional specific job ID to filter by
+            start_time_from: Only runs started at or after this epoch time in milliseconds
+            start_time_to: Only runs started at or before this epoch time in milliseconds
+            max_runs: Stop after this many runs
+            page_size: Runs requested per page
+            
+        Yields:
+            DatabricksJobRun objects
+        """
+        yielded = 0
+        offset = 0
+        page_token = None
+        while True:
+            page = await self.get_job_runs(
+                job_id=job_id,
+                limit=page_size,
+                offset=offset,
+                start_time_from=start_time_from,
+                start_time_to=start_time_to,
+                page_token=page_token,
+            )
+            for run in page.runs:
+                yield run
+                yielded += 1
+                if max_runs is not None and yielded >= max_runs:
+                    return
+            if not page.has_more or not page.runs:
+                return
+            page_token = page.next_page_token
+            offset += len(page.runs)
+    
     async def get_job_run(self, run_id: int) -> DatabricksJobRun:
         """
         Get specific job run details from Databricks API.
@@ -224,6 +350,25 @@ class DatabricksAPIClient:
             logger.error(f"Failed to get Databricks job run {run_id}: {e}")
             raise DatabricksAPIError(f"Failed to get job run {run_id}: {str(e)}")
     
+    async def get_run_output(self, run_id: int) -> DatabricksRunOutput:
+        """
+        Get the output of a single-task run or of one task run.
+        
+        Args:
+            run_id: Databricks run ID (a task's run_id for multi-task jobs)
+            
+        Returns:
+            DatabricksRunOutput with error and error trace
+        """
+        logger.info(f"Fetching Databricks run output: {run_id}")
+        
+        try:
+            response_body = await self._make_request("GET", "/jobs/runs/get-output", params={"run_id": run_id}, raw=True)
+            return parse_response(DatabricksRunOutput, response_body)
+        except Exception as e:
+            logger.error(f"Failed to get Databricks run output {run_id}: {e}")
+            raise DatabricksAPIError(f"Failed to get run output {run_id}: {str(e)}")
+    
     async def get_job(self, job_id: int) -> DatabricksJobDetails:
         """
         Get job details from Databricks API.
@@ -244,6 +389,42 @@ class DatabricksAPIClient:
             logger.error(f"Failed to get Databricks job {job_id}: {e}")
             raise DatabricksAPIError(f"Failed to get job {job_id}: {str(e)}")
     
+    async def get_cluster_events(
+        self,
+        cluster_id: str,
+        start_time: Optional[int] = None,
+        offset: int = 0,
+        limit: int = MAX_CLUSTER_EVENTS_PAGE_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Get one page of a cluster's events, oldest first.
+        
+        Args:
+            cluster_id: Databricks cluster ID
+            start_time: Only events at or after this time (epoch milliseconds)
+            offset: Events of the same query to skip (paging)
+            limit: Page size (at most MAX_CLUSTER_EVENTS_PAGE_SIZE)
+            
+        Returns:
+            Response with "events" and, when more events match, "next_page"
+        """
+        body: Dict[str, Any] = {
+            "cluster_id": cluster_id,
+            "order": "ASC",
+            "offset": max(offset, 0),
+            "limit": min(max(limit, 1), MAX_CLUSTER_EVENTS_PAGE_SIZE),
+        }
+        if start_time is not None:
+            body["start_time"] = start_time
+        
+        logger.info(f"Fetching Databricks cluster events: {cluster_id} from offset {body['offset']}")
+        
+        try:
+            return await self._make_request("POST", "/clusters/events", json_data=body)
+        except Exception as e:
+            logger.error(f"Failed to get Databricks cluster events {cluster_id}: {e}")
+            raise DatabricksAPIError(f"Failed to get cluster events {cluster_id}: {str(e)}")
+    
     async def list_jobs(
         self,
         limit: int = 25,
@@ -274,45 +455,611 @@ class DatabricksAPIClient:
         try:
             response_data = await self._make_request("GET", "/jobs/list", params=params)
             jobs_data = response_data.get("jobs", [])
-            return [DatabricksJobDetails(**job) for job in jobs_data]
+            return parse_rows(DatabricksJobDetails, jobs_data)
         except Exception as e:
             logger.error(f"Failed to list Databricks jobs: {e}")
             raise DatabricksAPIError(f"Failed to list jobs: {str(e)}")
 
 
+class RunWatermark(PersistentState):
+    """
+    Incremental /jobs/runs/list polling state.
+    
+    Remembers when the previous poll ran, which runs were still active and
+    which finished runs were already emitted. Each poll lists runs started
+    since the previous poll (less an overlap) or since the oldest run that
+    was still active, so runs that started or ended since the last cycle
+    are fetched exactly once, however busy the workspace is.
+    """
+    
+    state_name = "Databricks run watermark"
+    
+    def __init__(self, overlap_seconds: float = 300.0, max_lookback_hours: float = 24.0, max_tracked_runs: int = 50000):
+        """
+        Initialize run watermark.
+        
+        Args:
+            overlap_seconds: Re-read window before the previous poll, for runs that became visible late
+            max_lookback_hours: Oldest start time a poll reaches back to, including the first poll
+            max_tracked_runs: Finished runs remembered to avoid re-emitting them
+        """
+        self.overlap_seconds = overlap_seconds
+        self.max_lookback_hours = max_lookback_hours
+        self.max_tracked_runs = max_tracked_runs
+        self.last_poll_ms: Optional[int] = None
+        self.active_runs: Dict[int, List[Any]] = {}
+        self.finished_runs: "OrderedDict[int, None]" = OrderedDict()
+    
+    def start_time_from(self, now: datetime) -> int:
+        """Epoch milliseconds the next poll lists runs from."""
+        floor_ms = int((now - timedelta(hours=self.max_lookback_hours)).timestamp() * 1000)
+        if self.last_poll_ms is None:
+            return floor_ms
+        start_ms = self.last_poll_ms - int(self.overlap_seconds * 1000)
+        if self.active_runs:
+            start_ms = min(start_ms, min(started for started, _ in self.active_runs.values()))
+        return max(floor_ms, start_ms)
+    
+    def filter_new(self, runs: List[DatabricksJobRun]) -> List[DatabricksJobRun]:
+        """
+        Keep runs that are new or changed since the previous poll.
+        
+        The watermark itself is not changed; call advance once the runs were
+        reported, so a failed cycle re-reads them on the next poll.
+        
+        Args:
+            runs: Runs listed by the poll
+            
+        Returns:
+            Runs not seen before, active runs whose state changed, and runs that finished
+        """
+        new_runs = []
+        seen = set()
+        for run in runs:
+            if run.run_id in self.finished_runs or run.run_id in seen:
+                continue
+            seen.add(run.run_id)
+            life_cycle_state = run.state.get("life_cycle_state")
+            previous = self.active_runs.get(run.run_id)
+            if (
+                life_cycle_state in TERMINAL_LIFE_CYCLE_STATES
+                or previous is None
+                or previous[1] != life_cycle_state
+            ):
+                new_runs.append(run)
+        return new_runs
+    
+    def advance(self, runs: List[DatabricksJobRun], now: datetime) -> None:
+        """
+        Move the watermark past a poll.
+        
+        Args:
+            runs: Runs listed by the poll
+            now: Time of the poll
+        """
+        for run in runs:
+            if run.run_id in self.finished_runs:
+                continue
+            life_cycle_state = run.state.get("life_cycle_state")
+            if life_cycle_state in TERMINAL_LIFE_CYCLE_STATES:
+                self.active_runs.pop(run.run_id, None)
+                self.finished_runs[run.run_id] = None
+            else:
+                self.active_runs[run.run_id] = [run.start_time or int(now.timestamp() * 1000), life_cycle_state]
+        
+        # Active runs that fell out of the lookback window are no longer followed
+        floor_ms = int((now - timedelta(hours=self.max_lookback_hours)).timestamp() * 1000)
+        self.active_runs = {run_id: v for run_id, v in self.active_runs.items() if v[0] >= floor_ms}
+        while len(self.finished_runs) > self.max_tracked_runs:
+            self.finished_runs.popitem(last=False)
+        self.last_poll_ms = int(now.timestamp() * 1000)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the watermark state."""
+        return {
+            "version": RUN_WATERMARK_STATE_VERSION,
+            "last_poll_ms": self.last_poll_ms,
+            "active_runs": [[run_id, started, state] for run_id, (started, state) in self.active_runs.items()],
+            "finished_runs": list(self.finished_runs),
+        }
+    
+    def load_state(self, state: Dict[str, Any]) -> None:
+        """Replace contents with serialized state from to_dict."""
+        if state.get("version") != RUN_WATERMARK_STATE_VERSION:
+            logger.warning(f"Ignoring Databricks run watermark with version {state.get('version')}")
+            return
+        self.last_poll_ms = state.get("last_poll_ms")
+        self.active_runs = {int(run_id): [int(started), run_state] for run_id, started, run_state in state.get("active_runs", [])}
+        self.finished_runs = OrderedDict.fromkeys(int(run_id) for run_id in state.get("finished_runs", [])[-self.max_tracked_runs:])
+
+
+_watermarks: StateRegistry[RunWatermark] = StateRegistry(RunWatermark.load)
+
+
+def run_watermark_path(path: str, job_id: Optional[int] = None) -> str:
+    """
+    State file of the run watermark for a poll.
+    
+    A poll filtered to one job only sees that job's runs, so it keeps its own
+    watermark ("x.json" becomes "x.job_<id>.json") instead of advancing the
+    workspace-wide one past other jobs' runs.
+    """
+    if job_id is None:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.job_{job_id}{ext}"
+
+
+def get_run_watermark(path: str, max_lookback_hours: float) -> RunWatermark:
+    """Get the shared run watermark for a state file, loading it on first use."""
+    return _watermarks.get(path, max_lookback_hours=max_lookback_hours)
+
+
+def _run_record(run: DatabricksJobRun, job_name: str, checked_at: datetime) -> JobStatusRecord:
+    """Build the JobStatusRecord for one job run."""
+    # Parse timestamps (Databricks uses epoch milliseconds)
+    last_run_time = try_parse_timestamp(run.start_time or None, unit="ms")
+    if run.start_time and last_run_time is None:
+        logger.warning(f"Failed to parse start time for run {run.run_id}")
+    
+    # Calculate duration
+    duration_seconds = None
+    if run.execution_duration:
+        duration_seconds = run.execution_duration // 1000  # Convert ms to seconds
+    elif run.start_time and run.end_time:
+        try:
+            duration_ms = run.end_time - run.start_time
+            duration_seconds = duration_ms // 1000
+        except (TypeError, ValueError):
+            logger.warning(f"Failed to calculate duration for run {run.run_id}")
+    
+    # Extract error message if failed
+    error_message = None
+    if run.state.get("result_state") in FAILED_RESULT_STATES:
+        state_message = run.state.get("state_message", "")
+        if state_message:
+            error_message = state_message
+    
+    return JobStatusRecord(
+        job_id=f"databricks_{run.job_id}_{run.run_id}",
+        platform=PlatformType.DATABRICKS,
+        job_name=job_name,
+        status=map_databricks_status(run.state),
+        last_run_time=last_run_time,
+        duration_seconds=duration_seconds,
+        error_message=error_message,
+        metadata={
+            "job_id": run.job_id,
+            "run_id": run.run_id,
+            "run_name": run.run_name,
+            "state": run.state,
+            "setup_duration": run.setup_duration,
+            "cleanup_duration": run.cleanup_duration,
+        },
+        checked_at=checked_at,
+    )
+
+
+def _epoch_ms(value: Optional[datetime]) -> Optional[int]:
+    """Epoch milliseconds for an optional datetime."""
+    return int(ensure_utc(value).timestamp() * 1000) if value is not None else None
+
+
+def _is_failed_state(state: Dict[str, Any]) -> bool:
+    """Whether a run or task state is a failure worth explaining."""
+    return state.get("result_state") in FAILED_RESULT_STATES or state.get("life_cycle_state") == "INTERNAL_ERROR"
+
+
+class RunDetailCache(PersistentState):
+    """
+    Details fetched for terminal runs, keyed by run ID.
+    
+    Terminal runs never change, so entries are never refreshed; the least
+    recently used are evicted beyond max_runs to bound the state file.
+    """
+    
+    state_name = "Databricks run detail cache"
+    
+    def __init__(self, max_runs: int = 20000):
+        """
+        Initialize run detail cache.
+        
+        Args:
+            max_runs: Runs kept; the least recently used is evicted beyond this
+        """
+        self.max_runs = max_runs
+        self.runs: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self.runs)
+    
+    def get(self, run_id: int, key: str) -> Optional[Any]:
+        """Cached detail of one kind for a run, or None."""
+        entry = self.runs.get(run_id)
+        if entry is None or key not in entry:
+            return None
+        self.runs.move_to_end(run_id)
+        return entry[key]
+    
+    def put(self, run_id: int, key: str, value: Any) -> None:
+        """Cache detail of one kind for a terminal run."""
+        self.runs.setdefault(run_id, {})[key] = value
+        self.runs.move_to_end(run_id)
+        while len(self.runs) > self.max_runs:
+            self.runs.popitem(last=False)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize cached runs, least recently used first."""
+        return {"version": RUN_DETAIL_CACHE_VERSION, "runs": [[run_id, entry] for run_id, entry in self.runs.items()]}
+    
+    def load_state(self, state: Dict[str, Any]) -> None:
+        """Replace contents with serialized state from to_dict."""
+        if state.get("version") != RUN_DETAIL_CACHE_VERSION:
+            logger.warning(f"Ignoring Databricks run detail cache with version {state.get('version')}")
+            return
+        self.runs = OrderedDict((int(run_id), entry) for run_id, entry in state.get("runs", [])[-self.max_runs:])
+
+
+_detail_caches: StateRegistry[RunDetailCache] = StateRegistry(RunDetailCache.load)
+
+
+def get_run_detail_cache(path: str) -> RunDetailCache:
+    """Get the shared run detail cache for a state file, loading it on first use."""
+    return _detail_caches.get(path)
+
+
+async def fetch_failure_detail(
+    client: DatabricksAPIClient,
+    run: DatabricksJobRun,
+    limiter: asyncio.Semaphore,
+    tasks: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Fetch task-level state and output for a failed run.
+    
+    One runs/get lists the run's tasks and their states, unless the task
+    list was already fetched by task expansion; get-output is then called
+    for each failed task (or for the run itself when it has no task list).
+    Each API call holds the limiter.
+    
+    Args:
+        client: Databricks API client
+        run: Failed run
+        limiter: Semaphore bounding API calls in flight
+        tasks: The run's task list if already known (see expand_run_tasks)
+    
+    Returns:
+        Dictionary with "failed_tasks" (task_key, run_id, result_state,
+        state_message, error, error_trace), the first "error", and
+        "complete", False if any get-output call failed
+    """
+    state = run.state
+    if tasks is None:
+        async with limiter:
+            run_detail = await client.get_job_run(run.run_id)
+        tasks = run_detail.tasks or []
+        state = run_detail.state
+    
+    failed_tasks = [task for task in tasks if _is_failed_state(task.get("state", {}))]
+    targets = [
+        (task.get("task_key"), task.get("run_id"), task.get("state", {}))
+        for task in failed_tasks if task.get("run_id") is not None
+    ]
+    if not tasks:
+        targets = [(None, run.run_id, state)]
+    
+    async def _output(run_id: int) -> Optional[DatabricksRunOutput]:
+        try:
+            async with limiter:
+                return await client.get_run_output(run_id)
+        except DatabricksAPIError as e:
+            logger.warning(f"No output for Databricks run {run_id}: {e}")
+            return None
+    
+    outputs = await asyncio.gather(*(_output(run_id) for _, run_id, _ in targets))
+    
+    details = []
+    for (task_key, run_id, state), output in zip(targets, outputs):
+        error = output.error if output else None
+        trace = output.error_trace if output else None
+        details.append({
+            "task_key": task_key,
+            "run_id": run_id,
+            "result_state": state.get("result_state"),
+            "state_message": state.get("state_message"),
+            "error": error,
+            "error_trace": trace[-MAX_ERROR_TRACE_LENGTH:] if trace else None,
+        })
+    
+    first_error = next((d["error"] or d["state_message"] for d in details if d["error"] or d["state_message"]), None)
+    complete = all(output is not None for output in outputs)
+    return {"failed_tasks": details, "error": first_error, "complete": complete}
+
+
+def apply_failure_detail(record: JobStatusRecord, detail: Dict[str, Any]) -> None:
+    """Put fetched failure detail into a record's error message and metadata."""
+    causes = [
+        f"{task['task_key']}: {task['error'] or task['state_message']}" if task["task_key"] else (task["error"] or task["state_message"])
+        for task in detail.get("failed_tasks", [])
+        if task["error"] or task["state_message"]
+    ]
+    if causes:
+        record.error_message = "; ".join(causes[:3])
+    record.metadata["failure_detail"] = detail
+
+
+async def enrich_failed_runs(
+    client: DatabricksAPIClient,
+    runs: List[DatabricksJobRun],
+    records: List[JobStatusRecord],
+    cache: RunDetailCache,
+    concurrency: int = 4,
+    run_tasks: Optional[Dict[int, List[Dict[str, Any]]]] = None,
+) -> int:
+    """
+    Add failure causes to the records of failed or timed-out runs.
+    
+    Healthy runs cost nothing; failed runs are fetched once with bounded
+    concurrency and their detail cached for good, since terminal runs never
+    change. Detail with a missing task output is applied but not cached, so
+    it is fetched again next cycle. A run whose detail cannot be fetched
+    keeps its list-payload error.
+    
+    Args:
+        client: Databricks API client
+        runs: Runs the records were built from, in the same order
+        records: Records to enrich in place
+        cache: Run detail cache
+        concurrency: Maximum API calls in flight
+        run_tasks: Task lists already fetched by expand_run_tasks, by run ID
+        
+    Returns:
+        Number of runs fetched from the API (cache misses)
+    """
+    limiter = asyncio.Semaphore(max(1, concurrency))
+    to_fetch = []
+    for run, record in zip(runs, records):
+        if not _is_failed_state(run.state):
+            continue
+        detail = cache.get(run.run_id, "failure")
+        if detail is not None:
+            apply_failure_detail(record, detail)
+        else:
+            to_fetch.append((run, record))
+    
+    run_tasks = run_tasks or {}
+    results = await asyncio.gather(
+        *(fetch_failure_detail(client, run, limiter, run_tasks.get(run.run_id)) for run, _ in to_fetch),
+        return_exceptions=True,
+    )
+    for (run, record), result in zip(to_fetch, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to fetch failure detail for Databricks run {run.run_id}: {result}")
+            continue
+        if result["complete"]:
+            cache.put(run.run_id, "failure", result)
+        apply_failure_detail(record, result)
+    return len(to_fetch)
+
+
+def _compact_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep the fields of a task run that records are built from."""
+    compact = {field: task.get(field) for field in TASK_FIELDS}
+    compact["depends_on"] = [d.get("task_key") for d in task.get("depends_on", []) if d.get("task_key")]
+    return compact
+
+
+async def expand_run_tasks(
+    client: DatabricksAPIClient,
+    runs: List[DatabricksJobRun],
+    cache: RunDetailCache,
+    concurrency: int = 4,
+    max_fetches: int = 50,
+) -> Tuple[Dict[int, List[Dict[str, Any]]], int]:
+    """
+    Get the task list of each run.
+    
+    Task lists of terminal runs are cached for good, so a run is fetched
+    with one runs/get only while it is active or the first time it is seen
+    finished. At most max_fetches runs are fetched per call, in the order
+    given (newest first); the rest are reported without task records.
+    
+    Args:
+        client: Databricks API client
+        runs: Runs to expand
+        cache: Run detail cache
+        concurrency: Maximum API calls in flight
+        max_fetches: Maximum runs/get calls
+        
+    Returns:
+        (task lists by run ID, number of runs fetched from the API)
+    """
+    run_tasks: Dict[int, List[Dict[str, Any]]] = {}
+    to_fetch = []
+    for run in runs:
+        cached = cache.get(run.run_id, "tasks")
+        if cached is not None:
+            run_tasks[run.run_id] = cached
+        elif run.tasks is not None:
+            run_tasks[run.run_id] = [_compact_task(task) for task in run.tasks]
+            if run.state.get("life_cycle_state") in TERMINAL_LIFE_CYCLE_STATES:
+                cache.put(run.run_id, "tasks", run_tasks[run.run_id])
+        else:
+            to_fetch.append(run)
+    
+    if len(to_fetch) > max_fetches:
+        logger.warning(
+            f"Expanding tasks of {max_fetches} of {len(to_fetch)} Databricks runs, "
+            f"the rest are reported without task records"
+        )
+        to_fetch = to_fetch[:max_fetches]
+    
+    limiter = asyncio.Semaphore(max(1, concurrency))
+    
+    async def _fetch(run_id: int) -> DatabricksJobRun:
+        async with limiter:
+            return await client.get_job_run(run_id)
+    
+    results = await asyncio.gather(*(_fetch(run.run_id) for run in to_fetch), return_exceptions=True)
+    for run, result in zip(to_fetch, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to expand tasks of Databricks run {run.run_id}: {result}")
+            continue
+        tasks = [_compact_task(task) for task in (result.tasks or [])]
+        run_tasks[run.run_id] = tasks
+        if result.state.get("life_cycle_state") in TERMINAL_LIFE_CYCLE_STATES:
+            cache.put(run.run_id, "tasks", tasks)
+    return run_tasks, len(to_fetch)
+
+
+def _task_records(parent: JobStatusRecord, tasks: List[Dict[str, Any]], checked_at: datetime) -> List[JobStatusRecord]:
+    """
+    Build child records for the tasks of a multi-task run.
+    
+    Each child is named "<job name> / <task_key>" and links to its parent
+    run through metadata["parent_job_id"]; failure detail already fetched for
+    the parent is attached to the matching task.
+    """
+    failed_detail = {
+        task["run_id"]: task
+        for task in parent.metadata.get("failure_detail", {}).get("failed_tasks", [])
+    }
+    records = []
+    for task in tasks:
+        state = task.get("state") or {}
+        start_time = task.get("start_time")
+        duration_seconds = None
+        if task.get("execution_duration"):
+            duration_seconds = task["execution_duration"] // 1000
+        elif start_time and task.get("end_time"):
+            duration_seconds = (task["end_time"] - start_time) // 1000
+        
+        error_message = None
+        detail = failed_detail.get(task.get("run_id"))
+        if detail is not None:
+            error_message = detail["error"] or detail["state_message"]
+        elif state.get("result_state") in FAILED_RESULT_STATES:
+            error_message = state.get("state_message") or None
+        
+        records.append(JobStatusRecord(
+            job_id=f"{parent.job_id}_{task.get('task_key')}",
+            platform=PlatformType.DATABRICKS,
+            job_name=f"{parent.job_name} / {task.get('task_key')}",
+            status=map_databricks_status(state),
+            last_run_time=try_parse_timestamp(start_time or None, unit="ms"),
+            duration_seconds=duration_seconds,
+            error_message=error_message,
+            metadata={
+                "record_type": "task_run",
+                "parent_job_id": parent.job_id,
+                "job_id": parent.metadata.get("job_id"),
+                "run_id": parent.metadata.get("run_id"),
+                "task_key": task.get("task_key"),
+                "task_run_id": task.get("run_id"),
+                "depends_on": task.get("depends_on", []),
+                "attempt_number": task.get("attempt_number"),
+                "state": state,
+                "setup_duration": task.get("setup_duration"),
+                "cleanup_duration": task.get("cleanup_duration"),
+            },
+            checked_at=checked_at,
+        ))
+    return records
+
+
 # Convenience functions for use in agents
 async def get_databricks_job_status(
     api_key: str,
     base_url: str,
     job_id: Optional[int] = None,
     limit: int = 50,
+    start_time_from: Optional[datetime] = None,
+    start_time_to: Optional[datetime] = None,
+    incremental: Optional[bool] = None,
+    enrich_failures: Optional[bool] = None,
+    expand_tasks: Optional[bool] = None,
 ) -> List[JobStatusRecord]:
     """
     Get job status records from Databricks API.
     
+    Runs are read page by page. With an explicit start_time_from/start_time_to
+    window (e.g. a backfill) every run started in the window is returned.
+    Otherwise, in incremental mode (settings.databricks_incremental by
+    default), runs are listed from the saved watermark and only runs that
+    started, changed state or finished since the previous poll are
+    returned. Without either, the newest `limit` runs are returned.
+    
+    With enrich_failures (settings.databricks_enrich_failures by default),
+    failed and timed-out runs get their task-level cause in error_message
+    and metadata["failure_detail"] (see enrich_failed_runs).
+    
+    With expand_tasks (settings.databricks_expand_tasks by default), each
+    multi-task run is followed by one child record per task, linked to the
+    run's record through metadata["parent_job_id"] (see expand_run_tasks).
+    
     Args:
         api_key: Databricks personal access token
         base_url: Databricks workspace base URL
-        job_id: Optional specific job ID to monitor
-        limit: Maximum number of job runs to fetch
+        job_id: Optional specific job ID to monitor; incremental polls of one job keep their own watermark
+        limit: Maximum number of job runs to fetch when not windowed or incremental
+        start_time_from: Only runs started at or after this time
+        start_time_to: Only runs started at or before this time
+        incremental: Use the run watermark; defaults to settings.databricks_incremental
+        enrich_failures: Fetch failure detail; defaults to settings.databricks_enrich_failures
+        expand_tasks: Add per-task child records; defaults to settings.databricks_expand_tasks
         
     Returns:
         List of JobStatusRecord objects
+        
+    Raises:
+        CircuitOpenError: If the Databricks circuit is open
     """
+    from config.settings import settings
+    
+    if incremental is None:
+        incremental = settings.databricks_incremental
+    if enrich_failures is None:
+        enrich_failures = settings.databricks_enrich_failures
+    if expand_tasks is None:
+        expand_tasks = settings.databricks_expand_tasks
+    windowed = start_time_from is not None or start_time_to is not None
+    
     client = DatabricksAPIClient(api_key, base_url)
     
+    # Fail fast while the platform circuit is open
+    if client.circuit_breaker.is_open:
+        raise CircuitOpenError(client.circuit_breaker)
+    
+    # State files are kept per monitored instance
+    watermark_path = run_watermark_path(instance_state_path(settings.databricks_run_watermark_path), job_id)
+    detail_cache_path = instance_state_path(settings.databricks_run_detail_cache_path)
+    
     try:
-        # Get recent job runs
-        runs_response = await client.get_job_runs(
-            job_id=job_id,
-            limit=limit
-        )
+        now = utc_now()
+        watermark = None
+        listed: List[DatabricksJobRun] = []
+        if windowed:
+            runs = [run async for run in client.iter_job_runs(
+                job_id=job_id,
+                start_time_from=_epoch_ms(start_time_from),
+                start_time_to=_epoch_ms(start_time_to),
+            )]
+        elif incremental:
+            watermark = get_run_watermark(watermark_path, settings.databricks_max_lookback_hours)
+            listed = [run async for run in client.iter_job_runs(
+                job_id=job_id,
+                start_time_from=watermark.start_time_from(now),
+            )]
+            runs = watermark.filter_new(listed)
+            logger.info(f"Incremental Databricks poll: {len(runs)} new or changed of {len(listed)} runs")
+        else:
+            runs = [run async for run in client.iter_job_runs(job_id=job_id, max_runs=limit)]
         
         # Get job details for naming (cache job info)
         job_cache = {}
         
         job_records = []
-        for run in runs_response.runs:
+        for run in runs:
             # Get job name from cache or fetch
             job_name = f"Job {run.job_id}"
             if run.job_id not in job_cache:
@@ -326,63 +1073,191 @@ async def get_databricks_job_status(
             else:
                 job_name = job_cache[run.job_id]
             
-            # Parse timestamps (Databricks uses epoch milliseconds)
-            last_run_time = None
-            if run.start_time:
-                try:
-                    last_run_time = datetime.fromtimestamp(
-                        run.start_time / 1000, tz=timezone.utc
-                    )
-                except (ValueError, TypeError):
-                    logger.warning(f"Failed to parse start time for run {run.run_id}")
-            
-            # Calculate duration
-            duration_seconds = None
-            if run.execution_duration:
-                duration_seconds = run.execution_duration // 1000  # Convert ms to seconds
-            elif run.start_time and run.end_time:
-                try:
-                    duration_ms = run.end_time - run.start_time
-                    duration_seconds = duration_ms // 1000
-                except (TypeError, ValueError):
-                    logger.warning(f"Failed to calculate duration for run {run.run_id}")
-            
-            # Extract error message if failed
-            error_message = None
-            if run.state.get("result_state") == "FAILED":
-                state_message = run.state.get("state_message", "")
-                if state_message:
-                    error_message = state_message
-            
-            # Create job status record
-            record = JobStatusRecord(
-                job_id=f"databricks_{run.job_id}_{run.run_id}",
-                platform=PlatformType.DATABRICKS,
-                job_name=job_name,
-                status=map_databricks_status(run.state),
-                last_run_time=last_run_time,
-                duration_seconds=duration_seconds,
-                error_message=error_message,
-                metadata={
-                    "job_id": run.job_id,
-                    "run_id": run.run_id,
-                    "run_name": run.run_name,
-                    "state": run.state,
-                    "setup_duration": run.setup_duration,
-                    "cleanup_duration": run.cleanup_duration,
-                },
-                checked_at=datetime.now(timezone.utc),
+            job_records.append(_run_record(run, job_name, now))
+        
+        detail_cache = None
+        run_tasks: Dict[int, List[Dict[str, Any]]] = {}
+        fetched = 0
+        if expand_tasks or enrich_failures:
+            detail_cache = get_run_detail_cache(detail_cache_path)
+        if expand_tasks:
+            run_tasks, fetched = await expand_run_tasks(
+                client,
+                runs,
+                detail_cache,
+                concurrency=settings.databricks_enrichment_concurrency,
+                max_fetches=settings.databricks_max_task_expansions,
             )
-            job_records.append(record)
+        if enrich_failures:
+            fetched += await enrich_failed_runs(
+                client,
+                runs,
+                job_records,
+                detail_cache,
+                concurrency=settings.databricks_enrichment_concurrency,
+                run_tasks=run_tasks,
+            )
+        if detail_cache is not None:
+            if fetched:
+                try:
+                    detail_cache.save(detail_cache_path)
+                except OSError as e:
+                    logger.warning(f"Failed to save Databricks run detail cache: {e}")
+        
+        if run_tasks:
+            expanded = []
+            for run, record in zip(runs, job_records):
+                expanded.append(record)
+                tasks = run_tasks.get(run.run_id, [])
+                # Single-task runs are fully described by the run record
+                if len(tasks) > 1:
+                    record.metadata["task_count"] = len(tasks)
+                    expanded.extend(_task_records(record, tasks, now))
+            job_records = expanded
         
         logger.info(f"Successfully retrieved {len(job_records)} Databricks job records")
+        report_platform_records(PlatformType.DATABRICKS, job_records)
+        
+        # Advance the watermark only once the records were built and reported
+        if watermark is not None:
+            watermark.advance(listed, now)
+            try:
+                watermark.save(watermark_path)
+            except OSError as e:
+                logger.warning(f"Failed to save Databricks run watermark: {e}")
         return job_records
         
     except Exception as e:
         logger.error(f"Failed to get Databricks job status: {e}")
+        report_platform_error(PlatformType.DATABRICKS, str(e))
         raise DatabricksAPIError(f"Failed to get job status: {str(e)}")
 
 
+async def pull_cluster_events(
+    client: DatabricksAPIClient,
+    tracker: ClusterStateTracker,
+    cluster_ids: List[str],
+    since_ms: int,
+    max_pages: int = 4,
+) -> int:
+    """
+    Read new /clusters/events entries into the tracker's ring buffers.
+    
+    Each cluster is read from just after its last event already seen (or
+    from since_ms the first time), page by page by offset, at most
+    max_pages pages per cluster. A cluster whose events cannot be read is
+    logged and skipped.
+    
+    Returns:
+        Number of events read
+    """
+    async def _pull(cluster_id: str) -> int:
+        offset_ms = tracker.event_offsets.get(cluster_id)
+        start_time = offset_ms + 1 if offset_ms is not None else since_ms
+        offset = 0
+        count = 0
+        for _ in range(max_pages):
+            page = await client.get_cluster_events(cluster_id, start_time=start_time, offset=offset)
+            events = page.get("events", [])
+            tracker.add_events(cluster_id, events)
+            count += len(events)
+            next_page = page.get("next_page")
+            if not next_page or not events:
+                break
+            offset = next_page.get("offset", offset + len(events))
+        return count
+    
+    results = await asyncio.gather(*(_pull(cluster_id) for cluster_id in cluster_ids), return_exceptions=True)
+    total = 0
+    for cluster_id, result in zip(cluster_ids, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to read events of Databricks cluster {cluster_id}: {result}")
+            continue
+        total += result
+    return total
+
+
+async def _track_clusters(
+    client: DatabricksAPIClient,
+    include_events: Optional[bool],
+) -> List[Dict[str, Any]]:
+    """
+    List clusters and diff them against the tracked state.
+    
+    Events are pulled only for clusters that changed, so an idle workspace
+    costs one /clusters/list call per poll.
+    
+    Returns:
+        Transitions since the previous poll
+    """
+    from config.settings import settings
+    
+    if include_events is None:
+        include_events = settings.databricks_cluster_events
+    
+    response_data = await client._make_request("GET", "/clusters/list")
+    clusters = response_data.get("clusters", [])
+    
+    now = utc_now()
+    state_path = instance_state_path(settings.databricks_cluster_state_path)
+    tracker = get_cluster_tracker(state_path, settings.databricks_cluster_events_per_cluster)
+    transitions = tracker.update(clusters, now)
+    
+    if include_events:
+        changed = sorted({t["cluster_id"] for t in transitions if t["type"] != "DELETED"})
+        if changed:
+            since_ms = int(now.timestamp() * 1000) - int(settings.monitoring_interval_minutes * 60 * 1000)
+            await pull_cluster_events(client, tracker, changed, since_ms)
+    
+    try:
+        tracker.save(state_path)
+    except OSError as e:
+        logger.warning(f"Failed to save Databricks cluster state: {e}")
+    
+    if transitions:
+        logger.info(f"Databricks clusters: {len(transitions)} transitions across {len(clusters)} clusters")
+    return transitions
+
+
+async def get_databricks_cluster_transitions(
+    api_key: str,
+    base_url: str,
+    include_events: Optional[bool] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Get Databricks cluster state transitions since the previous poll.
+    
+    Only changes are returned: state changes, error terminations, resizes
+    and created or deleted clusters. The first poll establishes the
+    baseline and returns nothing. Cheap enough to run every minute.
+    
+    Args:
+        api_key: Databricks personal access token
+        base_url: Databricks workspace base URL
+        include_events: Pull /clusters/events for changed clusters;
+            defaults to settings.databricks_cluster_events
+        
+    Returns:
+        List of transition dictionaries (cluster_id, cluster_name, type,
+        from_state, to_state, from_workers, to_workers, termination_code,
+        termination_type, message, is_error, observed_at)
+        
+    Raises:
+        CircuitOpenError: If the Databricks circuit is open
+    """
+    client = DatabricksAPIClient(api_key, base_url)
+    
+    # Fail fast while the platform circuit is open
+    if client.circuit_breaker.is_open:
+        raise CircuitOpenError(client.circuit_breaker)
+    
+    try:
+        return await _track_clusters(client, include_events)
+    except Exception as e:
+        logger.error(f"Failed to get Databricks cluster transitions: {e}")
+        raise DatabricksAPIError(f"Failed to get cluster transitions: {str(e)}")
+
+
 async def get_databricks_cluster_health(
     api_key: str,
     base_url: str,
@@ -390,19 +1265,36 @@ async def get_databricks_cluster_health(
     """
     Get cluster health information from Databricks.
     
+    Each cluster's entry carries the recent transitions and events the
+    cluster state tracker holds. The tracker is only read here; it is
+    advanced by get_databricks_cluster_transitions.
+    
     Args:
         api_key: Databricks personal access token
         base_url: Databricks workspace base URL
         
     Returns:
         List of cluster health dictionaries
+        
+    Raises:
+        CircuitOpenError: If the Databricks circuit is open
     """
     client = DatabricksAPIClient(api_key, base_url)
     
+    # Fail fast while the platform circuit is open
+    if client.circuit_breaker.is_open:
+        raise CircuitOpenError(client.circuit_breaker)
+    
+    from config.settings import settings
+    
     try:
         # Get cluster list
         response_data = await client._make_request("GET", "/clusters/list")
         clusters = response_data.get("clusters", [])
+        tracker = get_cluster_tracker(
+            instance_state_path(settings.databricks_cluster_state_path),
+            settings.databricks_cluster_events_per_cluster,
+        )
         
         cluster_health = []
         for cluster in clusters:
@@ -410,11 +1302,12 @@ async def get_databricks_cluster_health(
                 "cluster_id": cluster.get("cluster_id"),
                 "cluster_name": cluster.get("cluster_name"),
                 "state": cluster.get("state"),
-                "is_healthy": cluster.get("state") in ["RUNNING", "RESIZING"],
+                "is_healthy": cluster.get("state") in HEALTHY_CLUSTER_STATES,
                 "node_type": cluster.get("node_type_id"),
                 "driver_node_type": cluster.get("driver_node_type_id"),
                 "spark_version": cluster.get("spark_version"),
                 "num_workers": cluster.get("num_workers", 0),
+                "recent_events": tracker.recent_events(cluster.get("cluster_id")),
             }
             cluster_health.append(health_info)
         
@@ -0,0 +1,214 @@
+"""
+Incremental Databricks cluster state tracking.
+
+Each /clusters/list snapshot is diffed against the previous one, so a poll
+reports only what changed: state transitions (e.g. RUNNING -> TERMINATED),
+resizes, terminations with an error reason and clusters that appeared or
+were deleted. A short ring buffer of recent events is kept per cluster,
+together with the timestamp of the last /clusters/events entry read, so
+cluster events can be pulled incrementally instead of re-read every poll.
+"""
+
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from models.state_file import PersistentState, StateRegistry
+from models.timestamps import utc_now
+
+logger = logging.getLogger(__name__)
+
+CLUSTER_STATE_VERSION = 1
+
+# Cluster states in which a cluster serves work
+HEALTHY_CLUSTER_STATES = frozenset({"RUNNING", "RESIZING"})
+
+# termination_reason types that mean the cluster did not stop on purpose
+ERROR_TERMINATION_TYPES = frozenset({"CLIENT_ERROR", "SERVICE_FAULT", "CLOUD_FAILURE"})
+
+
+def cluster_snapshot(cluster: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact view of a /clusters/list entry with the fields transitions are derived from."""
+    autoscale = cluster.get("autoscale") or {}
+    reason = cluster.get("termination_reason") or {}
+    return {
+        "cluster_name": cluster.get("cluster_name"),
+        "state": cluster.get("state"),
+        "num_workers": cluster.get("num_workers", 0),
+        "min_workers": autoscale.get("min_workers"),
+        "max_workers": autoscale.get("max_workers"),
+        "state_message": cluster.get("state_message") or None,
+        "termination_code": reason.get("code"),
+        "termination_type": reason.get("type"),
+    }
+
+
+def _transition(
+    cluster_id: str,
+    kind: str,
+    previous: Optional[Dict[str, Any]],
+    current: Optional[Dict[str, Any]],
+    observed_at: datetime,
+) -> Dict[str, Any]:
+    """Build one transition entry from two snapshots of a cluster."""
+    snapshot = current or previous or {}
+    return {
+        "cluster_id": cluster_id,
+        "cluster_name": snapshot.get("cluster_name"),
+        "type": kind,
+        "from_state": previous.get("state") if previous else None,
+        "to_state": current.get("state") if current else None,
+        "from_workers": previous.get("num_workers") if previous else None,
+        "to_workers": current.get("num_workers") if current else None,
+        "termination_code": snapshot.get("termination_code"),
+        "termination_type": snapshot.get("termination_type"),
+        "message": snapshot.get("state_message"),
+        "is_error": kind == "ERROR_TERMINATION",
+        "observed_at": observed_at.isoformat(),
+    }
+
+
+def compact_cluster_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact view of a /clusters/events entry for the ring buffer."""
+    details = event.get("details") or {}
+    reason = details.get("reason") or {}
+    return {
+        "type": event.get("type"),
+        "timestamp": event.get("timestamp"),
+        "current_num_workers": details.get("current_num_workers"),
+        "target_num_workers": details.get("target_num_workers"),
+        "termination_code": reason.get("code"),
+        "termination_type": reason.get("type"),
+        "source": "events",
+    }
+
+
+class ClusterStateTracker(PersistentState):
+    """
+    Last known state of each cluster, with recent events per cluster.
+
+    The first snapshot only establishes the baseline; later snapshots yield
+    transitions. State is kept in memory between polls and can be saved to a
+    JSON state file so a restart does not report every cluster as new.
+    """
+
+    state_name = "Databricks cluster state"
+
+    def __init__(self, events_per_cluster: int = 20):
+        """
+        Initialize cluster state tracker.
+
+        Args:
+            events_per_cluster: Recent events kept per cluster; older events are dropped
+        """
+        self.events_per_cluster = events_per_cluster
+        self.initialized = False
+        self.clusters: Dict[str, Dict[str, Any]] = {}
+        self.events: Dict[str, Deque[Dict[str, Any]]] = {}
+        self.event_offsets: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.clusters)
+
+    def _record(self, cluster_id: str, event: Dict[str, Any]) -> None:
+        """Append an event to a cluster's ring buffer."""
+        buffer = self.events.get(cluster_id)
+        if buffer is None:
+            buffer = self.events[cluster_id] = deque(maxlen=self.events_per_cluster)
+        buffer.append(event)
+
+    def recent_events(self, cluster_id: str) -> List[Dict[str, Any]]:
+        """Recent events of a cluster, oldest first."""
+        return list(self.events.get(cluster_id, ()))
+
+    def update(self, clusters: List[Dict[str, Any]], now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Diff a /clusters/list snapshot against the previous one.
+
+        Args:
+            clusters: Entries of a /clusters/list response
+            now: Time the snapshot was taken
+
+        Returns:
+            Transitions since the previous snapshot (empty for the first snapshot)
+        """
+        now = now or utc_now()
+        current = {
+            cluster["cluster_id"]: cluster_snapshot(cluster)
+            for cluster in clusters if cluster.get("cluster_id")
+        }
+
+        transitions = []
+        if self.initialized:
+            for cluster_id, snapshot in current.items():
+                previous = self.clusters.get(cluster_id)
+                if previous is None:
+                    kind = "CREATED"
+                elif previous["state"] != snapshot["state"]:
+                    kind = "STATE_CHANGE"
+                    if snapshot["state"] == "TERMINATED" and snapshot["termination_type"] in ERROR_TERMINATION_TYPES:
+                        kind = "ERROR_TERMINATION"
+                elif (previous["num_workers"], previous["min_workers"], previous["max_workers"]) != (
+                    snapshot["num_workers"], snapshot["min_workers"], snapshot["max_workers"]
+                ):
+                    kind = "RESIZED"
+                else:
+                    continue
+                transitions.append(_transition(cluster_id, kind, previous, snapshot, now))
+            for cluster_id in self.clusters.keys() - current.keys():
+                transitions.append(_transition(cluster_id, "DELETED", self.clusters[cluster_id], None, now))
+
+        for transition in transitions:
+            self._record(transition["cluster_id"], transition)
+        for cluster_id in self.clusters.keys() - current.keys():
+            self.events.pop(cluster_id, None)
+            self.event_offsets.pop(cluster_id, None)
+
+        self.clusters = current
+        self.initialized = True
+        return transitions
+
+    def add_events(self, cluster_id: str, events: List[Dict[str, Any]]) -> None:
+        """
+        Add /clusters/events entries read after the cluster's event offset.
+
+        Events must be in ascending time order; the offset advances to the
+        newest event's timestamp.
+        """
+        for event in events:
+            compact = compact_cluster_event(event)
+            self._record(cluster_id, compact)
+            if compact["timestamp"] is not None:
+                self.event_offsets[cluster_id] = max(self.event_offsets.get(cluster_id, 0), compact["timestamp"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the tracker state."""
+        return {
+            "version": CLUSTER_STATE_VERSION,
+            "initialized": self.initialized,
+            "clusters": self.clusters,
+            "events": {cluster_id: list(buffer) for cluster_id, buffer in self.events.items()},
+            "event_offsets": self.event_offsets,
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        """Replace contents with serialized state from to_dict."""
+        if state.get("version") != CLUSTER_STATE_VERSION:
+            logger.warning(f"Ignoring Databricks cluster state with version {state.get('version')}")
+            return
+        self.initialized = bool(state.get("initialized"))
+        self.clusters = dict(state.get("clusters", {}))
+        self.events = {
+            cluster_id: deque(events, maxlen=self.events_per_cluster)
+            for cluster_id, events in state.get("events", {}).items()
+        }
+        self.event_offsets = {cluster_id: int(offset) for cluster_id, offset in state.get("event_offsets", {}).items()}
+
+
+_trackers: StateRegistry[ClusterStateTracker] = StateRegistry(ClusterStateTracker.load)
+
+
+def get_cluster_tracker(path: str, events_per_cluster: int = 20) -> ClusterStateTracker:
+    """Get the shared cluster state tracker for a state file, loading it on first use."""
+    return _trackers.get(path, events_per_cluster=events_per_cluster)
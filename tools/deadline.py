@@ -0,0 +1,147 @@
+"""
+Deadline propagation for monitoring cycles.
+
+A deadline is installed in a context variable by the monitoring cycle, so every
+client call, retry loop and Snowflake query underneath it can shrink its own
+timeout to the time that is actually left.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class DeadlineExceededError(Exception):
+    """Raised when an operation cannot finish before the cycle deadline."""
+    pass
+
+
+class Deadline:
+    """Absolute point in time, on the monotonic clock, by which work must finish."""
+
+    def __init__(self, seconds: float, label: str = "monitoring cycle"):
+        """
+        Initialize deadline.
+
+        Args:
+            seconds: Time budget from now in seconds
+            label: Name used in error messages
+        """
+        self.label = label
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline, never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.remaining() <= 0
+
+    def check(self, operation: str) -> None:
+        """
+        Raise if the deadline has passed.
+
+        Raises:
+            DeadlineExceededError: If no time is left for the operation
+        """
+        if self.expired:
+            raise DeadlineExceededError(f"{self.label} deadline exceeded before {operation}")
+
+    def clamp_timeout(self, timeout: float, operation: str) -> float:
+        """
+        Shrink a timeout to the time left before the deadline.
+
+        Raises:
+            DeadlineExceededError: If no time is left for the operation
+        """
+        self.check(operation)
+        return min(timeout, self.remaining())
+
+    def reserve(self, seconds: float, label: Optional[str] = None) -> "Deadline":
+        """
+        Create an earlier deadline that leaves `seconds` of this budget unused.
+
+        Args:
+            seconds: Time to hold back at the end of this deadline
+            label: Optional label for the new deadline
+
+        Returns:
+            Deadline expiring `seconds` before this one
+        """
+        child = Deadline(0, label or self.label)
+        child.expires_at = self.expires_at - seconds
+        return child
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("current_deadline", default=None)
+
+
+def get_current_deadline() -> Optional[Deadline]:
+    """Get the deadline of the enclosing cycle, if any."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Install a deadline for all work started inside the block."""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def request_timeout(timeout: float, operation: str) -> float:
+    """
+    Get the timeout for a single call, clamped to the current deadline.
+
+    Args:
+        timeout: The client's configured timeout in seconds
+        operation: Description used in error messages
+
+    Returns:
+        Timeout in seconds
+
+    Raises:
+        DeadlineExceededError: If the current deadline has passed
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return timeout
+    return deadline.clamp_timeout(timeout, operation)
+
+
+async def sleep_before_retry(delay: float, operation: str) -> None:
+    """
+    Sleep for a retry backoff, unless the retry could not start before the deadline.
+
+    Raises:
+        DeadlineExceededError: If the deadline would pass during the backoff
+    """
+    deadline = _current_deadline.get()
+    if deadline is not None and delay >= deadline.remaining():
+        raise DeadlineExceededError(
+            f"{deadline.label} deadline leaves no time to retry {operation} after {delay}s"
+        )
+    await asyncio.sleep(delay)
+
+
+def statement_timeout(operation: str) -> Optional[int]:
+    """
+    Get a whole-second server-side timeout for a Snowflake statement.
+
+    Returns:
+        Seconds left before the current deadline, or None when no deadline is set
+
+    Raises:
+        DeadlineExceededError: If the current deadline has passed
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return None
+    deadline.check(operation)
+    return max(1, int(deadline.remaining()))
@@ -0,0 +1,135 @@
+"""
+Concurrent collection across configured platform instances.
+
+Each instance's collector runs in its own instance scope (see
+instance_context), so its state files, circuit breaker, clients and
+tokens are kept apart from other instances of the same platform, and its
+API requests never exceed the instance's max_concurrency. Instances are
+collected concurrently, a bounded number at a time; one failing instance
+does not stop the others.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from models.job_status import JobStatus, JobStatusRecord, PlatformType
+from models.platform_instances import PlatformInstance
+from .airbyte_api import get_airbyte_job_status
+from .databricks_api import get_databricks_job_status
+from .instance_context import instance_scope
+from .powerautomate_api import get_powerautomate_job_status
+from .snowflake_task_api import get_snowflake_task_status
+
+logger = logging.getLogger(__name__)
+
+Collector = Callable[..., Awaitable[List[JobStatusRecord]]]
+
+COLLECTORS: Dict[PlatformType, Collector] = {
+    PlatformType.AIRBYTE: get_airbyte_job_status,
+    PlatformType.DATABRICKS: get_databricks_job_status,
+    PlatformType.POWER_AUTOMATE: get_powerautomate_job_status,
+    PlatformType.SNOWFLAKE_TASK: get_snowflake_task_status,
+}
+
+
+class InstanceResult(BaseModel):
+    """Outcome of collecting one instance."""
+
+    instance: str = Field(..., description="Instance name")
+    platform: PlatformType = Field(..., description="Instance platform")
+    success: bool = Field(..., description="Whether the collector finished")
+    total_jobs: int = Field(0, description="Records collected")
+    failed_jobs: int = Field(0, description="Records with a failed status")
+    error: Optional[str] = Field(None, description="Collector error, if it failed")
+    duration_seconds: float = Field(0.0, description="Collection time")
+
+
+class InstanceCollection(BaseModel):
+    """Records and per-instance outcomes of one collection run."""
+
+    results: List[InstanceResult] = Field(default_factory=list, description="One result per instance")
+    records: List[JobStatusRecord] = Field(default_factory=list, description="Records of all instances")
+
+    def summary(self) -> Dict[str, Any]:
+        """Compact summary for agent tools and logs."""
+        return {
+            "instances": [result.model_dump(mode="json") for result in self.results],
+            "total_jobs": len(self.records),
+            "failed_jobs": sum(result.failed_jobs for result in self.results),
+            "failed_instances": [
+                f"{result.platform.value}:{result.instance}" for result in self.results if not result.success
+            ],
+        }
+
+
+def _collector_options(instance: PlatformInstance) -> Dict[str, Any]:
+    """Collector keyword arguments for an instance."""
+    options = dict(instance.options)
+    if instance.platform == PlatformType.SNOWFLAKE_TASK:
+        # Snowflake sessions are not HTTP requests; bound them directly
+        options.setdefault("max_sessions", instance.max_concurrency)
+    return options
+
+
+async def collect_instance(instance: PlatformInstance) -> InstanceCollection:
+    """
+    Collect one instance inside its instance scope.
+
+    Returns:
+        InstanceCollection with the instance's result and records; a collector
+        error is recorded in the result instead of being raised
+    """
+    collector = COLLECTORS.get(instance.platform)
+    started = time.monotonic()
+    result = InstanceResult(instance=instance.name, platform=instance.platform, success=False)
+    records: List[JobStatusRecord] = []
+
+    if collector is None:
+        result.error = f"No collector for platform {instance.platform.value}"
+    else:
+        with instance_scope(instance.name, instance.max_concurrency):
+            try:
+                records = await collector(**_collector_options(instance))
+                result.success = True
+                result.total_jobs = len(records)
+                result.failed_jobs = len([r for r in records if r.status == JobStatus.FAILED])
+            except Exception as e:
+                logger.error(f"Collection failed for {instance.platform.value} instance {instance.name}: {e}")
+                result.error = str(e)
+
+    result.duration_seconds = round(time.monotonic() - started, 3)
+    return InstanceCollection(results=[result], records=records)
+
+
+async def collect_instances(instances: List[PlatformInstance], max_parallel: int = 4) -> InstanceCollection:
+    """
+    Collect several instances concurrently.
+
+    Args:
+        instances: Instances to collect
+        max_parallel: Maximum instances collected at once
+
+    Returns:
+        InstanceCollection with one result per instance, in input order, and all records
+    """
+    limiter = asyncio.Semaphore(max(1, max_parallel))
+
+    async def _collect(instance: PlatformInstance) -> InstanceCollection:
+        async with limiter:
+            return await collect_instance(instance)
+
+    collections = await asyncio.gather(*(_collect(instance) for instance in instances))
+
+    combined = InstanceCollection()
+    for collection in collections:
+        combined.results.extend(collection.results)
+        combined.records.extend(collection.records)
+    logger.info(
+        f"Collected {len(combined.records)} records from {len(instances)} instances "
+        f"({len([r for r in combined.results if not r.success])} failed)"
+    )
+    return combined
@@ -0,0 +1,400 @@
+"""
+Embedded SQLite history of job status records and monitoring cycles.
+
+Each cycle writes its records and a session summary to a local database file
+so trend questions ("how often has this job failed this week?") can be
+answered in milliseconds without a Snowflake round trip. Snowflake remains
+the durable system of record; the local file only keeps the retention window.
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from models.job_batch import JobStatusBatch
+from models.job_status import JobStatusRecord, PlatformType
+from models.serialization import dumps
+from models.timestamps import ensure_utc, parse_timestamp, utc_now
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_status_history (
+    record_id TEXT PRIMARY KEY,
+    monitoring_id TEXT,
+    job_id TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    job_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    last_run_time REAL,
+    duration_seconds INTEGER,
+    error_message TEXT,
+    metadata TEXT,
+    checked_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_history_platform_job_checked
+    ON job_status_history (platform, job_id, checked_at);
+CREATE INDEX IF NOT EXISTS idx_history_checked
+    ON job_status_history (checked_at);
+CREATE INDEX IF NOT EXISTS idx_history_platform_status_checked
+    ON job_status_history (platform, status, checked_at);
+
+CREATE TABLE IF NOT EXISTS monitoring_sessions (
+    monitoring_id TEXT PRIMARY KEY,
+    started_at REAL NOT NULL,
+    completed_at REAL,
+    total_jobs INTEGER NOT NULL,
+    failed_jobs INTEGER NOT NULL,
+    successful_jobs INTEGER NOT NULL,
+    errors TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_started ON monitoring_sessions (started_at);
+"""
+
+JobsInput = Union[JobStatusBatch, Iterable[JobStatusRecord]]
+
+
+class LocalHistoryError(Exception):
+    """Custom exception for local history store errors."""
+    pass
+
+
+def _epoch(value: Optional[datetime]) -> Optional[float]:
+    """Datetime to epoch seconds (naive values are UTC)."""
+    return ensure_utc(value).timestamp() if value is not None else None
+
+
+def _iso(value: Optional[float]) -> Optional[str]:
+    """Epoch seconds to an ISO-8601 UTC string."""
+    return parse_timestamp(value).isoformat() if value is not None else None
+
+
+class LocalHistoryStore:
+    """SQLite-backed store of recent job status history."""
+
+    def __init__(self, path: str, retention_days: int = 30):
+        """
+        Initialize local history store.
+
+        Args:
+            path: SQLite database file (":memory:" for a throwaway store)
+            retention_days: Days of history kept; older rows are pruned on write
+        """
+        self.path = path
+        self.retention_days = retention_days
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use."""
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory and self.path != ":memory:":
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+            logger.info(f"Opened local history store at {self.path}")
+        return self._connection
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> List[sqlite3.Row]:
+        """Run a read query."""
+        try:
+            with self._lock:
+                return self._connect().execute(sql, list(params)).fetchall()
+        except sqlite3.Error as e:
+            raise LocalHistoryError(f"Local history query failed: {e}") from e
+
+    def insert_records(self, records: JobsInput, monitoring_id: Optional[str] = None) -> int:
+        """
+        Insert job status records; a record already stored is replaced.
+
+        Args:
+            records: JobStatusBatch or JobStatusRecord objects
+            monitoring_id: Cycle the records were collected in
+
+        Returns:
+            Number of rows written
+        """
+        batch = records if isinstance(records, JobStatusBatch) else JobStatusBatch.from_records(records)
+        rows = [
+            (
+                bind[0], monitoring_id, bind[1], bind[2], bind[3], bind[4],
+                _epoch(bind[5]), bind[6], bind[7], bind[8], _epoch(bind[9]),
+            )
+            for bind in batch.to_bind_rows()
+        ]
+        if not rows:
+            return 0
+
+        try:
+            with self._lock:
+                connection = self._connect()
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO job_status_history VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+        except sqlite3.Error as e:
+            raise LocalHistoryError(f"Failed to insert local history: {e}") from e
+
+        logger.debug(f"Stored {len(rows)} records in local history")
+        return len(rows)
+
+    def insert_session(
+        self,
+        monitoring_id: str,
+        started_at: datetime,
+        records: List[JobStatusRecord],
+        errors: Optional[List[str]] = None,
+        completed_at: Optional[datetime] = None,
+    ) -> None:
+        """Insert (or replace) a monitoring cycle summary."""
+        failed = sum(1 for r in records if r.status == "failed")
+        successful = sum(1 for r in records if r.status == "success")
+        try:
+            with self._lock:
+                connection = self._connect()
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO monitoring_sessions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            monitoring_id,
+                            _epoch(started_at),
+                            _epoch(completed_at or utc_now()),
+                            len(records),
+                            failed,
+                            successful,
+                            dumps(errors or []),
+                        ),
+                    )
+        except sqlite3.Error as e:
+            raise LocalHistoryError(f"Failed to insert local session: {e}") from e
+
+    def record_cycle(
+        self,
+        monitoring_id: str,
+        started_at: datetime,
+        records: List[JobStatusRecord],
+        errors: Optional[List[str]] = None,
+    ) -> int:
+        """
+        Store a cycle's records and summary, then apply the retention policy.
+
+        Returns:
+            Number of records written
+        """
+        written = self.insert_records(records, monitoring_id)
+        self.insert_session(monitoring_id, started_at, records, errors)
+        self.prune()
+        return written
+
+    def prune(self, now: Optional[datetime] = None) -> int:
+        """
+        Delete rows older than the retention window.
+
+        Returns:
+            Number of job records deleted
+        """
+        cutoff = _epoch((now or utc_now()) - timedelta(days=self.retention_days))
+        try:
+            with self._lock:
+                connection = self._connect()
+                with connection:
+                    deleted = connection.execute(
+                        "DELETE FROM job_status_history WHERE checked_at < ?", (cutoff,)
+                    ).rowcount
+                    connection.execute("DELETE FROM monitoring_sessions WHERE started_at < ?", (cutoff,))
+        except sqlite3.Error as e:
+            raise LocalHistoryError(f"Failed to prune local history: {e}") from e
+        if deleted:
+            logger.info(f"Pruned {deleted} local history records older than {self.retention_days} days")
+        return deleted
+
+    @staticmethod
+    def _record_row(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a history row to the record dictionaries used by agent tools."""
+        return {
+            "job_id": row["job_id"],
+            "platform": row["platform"],
+            "job_name": row["job_name"],
+            "status": row["status"],
+            "last_run_time": _iso(row["last_run_time"]),
+            "duration_seconds": row["duration_seconds"],
+            "error_message": row["error_message"],
+            "checked_at": _iso(row["checked_at"]),
+            "monitoring_id": row["monitoring_id"],
+        }
+
+    def recent_records(
+        self,
+        platform: Optional[str] = None,
+        hours_back: int = 24,
+        status: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Get recent records, newest first, optionally filtered by platform and status."""
+        sql = "SELECT * FROM job_status_history WHERE checked_at >= ?"
+        params: List[Any] = [_epoch(utc_now() - timedelta(hours=hours_back))]
+        if platform:
+            sql += " AND platform = ?"
+            params.append(PlatformType(platform).value)
+        if status:
+            sql += " AND status = ?"
+            params.append(status)
+        sql += " ORDER BY checked_at DESC LIMIT ?"
+        params.append(limit)
+        return [self._record_row(row) for row in self._query(sql, params)]
+
+    def job_history(self, platform: str, job_id: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """Get one job's records, newest first (served by the platform/job/checked_at index)."""
+        rows = self._query(
+            "SELECT * FROM job_status_history WHERE platform = ? AND job_id = ? "
+            "ORDER BY checked_at DESC LIMIT ?",
+            (PlatformType(platform).value, job_id, limit),
+        )
+        return [self._record_row(row) for row in rows]
+
+    def failure_summary(self, hours_back: int = 168, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Jobs ranked by failures within the window, with their run counts and last failure.
+
+        A run is re-collected every cycle until it leaves the platform's
+        listing, so each run (platform, job_id) counts once, with the status
+        of its latest snapshot.
+        """
+        rows = self._query(
+            """
+            WITH latest AS (
+                SELECT platform, job_name, status, duration_seconds,
+                       COALESCE(last_run_time, checked_at) AS run_time,
+                       ROW_NUMBER() OVER (PARTITION BY platform, job_id ORDER BY checked_at DESC) AS snapshot
+                FROM job_status_history
+                WHERE checked_at >= ?
+            )
+            SELECT platform, job_name,
+                   COUNT(*) AS runs,
+                   SUM(status = 'failed') AS failures,
+                   MAX(CASE WHEN status = 'failed' THEN run_time END) AS last_failure,
+                   AVG(duration_seconds) AS avg_duration_seconds
+            FROM latest
+            WHERE snapshot = 1
+            GROUP BY platform, job_name
+            HAVING failures > 0
+            ORDER BY failures DESC, last_failure DESC
+            LIMIT ?
+            """,
+            (_epoch(utc_now() - timedelta(hours=hours_back)), limit),
+        )
+        return [
+            {
+                "platform": row["platform"],
+                "job_name": row["job_name"],
+                "runs": row["runs"],
+                "failures": row["failures"],
+                "failure_rate": round(row["failures"] / row["runs"] * 100, 2),
+                "last_failure": _iso(row["last_failure"]),
+                "avg_duration_seconds": round(row["avg_duration_seconds"], 2) if row["avg_duration_seconds"] is not None else None,
+            }
+            for row in rows
+        ]
+
+    def recent_sessions(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Get recent monitoring cycle summaries, newest first."""
+        rows = self._query("SELECT * FROM monitoring_sessions ORDER BY started_at DESC LIMIT ?", (limit,))
+        return [
+            {
+                "monitoring_id": row["monitoring_id"],
+                "started_at": _iso(row["started_at"]),
+                "completed_at": _iso(row["completed_at"]),
+                "total_jobs": row["total_jobs"],
+                "failed_jobs": row["failed_jobs"],
+                "successful_jobs": row["successful_jobs"],
+            }
+            for row in rows
+        ]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+_stores: Dict[str, LocalHistoryStore] = {}
+
+
+def get_local_history_store(path: Optional[str] = None, retention_days: Optional[int] = None) -> LocalHistoryStore:
+    """
+    Get the shared store for a database file (defaults from settings).
+
+    Args:
+        path: SQLite file; defaults to settings.local_history_path
+        retention_days: Retention window; defaults to settings.local_history_retention_days
+
+    Returns:
+        LocalHistoryStore for the path
+    """
+    from config.settings import settings
+
+    path = path or settings.local_history_path
+    store = _stores.get(path)
+    if store is None:
+        store = LocalHistoryStore(
+            path,
+            retention_days=retention_days if retention_days is not None else settings.local_history_retention_days,
+        )
+        _stores[path] = store
+    return store
+
+
+# Convenience functions for agent tools and the CLI
+
+async def record_local_cycle(
+    monitoring_id: str,
+    started_at: datetime,
+    records: List[JobStatusRecord],
+    errors: Optional[List[str]] = None,
+) -> int:
+    """
+    Store a cycle in the local history without blocking the event loop.
+
+    Returns:
+        Number of records written
+
+    Raises:
+        LocalHistoryError: On SQLite errors
+    """
+    store = get_local_history_store()
+    return await asyncio.to_thread(store.record_cycle, monitoring_id, started_at, records, errors)
+
+
+async def get_local_recent_jobs(
+    platform: Optional[str] = None,
+    hours_back: int = 24,
+    status: Optional[str] = None,
+    limit: int = 100,
+) -> List[Dict[str, Any]]:
+    """Query recent records from the local history."""
+    store = get_local_history_store()
+    return await asyncio.to_thread(store.recent_records, platform, hours_back, status, limit)
+
+
+async def get_local_job_history(platform: str, job_id: str, limit: int = 50) -> List[Dict[str, Any]]:
+    """Query one job's history from the local store."""
+    store = get_local_history_store()
+    return await asyncio.to_thread(store.job_history, platform, job_id, limit)
+
+
+async def get_local_failure_summary(hours_back: int = 168, limit: int = 20) -> List[Dict[str, Any]]:
+    """Query the jobs with the most failures from the local store."""
+    store = get_local_history_store()
+    return await asyncio.to_thread(store.failure_summary, hours_back, limit)
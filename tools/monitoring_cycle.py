@@ -0,0 +1,252 @@
+"""
+Per-cycle state shared by every collector in a monitoring run.
+
+The cycle is installed in a context variable by `run_full_monitoring_cycle`, so
+collectors called from agent tools can report what they finished. When the
+cycle deadline hits, the partial results are assembled into a MonitoringResult.
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Set
+
+from .deadline import Deadline, deadline_scope
+from .instance_context import current_instance, tag_instance_records
+from .request_coalescing import RequestCoalescer, coalescing_scope
+from analytics.dependency_graph import GraphAnalysis, PipelineGraph, node_label, record_node
+from analytics.duration_anomaly import DurationAnomaly, DurationAnomalyDetector
+from analytics.error_fingerprints import ErrorFingerprintStore
+from models.job_status import (
+    JobStatus,
+    PlatformType,
+    RiskLevel,
+    NotificationPriority,
+    JobStatusRecord,
+    HealthAssessment,
+    PlatformHealthSummary,
+    MonitoringResult,
+)
+from models.platform_models import SnowflakeTaskDefinitionChange
+
+logger = logging.getLogger(__name__)
+
+# Steps that run after collection and must still happen when the deadline hits
+STORAGE_STEP = "storage"
+NOTIFICATION_STEP = "notification"
+
+
+class MonitoringCycle:
+    """Collects platform results and completed steps for one monitoring cycle."""
+
+    def __init__(
+        self,
+        monitoring_id: str,
+        deadline: Deadline,
+        expected_platforms: List[PlatformType],
+        finalize_reserve_seconds: float = 0.0,
+        request_memo_ttl: float = 0.0,
+        duration_detector: Optional[DurationAnomalyDetector] = None,
+        error_fingerprints: Optional[ErrorFingerprintStore] = None,
+        pipeline_graph: Optional[PipelineGraph] = None,
+    ):
+        """
+        Initialize monitoring cycle.
+
+        Args:
+            monitoring_id: Monitoring session ID
+            deadline: Deadline for the whole cycle, including storage and notification
+            expected_platforms: Platforms the cycle is expected to collect
+            finalize_reserve_seconds: Time held back from collection for storage and notification
+            request_memo_ttl: Seconds repeated GET requests in the cycle reuse a response
+            duration_detector: Per-job duration baselines that collected records are checked against
+            error_fingerprints: Error signature counts that collected failures are added to
+            pipeline_graph: Cross-platform job dependencies used to correlate failures
+        """
+        self.monitoring_id = monitoring_id
+        self.deadline = deadline
+        self.collection_deadline = deadline.reserve(finalize_reserve_seconds, "monitoring collection")
+        self.expected_platforms = list(expected_platforms)
+        self.started_at = datetime.now(timezone.utc)
+        self.job_records: Dict[PlatformType, Dict[str, JobStatusRecord]] = {}
+        self.errors: List[str] = []
+        self.completed_steps: Set[str] = set()
+        self.request_coalescer = RequestCoalescer(memo_ttl=request_memo_ttl)
+        self.duration_detector = duration_detector
+        self.duration_anomalies: List[DurationAnomaly] = []
+        self.error_fingerprints = error_fingerprints
+        self.pipeline_graph = pipeline_graph
+        self.definition_changes: List[SnowflakeTaskDefinitionChange] = []
+
+    def add_platform_records(self, platform: PlatformType, records: List[JobStatusRecord]) -> None:
+        """Record collected job records; repeated collection of a job keeps the latest record."""
+        platform_records = self.job_records.setdefault(platform, {})
+        for record in records:
+            platform_records[record.job_id] = record
+        
+        if self.duration_detector is not None:
+            anomalies = self.duration_detector.observe_records(records)
+            for anomaly in anomalies:
+                logger.warning(f"Duration anomaly on {platform.value}: {anomaly.describe()}")
+            self.duration_anomalies.extend(anomalies)
+        
+        if self.error_fingerprints is not None:
+            self.error_fingerprints.observe_records(records)
+
+    def add_error(self, message: str) -> None:
+        """Record an error encountered during the cycle."""
+        self.errors.append(message)
+
+    def mark_step_complete(self, step: str) -> None:
+        """Record that a post-collection step finished."""
+        self.completed_steps.add(step)
+
+    def missing_platforms(self) -> List[PlatformType]:
+        """Expected platforms that have not reported any records."""
+        return [p for p in self.expected_platforms if p not in self.job_records]
+
+    def all_records(self) -> List[JobStatusRecord]:
+        """All job records collected so far."""
+        return [record for records in self.job_records.values() for record in records.values()]
+
+    def analyze_dependencies(self) -> Optional[GraphAnalysis]:
+        """Correlate the records collected so far through the pipeline graph, if one is configured."""
+        if self.pipeline_graph is None:
+            return None
+        return self.pipeline_graph.analyze(self.all_records())
+
+    def build_monitoring_result(self, reason: str = "cycle deadline reached") -> MonitoringResult:
+        """
+        Assemble a MonitoringResult from whatever finished.
+
+        Args:
+            reason: Why the cycle is being assembled from partial results
+
+        Returns:
+            MonitoringResult listing the missing pieces in `errors`
+        """
+        # Failures explained by a failed upstream are reported once, under the root cause
+        analysis = self.analyze_dependencies()
+        correlated: Set[str] = set()
+        if analysis is not None:
+            for incident in analysis.incidents:
+                correlated.update(incident.failed_downstream)
+        
+        platform_summaries = []
+        for platform, records_by_id in self.job_records.items():
+            records = list(records_by_id.values())
+            failed = [r for r in records if r.status == JobStatus.FAILED]
+            # Task failures inside a failed task graph or multi-task run are
+            # reported by the parent record
+            failed_ids = {r.job_id for r in failed}
+            issues = [
+                f"{r.job_name} failed" for r in failed
+                if node_label(record_node(r)) not in correlated
+                and (r.metadata.get("graph_job_id") or r.metadata.get("parent_job_id")) not in failed_ids
+            ]
+            issues.extend(a.describe() for a in self.duration_anomalies if a.platform == platform)
+            platform_summaries.append(PlatformHealthSummary(
+                platform=platform,
+                total_jobs=len(records),
+                successful_jobs=len([r for r in records if r.status == JobStatus.SUCCESS]),
+                failed_jobs=len(failed),
+                running_jobs=len([r for r in records if r.status == JobStatus.RUNNING]),
+                platform_status="Failures detected" if failed else "Healthy",
+                issues=issues,
+            ))
+
+        missing = self.missing_platforms()
+        errors = list(self.errors)
+        errors.extend(f"Missing {p.value} results: {reason}" for p in missing)
+        critical_issues = list(errors)
+        if analysis is not None:
+            critical_issues.extend(incident.describe() for incident in analysis.incidents)
+            critical_issues.extend(f"{job} has not succeeded within its freshness limit" for job in analysis.stale_jobs)
+
+        job_records = self.all_records()
+        failed_count = len([r for r in job_records if r.status == JobStatus.FAILED])
+
+        if len(missing) > 1 or failed_count > 15:
+            risk_level = RiskLevel.CRITICAL
+        elif len(missing) == 1 or failed_count > 8:
+            risk_level = RiskLevel.HIGH
+        elif failed_count > 3:
+            risk_level = RiskLevel.MEDIUM
+        else:
+            risk_level = RiskLevel.LOW
+
+        assessment = HealthAssessment(
+            overall_health=f"Partial - {reason}",
+            risk_level=risk_level,
+            recommendations=[f"Investigate slow or unavailable {p.value} collector" for p in missing],
+            requires_notification=bool(missing) or failed_count > 0,
+            notification_priority=(
+                NotificationPriority.HIGH
+                if risk_level in (RiskLevel.HIGH, RiskLevel.CRITICAL)
+                else NotificationPriority.NORMAL
+            ),
+            jobs_analyzed=len(job_records),
+            failed_jobs_count=failed_count,
+            critical_issues=critical_issues,
+        )
+
+        return MonitoringResult(
+            monitoring_id=self.monitoring_id,
+            started_at=self.started_at,
+            completed_at=datetime.now(timezone.utc),
+            platform_summaries=platform_summaries,
+            overall_assessment=assessment,
+            job_records=job_records,
+            errors=errors,
+        )
+
+
+_current_cycle: ContextVar[Optional[MonitoringCycle]] = ContextVar("current_monitoring_cycle", default=None)
+
+
+def get_current_cycle() -> Optional[MonitoringCycle]:
+    """Get the monitoring cycle the current task belongs to, if any."""
+    return _current_cycle.get()
+
+
+@contextmanager
+def cycle_scope(cycle: MonitoringCycle) -> Iterator[MonitoringCycle]:
+    """Install a monitoring cycle, its collection deadline and request coalescer for all work started inside the block."""
+    token = _current_cycle.set(cycle)
+    try:
+        with deadline_scope(cycle.collection_deadline), coalescing_scope(cycle.request_coalescer):
+            yield cycle
+    finally:
+        _current_cycle.reset(token)
+
+
+def report_platform_records(platform: PlatformType, records: List[JobStatusRecord]) -> None:
+    """Tag records with the current instance and report them to the current cycle (if any)."""
+    tag_instance_records(records)
+    cycle = _current_cycle.get()
+    if cycle is not None:
+        cycle.add_platform_records(platform, records)
+
+
+def report_definition_changes(changes: List[SnowflakeTaskDefinitionChange]) -> None:
+    """Report task definition changes detected by a collector to the current cycle; a no-op outside a cycle."""
+    cycle = _current_cycle.get()
+    if cycle is not None:
+        cycle.definition_changes.extend(changes)
+
+
+def report_platform_error(platform: PlatformType, error: str) -> None:
+    """Report a collector error to the current cycle; a no-op outside a cycle."""
+    cycle = _current_cycle.get()
+    if cycle is not None:
+        instance = current_instance()
+        label = f"{platform.value} [{instance}]" if instance else platform.value
+        cycle.add_error(f"{label}: {error}")
+
+
+def mark_cycle_step(step: str) -> None:
+    """Mark a post-collection step complete in the current cycle; a no-op outside a cycle."""
+    cycle = _current_cycle.get()
+    if cycle is not None:
+        cycle.mark_step_complete(step)
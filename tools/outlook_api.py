@@ -2,13 +2,14 @@
 Outlook API integration tools for email notifications.
 """
 
-import asyncio
 import logging
 from typing import Optional, Dict, Any
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import httpx
 import base64
 
+from .circuit_breaker import CircuitOpenError, PlatformUnavailableError, get_circuit_breaker
+from .deadline import request_timeout, sleep_before_retry
 from models.notification_models import (
     EmailNotification,
     NotificationResult,
@@ -57,6 +58,7 @@ class OutlookAPIClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.circuit_breaker = get_circuit_breaker("outlook", self.base_url)
         self.access_token = None
         self.token_expires_at = None
     
@@ -77,28 +79,50 @@ class OutlookAPIClient:
         
         try:
             async with httpx.AsyncClient() as client:
-                response = await client.post(token_url, data=data, timeout=self.timeout)
-                
-                if response.status_code != 200:
-                    raise OutlookAPIError(f"Token request failed: {response.status_code} - {response.text}")
-                
-                token_data = response.json()
-                self.access_token = token_data["access_token"]
-                expires_in = token_data.get("expires_in", 3600)
-                self.token_expires_at = datetime.now(timezone.utc).replace(
-                    microsecond=0
-                ) + datetime.timedelta(seconds=expires_in - 60)  # 60s buffer
-                
-                return self.access_token
-                
-        except Exception as e:
+                response = await client.post(
+                    token_url, data=data, timeout=request_timeout(self.timeout, "token request")
+                )
+        except httpx.RequestError as e:
+            raise PlatformUnavailableError(f"Token request failed: {str(e)}")
+        
+        # An unreachable or throttling token endpoint counts against the circuit
+        # like any other request; a rejected token request does not
+        if response.status_code == 429 or response.status_code >= 500:
+            raise PlatformUnavailableError(f"Token request failed: {response.status_code} - {response.text}")
+        if response.status_code != 200:
+            raise OutlookAPIError(f"Token request failed: {response.status_code} - {response.text}")
+        
+        try:
+            token_data = response.json()
+            self.access_token = token_data["access_token"]
+        except (ValueError, KeyError) as e:
             raise OutlookAPIError(f"Failed to get access token: {str(e)}")
+        expires_in = token_data.get("expires_in", 3600)
+        self.token_expires_at = datetime.now(timezone.utc).replace(
+            microsecond=0
+        ) + timedelta(seconds=expires_in - 60)  # 60s buffer
+        
+        return self.access_token
     
     async def _make_request(
         self,
         method: str,
         endpoint: str,
         json_data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make HTTP request through the platform circuit breaker."""
+        try:
+            return await self.circuit_breaker.call(
+                self._send_request, method, endpoint, json_data
+            )
+        except (CircuitOpenError, PlatformUnavailableError) as e:
+            raise OutlookAPIError(str(e)) from e
+    
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Make HTTP request with retry logic and error handling."""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
@@ -118,7 +142,7 @@ class OutlookAPIClient:
                         url=url,
                         headers=headers,
                         json=json_data,
-                        timeout=self.timeout,
+                        timeout=request_timeout(self.timeout, f"{method} {endpoint}"),
                     )
                     
                     # Handle rate limiting
@@ -126,10 +150,10 @@ class OutlookAPIClient:
                         if attempt < self.max_retries:
                             delay = self.retry_delay * (2 ** attempt)
                             logger.warning(f"Rate limited, retrying in {delay}s")
-                            await asyncio.sleep(delay)
+                            await sleep_before_retry(delay, f"{method} {endpoint}")
                             continue
                         else:
-                            raise OutlookAPIError("Rate limit exceeded")
+                            raise PlatformUnavailableError("Rate limit exceeded")
                     
                     # Handle authentication errors
                     if response.status_code == 401:
@@ -141,6 +165,8 @@ class OutlookAPIClient:
                     # Handle other errors
                     if response.status_code >= 400:
                         error_msg = f"API error {response.status_code}: {response.text}"
+                        if response.status_code >= 500:
+                            raise PlatformUnavailableError(error_msg)
                         raise OutlookAPIError(error_msg)
                     
                     return response.json() if response.content else {}
@@ -148,9 +174,9 @@ class OutlookAPIClient:
             except httpx.RequestError as e:
                 if attempt < self.max_retries:
                     delay = self.retry_delay * (2 ** attempt)
-                    await asyncio.sleep(delay)
+                    await sleep_before_retry(delay, f"{method} {endpoint}")
                     continue
-                raise OutlookAPIError(f"Request failed: {str(e)}")
+                raise PlatformUnavailableError(f"Request failed: {str(e)}")
         
         raise OutlookAPIError("Max retries exceeded")
     
@@ -2,17 +2,23 @@
 Power Automate (Microsoft Graph) API integration tools for flow monitoring.
 """
 
-import asyncio
 import logging
 from typing import List, Optional, Dict, Any
-from datetime import datetime, timezone
+from datetime import timedelta
 import httpx
 
+from .circuit_breaker import CircuitOpenError, PlatformUnavailableError, get_circuit_breaker
+from .deadline import request_timeout, sleep_before_retry
+from .request_coalescing import coalesce_request, request_identity
+from .monitoring_cycle import report_platform_records, report_platform_error
 from models.job_status import JobStatusRecord, PlatformType
+from models.timestamps import duration_seconds, try_parse_timestamp, utc_now
+from models.status_mapping import map_powerautomate_status
 from models.platform_models import (
     PowerAutomateFlowRunsResponse,
     PowerAutomateFlow,
-    map_powerautomate_status,
+    parse_response,
+    parse_rows,
 )
 
 logger = logging.getLogger(__name__)
@@ -58,13 +64,15 @@ class PowerAutomateAPIClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.circuit_breaker = get_circuit_breaker("power_automate", self.base_url)
+        self.request_identity = request_identity(self.tenant_id, self.client_id)
         self.access_token = None
         self.token_expires_at = None
     
     async def _get_access_token(self) -> str:
         """Get OAuth2 access token for Microsoft Graph API."""
         if self.access_token and self.token_expires_at:
-            if datetime.now(timezone.utc) < self.token_expires_at:
+            if utc_now() < self.token_expires_at:
                 return self.access_token
         
         token_url = f"https://login.microsoftonline.com/{self.tenant_id}/oauth2/v2.0/token"
@@ -78,22 +86,28 @@ class PowerAutomateAPIClient:
         
         try:
             async with httpx.AsyncClient() as client:
-                response = await client.post(token_url, data=data, timeout=self.timeout)
-                
-                if response.status_code != 200:
-                    raise PowerAutomateAPIError(f"Token request failed: {response.status_code} - {response.text}")
-                
-                token_data = response.json()
-                self.access_token = token_data["access_token"]
-                expires_in = token_data.get("expires_in", 3600)
-                self.token_expires_at = datetime.now(timezone.utc).replace(
-                    microsecond=0
-                ) + datetime.timedelta(seconds=expires_in - 60)  # 60s buffer
-                
-                return self.access_token
-                
-        except Exception as e:
+                response = await client.post(
+                    token_url, data=data, timeout=request_timeout(self.timeout, "token request")
+                )
+        except httpx.RequestError as e:
+            raise PlatformUnavailableError(f"Token request failed: {str(e)}")
+        
+        # An unreachable or throttling token endpoint counts against the circuit
+        # like any other request; a rejected token request does not
+        if response.status_code == 429 or response.status_code >= 500:
+            raise PlatformUnavailableError(f"Token request failed: {response.status_code} - {response.text}")
+        if response.status_code != 200:
+            raise PowerAutomateAPIError(f"Token request failed: {response.status_code} - {response.text}")
+        
+        try:
+            token_data = response.json()
+            self.access_token = token_data["access_token"]
+        except (ValueError, KeyError) as e:
             raise PowerAutomateAPIError(f"Failed to get access token: {str(e)}")
+        expires_in = token_data.get("expires_in", 3600)
+        self.token_expires_at = utc_now() + timedelta(seconds=expires_in - 60)  # 60s buffer
+        
+        return self.access_token
     
     async def _make_request(
         self,
@@ -101,7 +115,30 @@ class PowerAutomateAPIClient:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+        raw: bool = False,
+    ) -> Any:
+        """Make HTTP request through the platform circuit breaker."""
+        try:
+            return await coalesce_request(
+                method,
+                f"{self.base_url}/{endpoint.lstrip('/')}",
+                params,
+                self.request_identity,
+                self.circuit_breaker.call,
+                self._send_request, method, endpoint, params, json_data, raw,
+                response_format="raw" if raw else "json",
+            )
+        except (CircuitOpenError, PlatformUnavailableError) as e:
+            raise PowerAutomateAPIError(str(e)) from e
+    
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        raw: bool = False,
+    ) -> Any:
         """Make HTTP request with retry logic and error handling."""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         
@@ -121,7 +158,7 @@ class PowerAutomateAPIClient:
                         headers=headers,
                         params=params,
                         json=json_data,
-                        timeout=self.timeout,
+                        timeout=request_timeout(self.timeout, f"{method} {endpoint}"),
                     )
                     
                     # Handle rate limiting
@@ -129,10 +166,10 @@ class PowerAutomateAPIClient:
                         if attempt < self.max_retries:
                             delay = self.retry_delay * (2 ** attempt)
                             logger.warning(f"Rate limited, retrying in {delay}s")
-                            await asyncio.sleep(delay)
+                            await sleep_before_retry(delay, f"{method} {endpoint}")
                             continue
                         else:
-                            raise PowerAutomateAPIError("Rate limit exceeded")
+                            raise PlatformUnavailableError("Rate limit exceeded")
                     
                     # Handle authentication errors
                     if response.status_code == 401:
@@ -144,16 +181,18 @@ class PowerAutomateAPIClient:
                     # Handle other errors
                     if response.status_code >= 400:
                         error_msg = f"API error {response.status_code}: {response.text}"
+                        if response.status_code >= 500:
+                            raise PlatformUnavailableError(error_msg)
                         raise PowerAutomateAPIError(error_msg)
                     
-                    return response.json()
+                    return response.content if raw else response.json()
                     
             except httpx.RequestError as e:
                 if attempt < self.max_retries:
                     delay = self.retry_delay * (2 ** attempt)
-                    await asyncio.sleep(delay)
+                    await sleep_before_retry(delay, f"{method} {endpoint}")
                     continue
-                raise PowerAutomateAPIError(f"Request failed: {str(e)}")
+                raise PlatformUnavailableError(f"Request failed: {str(e)}")
         
         raise PowerAutomateAPIError("Max retries exceeded")
     
@@ -162,7 +201,7 @@ class PowerAutomateAPIClient:
         try:
             response_data = await self._make_request("GET", "solutions/flows")
             flows_data = response_data.get("value", [])
-            return [PowerAutomateFlow(**flow) for flow in flows_data]
+            return parse_rows(PowerAutomateFlow, flows_data)
         except Exception as e:
             logger.error(f"Failed to get Power Automate flows: {e}")
             raise PowerAutomateAPIError(f"Failed to get flows: {str(e)}")
@@ -173,8 +212,8 @@ class PowerAutomateAPIClient:
         
         try:
             endpoint = f"solutions/flows/{flow_id}/runs"
-            response_data = await self._make_request("GET", endpoint, params=params)
-            return PowerAutomateFlowRunsResponse(**response_data)
+            response_body = await self._make_request("GET", endpoint, params=params, raw=True)
+            return parse_response(PowerAutomateFlowRunsResponse, response_body)
         except Exception as e:
             logger.error(f"Failed to get flow runs for {flow_id}: {e}")
             raise PowerAutomateAPIError(f"Failed to get flow runs: {str(e)}")
@@ -190,34 +229,25 @@ async def get_powerautomate_job_status(
     """Get job status records from Power Automate API."""
     client = PowerAutomateAPIClient(client_id, client_secret, tenant_id)
     
+    # Fail fast while the platform circuit is open
+    if client.circuit_breaker.is_open:
+        raise CircuitOpenError(client.circuit_breaker)
+    
     try:
         flows = await client.get_flows()
         job_records = []
+        checked_at = utc_now()
         
         for flow in flows[:10]:  # Limit to first 10 flows to avoid timeout
             try:
                 runs_response = await client.get_flow_runs(flow.id, limit=10)
                 
                 for run in runs_response.value:
-                    # Parse timestamps
-                    last_run_time = None
-                    if run.start_time:
-                        try:
-                            last_run_time = datetime.fromisoformat(
-                                run.start_time.replace('Z', '+00:00')
-                            )
-                        except ValueError:
-                            logger.warning(f"Failed to parse start time for run {run.run_id}")
-                    
-                    # Calculate duration
-                    duration_seconds = None
-                    if run.start_time and run.end_time:
-                        try:
-                            start = datetime.fromisoformat(run.start_time.replace('Z', '+00:00'))
-                            end = datetime.fromisoformat(run.end_time.replace('Z', '+00:00'))
-                            duration_seconds = int((end - start).total_seconds())
-                        except ValueError:
-                            pass
+                    # Parse timestamps once; the duration reuses the parsed start time
+                    last_run_time = try_parse_timestamp(run.start_time)
+                    if run.start_time and last_run_time is None:
+                        logger.warning(f"Failed to parse start time for run {run.run_id}")
+                    ended_at = try_parse_timestamp(run.end_time)
                     
                     record = JobStatusRecord(
                         job_id=f"powerautomate_{flow.id}_{run.run_id}",
@@ -225,13 +255,13 @@ async def get_powerautomate_job_status(
                         job_name=flow.display_name,
                         status=map_powerautomate_status(run.status),
                         last_run_time=last_run_time,
-                        duration_seconds=duration_seconds,
+                        duration_seconds=duration_seconds(last_run_time, ended_at),
                         metadata={
                             "flow_id": flow.id,
                             "run_id": run.run_id,
                             "flow_state": flow.state,
                         },
-                        checked_at=datetime.now(timezone.utc),
+                        checked_at=checked_at,
                     )
                     job_records.append(record)
                     
@@ -240,8 +270,10 @@ async def get_powerautomate_job_status(
                 continue
         
         logger.info(f"Successfully retrieved {len(job_records)} Power Automate records")
+        report_platform_records(PlatformType.POWER_AUTOMATE, job_records)
         return job_records
         
     except Exception as e:
         logger.error(f"Failed to get Power Automate job status: {e}")
+        report_platform_error(PlatformType.POWER_AUTOMATE, str(e))
         raise PowerAutomateAPIError(f"Failed to get job status: {str(e)}")
\ No newline at end of file
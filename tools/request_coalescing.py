@@ -0,0 +1,221 @@
+"""
+Single-flight request coalescing for the HTTP API clients.
+
+Within a monitoring cycle several agents (and repeated LLM tool calls) issue
+the same GET requests. A coalescer shares one in-flight request between all
+identical callers and can memoize the response for a short TTL, so a cycle
+makes one network call per distinct request.
+
+A shared request runs on the client of the caller that started it, so a
+client with its own connection pool passes itself as the request owner and
+waits for wait_for_shared_requests before closing; callers sharing its
+request are then unaffected by it going away.
+"""
+
+import asyncio
+import copy
+import hashlib
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Set, Tuple
+
+from models.serialization import dumps
+from .instance_context import run_limited
+
+logger = logging.getLogger(__name__)
+
+RequestKey = Tuple[str, str, str, str, str]
+
+# Only idempotent requests are safe to share between callers
+COALESCED_METHODS = frozenset({"GET"})
+
+
+def request_identity(*credentials: Optional[str]) -> str:
+    """
+    Derive a stable caller identity from credentials without keeping them in keys.
+
+    Args:
+        credentials: Values that distinguish who is making the request
+
+    Returns:
+        Short hash of the credentials
+    """
+    material = "\x1f".join(c or "" for c in credentials)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+
+def make_request_key(
+    method: str,
+    url: str,
+    params: Optional[Dict[str, Any]],
+    identity: str,
+    response_format: str = "json",
+) -> RequestKey:
+    """Build the coalescing key for a request."""
+    params_key = dumps(params or {}, sort_keys=True)
+    return (method.upper(), url, params_key, identity, response_format)
+
+
+class RequestCoalescer:
+    """Shares identical in-flight requests and memoizes their responses for a short TTL."""
+
+    def __init__(self, memo_ttl: float = 0.0):
+        """
+        Initialize request coalescer.
+
+        Args:
+            memo_ttl: Seconds a response is reused for repeat requests (0 disables the memo)
+        """
+        self.memo_ttl = memo_ttl
+        self._in_flight: Dict[RequestKey, "asyncio.Future[Any]"] = {}
+        self._memo: Dict[RequestKey, Tuple[float, Any]] = {}
+        # Shared requests in flight by id() of the client running them
+        self._owned: Dict[int, Set["asyncio.Future[Any]"]] = {}
+        self.network_calls = 0
+        self.coalesced_calls = 0
+        self.memo_hits = 0
+
+    def _memo_get(self, key: RequestKey) -> Tuple[bool, Any]:
+        """Look up an unexpired memoized response."""
+        entry = self._memo.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._memo[key]
+            return False, None
+        return True, value
+
+    def _on_done(self, key: RequestKey, owner_id: Optional[int], task: "asyncio.Future[Any]") -> None:
+        """Retire a finished request and memoize it if it succeeded."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if owner_id is not None:
+            owned = self._owned.get(owner_id)
+            if owned is not None:
+                owned.discard(task)
+                if not owned:
+                    del self._owned[owner_id]
+        if task.cancelled():
+            return
+        if task.exception() is None and self.memo_ttl > 0:
+            self._memo[key] = (time.monotonic() + self.memo_ttl, task.result())
+
+    async def run(
+        self,
+        key: RequestKey,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        owner: Any = None,
+    ) -> Any:
+        """
+        Run a request, sharing it with identical concurrent or recent callers.
+
+        Every caller receives its own copy of the response, so parsing code
+        is free to modify it.
+
+        Args:
+            key: Coalescing key from make_request_key
+            func: Coroutine function performing the request
+            args: Arguments for func
+            owner: Client whose resources func uses; see wait_for_owner
+
+        Returns:
+            Response of the shared request
+        """
+        found, value = self._memo_get(key)
+        if found:
+            self.memo_hits += 1
+            return copy.deepcopy(value)
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced_calls += 1
+            # Shield the shared request so one caller giving up does not cancel it for the others
+            return copy.deepcopy(await asyncio.shield(task))
+
+        self.network_calls += 1
+        task = asyncio.ensure_future(func(*args))
+        self._in_flight[key] = task
+        owner_id = None if owner is None else id(owner)
+        if owner_id is not None:
+            self._owned.setdefault(owner_id, set()).add(task)
+        task.add_done_callback(lambda t: self._on_done(key, owner_id, t))
+        # Every caller gets a copy so the shared and memoized response stays pristine
+        return copy.deepcopy(await asyncio.shield(task))
+
+    async def wait_for_owner(self, owner: Any) -> None:
+        """Wait until the shared requests running on a client have finished, whatever their outcome."""
+        owned = self._owned.get(id(owner))
+        if owned:
+            await asyncio.wait(set(owned))
+
+    def stats(self) -> Dict[str, int]:
+        """Get request counts for the coalescer's lifetime."""
+        return {
+            "network_calls": self.network_calls,
+            "coalesced_calls": self.coalesced_calls,
+            "memo_hits": self.memo_hits,
+        }
+
+
+_current_coalescer: ContextVar[Optional[RequestCoalescer]] = ContextVar("current_request_coalescer", default=None)
+
+
+def get_current_coalescer() -> Optional[RequestCoalescer]:
+    """Get the request coalescer of the enclosing cycle, if any."""
+    return _current_coalescer.get()
+
+
+@contextmanager
+def coalescing_scope(coalescer: Optional[RequestCoalescer]) -> Iterator[Optional[RequestCoalescer]]:
+    """Install a request coalescer for all work started inside the block."""
+    token = _current_coalescer.set(coalescer)
+    try:
+        yield coalescer
+    finally:
+        _current_coalescer.reset(token)
+
+
+async def wait_for_shared_requests(owner: Any) -> None:
+    """Wait for the shared requests a client started in the current coalescer; call before closing the client."""
+    coalescer = _current_coalescer.get()
+    if coalescer is not None:
+        await coalescer.wait_for_owner(owner)
+
+
+async def coalesce_request(
+    method: str,
+    url: str,
+    params: Optional[Dict[str, Any]],
+    identity: str,
+    func: Callable[..., Awaitable[Any]],
+    *args: Any,
+    response_format: str = "json",
+    owner: Any = None,
+) -> Any:
+    """
+    Run a request through the current coalescer, or directly outside a cycle.
+
+    Args:
+        method: HTTP method; only GET requests are coalesced
+        url: Full request URL
+        params: Query parameters
+        identity: Caller identity from request_identity
+        func: Coroutine function performing the request
+        args: Arguments for func
+        response_format: "json" or "raw"; the same request in different formats is not shared
+        owner: Client whose resources func uses, if it must outlive its requests
+            (see wait_for_shared_requests)
+
+    Returns:
+        Response of the request
+    """
+    coalescer = _current_coalescer.get()
+    if coalescer is None or method.upper() not in COALESCED_METHODS:
+        return await run_limited(func, *args)
+
+    key = make_request_key(method, url, params, identity, response_format)
+    return await coalescer.run(key, run_limited, func, *args, owner=owner)
@@ -6,9 +6,11 @@ import asyncio
 import logging
 from typing import List, Optional, Dict, Any
 import snowflake.connector
-import json
 
+from .deadline import statement_timeout
 from models.job_status import JobStatusRecord, PlatformHealthSummary, MonitoringResult
+from models.job_batch import JobStatusBatch
+from models.serialization import dumps
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +70,10 @@ class SnowflakeDBAPIClient:
                 if self.role:
                     connection_params["role"] = self.role
                 
+                login_timeout = statement_timeout("Snowflake connect")
+                if login_timeout is not None:
+                    connection_params["login_timeout"] = login_timeout
+                
                 # Run connection in thread pool since it's not async
                 loop = asyncio.get_event_loop()
                 self.connection = await loop.run_in_executor(
@@ -93,14 +99,15 @@ class SnowflakeDBAPIClient:
         
         try:
             loop = asyncio.get_event_loop()
+            timeout = statement_timeout("Snowflake query")
             
             def _run_query():
                 cursor = connection.cursor()
                 try:
                     if params:
-                        cursor.execute(query, params)
+                        cursor.execute(query, params, timeout=timeout)
                     else:
-                        cursor.execute(query)
+                        cursor.execute(query, timeout=timeout)
                     
                     if fetch_results:
                         # Get column names
@@ -207,6 +214,13 @@ class SnowflakeDBAPIClient:
         if not records:
             return 0
         
+        return await self.insert_job_status_batch(JobStatusBatch.from_records(records))
+    
+    async def insert_job_status_batch(self, batch: JobStatusBatch) -> int:
+        """Insert a columnar batch of job status records into the database."""
+        if not len(batch):
+            return 0
+        
         await self.create_tables_if_not_exist()
         
         # Prepare batch insert query
@@ -222,35 +236,19 @@ class SnowflakeDBAPIClient:
             connection = await self._get_connection()
             cursor = connection.cursor()
             
-            # Prepare batch data
-            batch_data = []
-            for record in records:
-                record_id = f"{record.platform}_{record.job_id}_{int(record.checked_at.timestamp())}"
-                
-                # Convert metadata to JSON string
-                metadata_json = json.dumps(record.metadata) if record.metadata else None
-                
-                row_data = [
-                    record_id,
-                    record.job_id,
-                    record.platform.value,
-                    record.job_name,
-                    record.status.value,
-                    record.last_run_time,
-                    record.duration_seconds,
-                    record.error_message,
-                    metadata_json,
-                    record.checked_at,
-                ]
-                batch_data.append(row_data)
+            # Prepare batch data straight from the columns
+            batch_data = batch.to_bind_rows()
             
             # Execute batch insert
             loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, cursor.executemany, insert_query, batch_data)
+            timeout = statement_timeout("job status insert")
+            await loop.run_in_executor(
+                None, lambda: cursor.executemany(insert_query, batch_data, timeout=timeout)
+            )
             cursor.close()
             
-            logger.info(f"Successfully inserted {len(records)} job status records")
-            return len(records)
+            logger.info(f"Successfully inserted {len(batch)} job status records")
+            return len(batch)
             
         except Exception as e:
             logger.error(f"Failed to insert job status records: {e}")
@@ -281,9 +279,9 @@ class SnowflakeDBAPIClient:
                 monitoring_result.total_jobs_monitored,
                 failed_count,
                 success_count,
-                json.dumps(monitoring_result.overall_assessment.dict()) if monitoring_result.overall_assessment else None,
-                json.dumps([s.dict() for s in monitoring_result.platform_summaries]),
-                json.dumps(monitoring_result.errors),
+                dumps(monitoring_result.overall_assessment) if monitoring_result.overall_assessment else None,
+                dumps(monitoring_result.platform_summaries),
+                dumps(monitoring_result.errors),
             ]
             
             await self._execute_query(insert_query, data)
@@ -330,7 +328,7 @@ class SnowflakeDBAPIClient:
                 summary.running_jobs,
                 summary.platform_status,
                 summary.last_check,
-                json.dumps(summary.issues),
+                dumps(summary.issues),
                 summary.success_rate,
                 summary.failure_rate,
             ]
@@ -339,7 +337,10 @@ class SnowflakeDBAPIClient:
         connection = await self._get_connection()
         cursor = connection.cursor()
         loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, cursor.executemany, insert_query, batch_data)
+        timeout = statement_timeout("platform summary insert")
+        await loop.run_in_executor(
+            None, lambda: cursor.executemany(insert_query, batch_data, timeout=timeout)
+        )
         cursor.close()
     
     async def get_recent_job_status(
@@ -411,6 +412,33 @@ async def store_job_status_records(
         await client.close()
 
 
+async def store_job_status_batch(
+    batch: JobStatusBatch,
+    account: str,
+    user: str,
+    password: str,
+    database: str = "DEV_POWERAPPS",
+    schema: str = "AUDIT_JOB_HUB",
+    warehouse: str = "COMPUTE_WH",
+    role: Optional[str] = None,
+) -> int:
+    """Store a columnar batch of job status records in Snowflake database."""
+    client = SnowflakeDBAPIClient(
+        account=account,
+        user=user,
+        password=password,
+        database=database,
+        schema=schema,
+        warehouse=warehouse,
+        role=role,
+    )
+    
+    try:
+        return await client.insert_job_status_batch(batch)
+    finally:
+        await client.close()
+
+
 async def store_monitoring_result(
     monitoring_result: MonitoringResult,
     account: str,
@@ -3,20 +3,46 @@ Snowflake Task API integration tools for task monitoring.
 """
 
 import asyncio
+import heapq
+import json
 import logging
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timezone
+from bisect import bisect_right
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from fnmatch import fnmatchcase
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 import snowflake.connector
 
-from models.job_status import JobStatusRecord, PlatformType
+from .deadline import statement_timeout
+from .monitoring_cycle import report_definition_changes, report_platform_records, report_platform_error
+from .instance_context import instance_state_path
+from models.job_status import JobStatus, JobStatusRecord, PlatformType
+from models.state_file import PersistentState, StateRegistry
+from models.timestamps import duration_seconds, ensure_utc, try_parse_timestamp, utc_now
+from models.status_mapping import map_snowflake_task_status
 from models.platform_models import (
+    SnowflakeTaskDefinitionChange,
     SnowflakeTaskHistory,
     SnowflakeTaskInfo,
-    map_snowflake_task_status,
+    parse_rows,
+)
+from .snowflake_task_catalog import (
+    TaskCatalog,
+    get_task_catalog,
+    qualified_task_name,
 )
 
 logger = logging.getLogger(__name__)
 
+# Upper bound Snowflake accepts for TASK_HISTORY's RESULT_LIMIT
+MAX_TASK_HISTORY_RESULT_LIMIT = 10000
+
+# Task states that can still change on a later poll
+OPEN_TASK_STATES = frozenset({"SCHEDULED", "EXECUTING"})
+
+WATERMARK_STATE_VERSION = 1
+
 
 class SnowflakeTaskAPIError(Exception):
     """Custom exception for Snowflake Task API errors."""
@@ -35,6 +61,7 @@ class SnowflakeTaskAPIClient:
         schema: str = "AUDIT_JOB_HUB",
         warehouse: str = "COMPUTE_WH",
         role: Optional[str] = None,
+        max_sessions: int = 4,
     ):
         """
         Initialize Snowflake Task API client.
@@ -47,6 +74,7 @@ class SnowflakeTaskAPIClient:
             schema: Schema name
             warehouse: Warehouse name
             role: Optional role name
+            max_sessions: Sessions opened for concurrent per-database queries
         """
         self.account = account
         self.user = user
@@ -55,49 +83,93 @@ class SnowflakeTaskAPIClient:
         self.schema = schema
         self.warehouse = warehouse
         self.role = role
+        self.max_sessions = max(1, max_sessions)
         self.connection = None
+        self._idle_sessions: List[snowflake.connector.SnowflakeConnection] = []
+        self._open_sessions: List[snowflake.connector.SnowflakeConnection] = []
+        self._session_slots: Optional[asyncio.Semaphore] = None
+    
+    async def _connect(self) -> snowflake.connector.SnowflakeConnection:
+        """Open a new Snowflake session."""
+        try:
+            connection_params = {
+                "account": self.account,
+                "user": self.user,
+                "password": self.password,
+                "database": self.database,
+                "schema": self.schema,
+                "warehouse": self.warehouse,
+            }
+            
+            if self.role:
+                connection_params["role"] = self.role
+            
+            login_timeout = statement_timeout("Snowflake connect")
+            if login_timeout is not None:
+                connection_params["login_timeout"] = login_timeout
+            
+            # Run connection in thread pool since it's not async
+            loop = asyncio.get_event_loop()
+            connection = await loop.run_in_executor(
+                None, lambda: snowflake.connector.connect(**connection_params)
+            )
+            
+            logger.info("Connected to Snowflake successfully")
+            return connection
+            
+        except Exception as e:
+            logger.error(f"Failed to connect to Snowflake: {e}")
+            raise SnowflakeTaskAPIError(f"Connection failed: {str(e)}")
     
     async def _get_connection(self) -> snowflake.connector.SnowflakeConnection:
         """Get or create Snowflake connection."""
         if self.connection is None or self.connection.is_closed():
-            try:
-                connection_params = {
-                    "account": self.account,
-                    "user": self.user,
-                    "password": self.password,
-                    "database": self.database,
-                    "schema": self.schema,
-                    "warehouse": self.warehouse,
-                }
-                
-                if self.role:
-                    connection_params["role"] = self.role
-                
-                # Run connection in thread pool since it's not async
-                loop = asyncio.get_event_loop()
-                self.connection = await loop.run_in_executor(
-                    None, lambda: snowflake.connector.connect(**connection_params)
-                )
-                
-                logger.info("Connected to Snowflake successfully")
-                
-            except Exception as e:
-                logger.error(f"Failed to connect to Snowflake: {e}")
-                raise SnowflakeTaskAPIError(f"Connection failed: {str(e)}")
-        
+            self.connection = await self._connect()
         return self.connection
     
-    async def _execute_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """Execute SQL query and return results."""
-        connection = await self._get_connection()
+    @asynccontextmanager
+    async def _pooled_session(self) -> AsyncIterator[snowflake.connector.SnowflakeConnection]:
+        """
+        Borrow a session for one concurrent query.
+        
+        At most max_sessions are open at once; sessions are reused across
+        queries and closed with the client.
+        """
+        if self._session_slots is None:
+            self._session_slots = asyncio.Semaphore(self.max_sessions)
+        
+        async with self._session_slots:
+            connection = None
+            while self._idle_sessions and connection is None:
+                candidate = self._idle_sessions.pop()
+                if not candidate.is_closed():
+                    connection = candidate
+            if connection is None:
+                connection = await self._connect()
+                self._open_sessions.append(connection)
+            try:
+                yield connection
+            finally:
+                self._idle_sessions.append(connection)
+    
+    async def _execute_query(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        connection: Optional[snowflake.connector.SnowflakeConnection] = None,
+    ) -> List[Dict[str, Any]]:
+        """Execute SQL query and return results (on the client's connection unless one is given)."""
+        if connection is None:
+            connection = await self._get_connection()
         
         try:
             loop = asyncio.get_event_loop()
+            timeout = statement_timeout("Snowflake task query")
             
             def _run_query():
                 cursor = connection.cursor()
                 try:
-                    cursor.execute(query, params or {})
+                    cursor.execute(query, params or {}, timeout=timeout)
                     
                     # Get column names
                     columns = [desc[0] for desc in cursor.description] if cursor.description else []
@@ -129,20 +201,54 @@ class SnowflakeTaskAPIClient:
         task_name: Optional[str] = None,
         limit: int = 100,
         hours_back: int = 24,
+        scheduled_time_range_start: Optional[datetime] = None,
+        database: Optional[str] = None,
+        schemas: Optional[List[str]] = None,
+        connection: Optional[snowflake.connector.SnowflakeConnection] = None,
     ) -> List[SnowflakeTaskHistory]:
         """
         Get task execution history.
         
+        The time range and row limit are passed to the TASK_HISTORY table
+        function itself (SCHEDULED_TIME_RANGE_START, RESULT_LIMIT), so
+        Snowflake only materializes the requested window instead of
+        filtering the function's full output.
+        
         Args:
             task_name: Optional specific task name
-            limit: Maximum number of records
+            limit: Maximum number of records (RESULT_LIMIT, at most 10000)
             hours_back: How many hours back to look
+            scheduled_time_range_start: Explicit start of the scheduled-time
+                window; overrides hours_back
+            database: Database whose INFORMATION_SCHEMA is read; defaults to the current one
+            schemas: Optional schema names to restrict the history to
+            connection: Session to run on; defaults to the client's connection
             
         Returns:
             List of SnowflakeTaskHistory objects
         """
-        # Base query for task history
-        query = """
+        if scheduled_time_range_start is None:
+            scheduled_time_range_start = utc_now() - timedelta(hours=hours_back)
+        
+        params = {
+            "range_start": ensure_utc(scheduled_time_range_start).isoformat(),
+            "limit": min(limit, MAX_TASK_HISTORY_RESULT_LIMIT),
+        }
+        task_filter = ""
+        if task_name:
+            task_filter = ", TASK_NAME => %(task_name)s"
+            params["task_name"] = task_name
+        
+        information_schema = f"{_quote_identifier(database)}.INFORMATION_SCHEMA" if database else "INFORMATION_SCHEMA"
+        schema_filter = ""
+        if schemas:
+            placeholders = []
+            for i, schema_name in enumerate(schemas):
+                params[f"schema_{i}"] = schema_name
+                placeholders.append(f"%(schema_{i})s")
+            schema_filter = f"WHERE SCHEMA_NAME IN ({', '.join(placeholders)})"
+        
+        query = f"""
         SELECT 
             NAME,
             DATABASE_NAME,
@@ -156,30 +262,43 @@ class SnowflakeTaskAPIClient:
             RUN_ID,
             ERROR_CODE,
             ERROR_MESSAGE
-        FROM TABLE(INFORMATION_SCHEMA.TASK_HISTORY())
-        WHERE SCHEDULED_TIME >= DATEADD(hour, -%(hours_back)s, CURRENT_TIMESTAMP())
+        FROM TABLE({information_schema}.TASK_HISTORY(
+            SCHEDULED_TIME_RANGE_START => TO_TIMESTAMP_LTZ(%(range_start)s),
+            RESULT_LIMIT => %(limit)s{task_filter}
+        ))
+        {schema_filter}
+        ORDER BY SCHEDULED_TIME DESC
         """
         
-        params = {"hours_back": hours_back}
-        
-        if task_name:
-            query += " AND NAME = %(task_name)s"
-            params["task_name"] = task_name
-        
-        query += " ORDER BY SCHEDULED_TIME DESC LIMIT %(limit)s"
-        params["limit"] = limit
-        
         try:
-            results = await self._execute_query(query, params)
-            return [SnowflakeTaskHistory(**row) for row in results]
+            results = await self._execute_query(query, params, connection)
+            if len(results) >= params["limit"]:
+                logger.warning(
+                    f"Task history hit RESULT_LIMIT ({params['limit']}); older executions in the window were not returned"
+                )
+            return parse_rows(SnowflakeTaskHistory, results)
             
         except Exception as e:
             logger.error(f"Failed to get task history: {e}")
             raise SnowflakeTaskAPIError(f"Failed to get task history: {str(e)}")
     
-    async def get_tasks(self) -> List[SnowflakeTaskInfo]:
-        """Get list of all tasks in the current database/schema."""
-        query = """
+    async def get_tasks(self, names: Optional[List[str]] = None) -> List[SnowflakeTaskInfo]:
+        """
+        Get list of all tasks in the current database/schema.
+        
+        Args:
+            names: Optional task names to restrict the query to
+        """
+        params = {}
+        name_filter = ""
+        if names:
+            placeholders = []
+            for i, name in enumerate(names):
+                params[f"name_{i}"] = name
+                placeholders.append(f"%(name_{i})s")
+            name_filter = f"AND NAME IN ({', '.join(placeholders)})"
+        
+        query = f"""
         SELECT 
             NAME,
             DATABASE_NAME,
@@ -190,30 +309,580 @@ class SnowflakeTaskAPIClient:
             SCHEDULE,
             STATE,
             DEFINITION,
-            CONDITION
+            CONDITION,
+            PREDECESSORS,
+            LAST_ALTERED
         FROM INFORMATION_SCHEMA.TASKS
         WHERE DATABASE_NAME = CURRENT_DATABASE()
           AND SCHEMA_NAME = CURRENT_SCHEMA()
+          {name_filter}
         ORDER BY NAME
         """
         
         try:
-            results = await self._execute_query(query)
-            return [SnowflakeTaskInfo(**row) for row in results]
+            results = await self._execute_query(query, params)
+            return parse_rows(SnowflakeTaskInfo, results)
             
         except Exception as e:
             logger.error(f"Failed to get tasks: {e}")
             raise SnowflakeTaskAPIError(f"Failed to get tasks: {str(e)}")
     
+    async def get_tasks_cached(
+        self,
+        catalog: TaskCatalog,
+    ) -> Tuple[List[SnowflakeTaskInfo], List[SnowflakeTaskDefinitionChange]]:
+        """
+        Get tasks in the current database/schema through the task catalog.
+        
+        Lists only names and last-altered times, then fetches full
+        definitions for new or altered tasks; the rest come from the catalog.
+        
+        Args:
+            catalog: Task catalog to refresh
+            
+        Returns:
+            (tasks in the current schema, definition changes since the last refresh)
+        """
+        query = """
+        SELECT NAME, DATABASE_NAME, SCHEMA_NAME, STATE, LAST_ALTERED
+        FROM INFORMATION_SCHEMA.TASKS
+        WHERE DATABASE_NAME = CURRENT_DATABASE()
+          AND SCHEMA_NAME = CURRENT_SCHEMA()
+        """
+        
+        try:
+            listing = parse_rows(SnowflakeTaskInfo, await self._execute_query(query))
+        except Exception as e:
+            logger.error(f"Failed to list tasks: {e}")
+            raise SnowflakeTaskAPIError(f"Failed to list tasks: {str(e)}")
+        
+        stale = catalog.stale_names(listing)
+        changes = catalog.update(await self.get_tasks(stale)) if stale else []
+        
+        # State (started/suspended) is not part of the definition but is listed cheaply
+        for task in listing:
+            cached = catalog.tasks.get(qualified_task_name(task))
+            if cached is not None:
+                cached.state = task.state
+        
+        scope_prefix = f"{self.database}.{self.schema}.".upper()
+        present = [qualified_task_name(task) for task in listing]
+        changes.extend(catalog.remove_missing(present, lambda name: name.upper().startswith(scope_prefix)))
+        
+        catalog.refreshed_at = utc_now()
+        logger.info(f"Task catalog refresh: {len(listing)} tasks, {len(stale)} definitions fetched, {len(changes)} changes")
+        return catalog.get(present), changes
+    
+    async def discover_tasks(self, scopes: List[str]) -> List[SnowflakeTaskInfo]:
+        """
+        Find tasks in every database and schema matching the scopes with one SHOW TASKS query.
+        
+        Args:
+            scopes: "DATABASE.SCHEMA" patterns with shell wildcards, e.g.
+                "ANALYTICS.*" or "RAW_*.PUBLIC"; a bare "DATABASE" means all its schemas
+            
+        Returns:
+            List of SnowflakeTaskInfo objects for matching tasks
+        """
+        patterns = [_scope_pattern(scope) for scope in scopes]
+        
+        try:
+            results = await self._execute_query("SHOW TASKS IN ACCOUNT")
+            tasks = parse_rows(SnowflakeTaskInfo, results)
+        except Exception as e:
+            logger.error(f"Failed to discover tasks: {e}")
+            raise SnowflakeTaskAPIError(f"Failed to discover tasks: {str(e)}")
+        
+        matched = [
+            task for task in tasks
+            if any(fnmatchcase(f"{task.database_name}.{task.schema_name}".upper(), p) for p in patterns)
+        ]
+        logger.info(f"Discovered {len(matched)} tasks matching {len(scopes)} scopes ({len(tasks)} in account)")
+        return matched
+    
+    async def scan_task_history(
+        self,
+        tasks: List[SnowflakeTaskInfo],
+        limit: int = 100,
+        hours_back: int = 24,
+        scheduled_time_range_start: Optional[datetime] = None,
+    ) -> Tuple[List[SnowflakeTaskHistory], List[str]]:
+        """
+        Read task history for every database the tasks live in, concurrently.
+        
+        One TASK_HISTORY query runs per database (restricted to the tasks'
+        schemas) over the session pool, and the per-database results, each
+        ordered by scheduled time, are merged into one newest-first list. A
+        database whose query fails is logged, reported to the current cycle
+        and left out, so one unreachable database does not hide the others.
+        
+        Args:
+            tasks: Tasks from discover_tasks
+            limit: RESULT_LIMIT per database
+            hours_back: How many hours back to look
+            scheduled_time_range_start: Explicit start of the window; overrides hours_back
+            
+        Returns:
+            Tuple of the SnowflakeTaskHistory objects, newest scheduled first,
+            and the databases whose history could not be read
+            
+        Raises:
+            SnowflakeTaskAPIError: If no database could be read
+        """
+        schemas_by_database: Dict[str, set] = {}
+        for task in tasks:
+            schemas_by_database.setdefault(task.database_name, set()).add(task.schema_name)
+        
+        async def _database_history(database: str, schemas: set) -> List[SnowflakeTaskHistory]:
+            async with self._pooled_session() as connection:
+                return await self.get_task_history(
+                    limit=limit,
+                    hours_back=hours_back,
+                    scheduled_time_range_start=scheduled_time_range_start,
+                    database=database,
+                    schemas=sorted(schemas),
+                    connection=connection,
+                )
+        
+        databases = list(schemas_by_database)
+        results = await asyncio.gather(
+            *(_database_history(db, schemas_by_database[db]) for db in databases),
+            return_exceptions=True,
+        )
+        per_database = []
+        failed_databases = []
+        for database, result in zip(databases, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to read task history for database {database}: {result}")
+                report_platform_error(PlatformType.SNOWFLAKE_TASK, f"Task history for database {database}: {result}")
+                failed_databases.append(database)
+            else:
+                per_database.append(result)
+        if databases and not per_database:
+            raise SnowflakeTaskAPIError(f"Failed to read task history for all {len(databases)} databases")
+        
+        logger.info(f"Scanned task history across {len(per_database)} of {len(databases)} databases")
+        return list(heapq.merge(*per_database, key=_scheduled_sort_key, reverse=True)), failed_databases
+    
     async def close(self):
-        """Close the Snowflake connection."""
-        if self.connection and not self.connection.is_closed():
-            try:
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, self.connection.close)
-                logger.info("Snowflake connection closed")
-            except Exception as e:
-                logger.warning(f"Error closing connection: {e}")
+        """Close the Snowflake connection and any pooled sessions."""
+        connections = [self.connection] + self._open_sessions
+        self._idle_sessions = []
+        self._open_sessions = []
+        for connection in connections:
+            if connection and not connection.is_closed():
+                try:
+                    loop = asyncio.get_event_loop()
+                    await loop.run_in_executor(None, connection.close)
+                    logger.info("Snowflake connection closed")
+                except Exception as e:
+                    logger.warning(f"Error closing connection: {e}")
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a Snowflake identifier exactly as SHOW TASKS reported it."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _scope_pattern(scope: str) -> str:
+    """Normalize a "DATABASE[.SCHEMA]" scope into an upper-case fnmatch pattern."""
+    scope = scope.strip().upper()
+    return scope if "." in scope else f"{scope}.*"
+
+
+def _scheduled_sort_key(task: SnowflakeTaskHistory) -> float:
+    """Scheduled time as an epoch for merging; rows without one sort last."""
+    scheduled = try_parse_timestamp(task.scheduled_time)
+    return scheduled.timestamp() if scheduled else float("-inf")
+
+
+def task_predecessors(tasks: List[SnowflakeTaskInfo]) -> Dict[str, List[str]]:
+    """
+    Map each task's qualified name to its predecessors' from SHOW TASKS output.
+    
+    SHOW TASKS reports predecessors as a JSON array of quoted, fully
+    qualified names; the quotes are dropped to match TASK_HISTORY names.
+    """
+    predecessors = {}
+    for task in tasks:
+        if not task.predecessors:
+            continue
+        try:
+            names = json.loads(task.predecessors)
+        except ValueError:
+            continue
+        predecessors[f"{task.database_name}.{task.schema_name}.{task.name}"] = [
+            name.replace('"', "") for name in names
+        ]
+    return predecessors
+
+
+class TaskHistoryWatermark(PersistentState):
+    """
+    Incremental TASK_HISTORY polling state.
+    
+    Remembers the last completed time per task and the runs that were still
+    SCHEDULED or EXECUTING, so each poll only queries from the earliest open
+    run (or the previous poll) onwards and only new or changed rows are
+    emitted. Warehouse time then scales with new executions rather than
+    with the lookback window.
+    """
+    
+    state_name = "task history watermark"
+    
+    def __init__(self, overlap_seconds: float = 300.0, max_tasks: int = 10000, max_open_runs: int = 10000):
+        """
+        Initialize task history watermark.
+        
+        Args:
+            overlap_seconds: Re-read window before the previous poll, to absorb clock skew
+                and rows that became visible late
+            max_tasks: Per-task watermarks kept; the least recently updated is evicted beyond this
+            max_open_runs: Open runs (and finished runs without a completed time) tracked;
+                the oldest is evicted beyond this
+        """
+        self.overlap_seconds = overlap_seconds
+        self.max_tasks = max_tasks
+        self.max_open_runs = max_open_runs
+        self.last_completed: "OrderedDict[str, float]" = OrderedDict()
+        self.open_runs: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        # Finished runs without a completed time, which the per-task watermark cannot order
+        self.finished_runs: "OrderedDict[str, None]" = OrderedDict()
+        self.last_poll_epoch: Optional[float] = None
+    
+    @staticmethod
+    def _run_key(task: SnowflakeTaskHistory) -> str:
+        """Identity of one task execution across polls."""
+        return f"{task.database_name}.{task.schema_name}.{task.name}@{task.scheduled_time}"
+    
+    def range_start(self, now: datetime, hours_back: int) -> datetime:
+        """
+        Start of the scheduled-time window for the next poll.
+        
+        Args:
+            now: Current time
+            hours_back: Lookback used for the first poll
+            
+        Returns:
+            Earliest of the open runs' scheduled times and the previous poll
+            (less the overlap), never earlier than now - hours_back
+        """
+        floor = now - timedelta(hours=hours_back)
+        if self.last_poll_epoch is None:
+            return floor
+        start_epoch = self.last_poll_epoch - self.overlap_seconds
+        if self.open_runs:
+            start_epoch = min(start_epoch, min(scheduled for _, scheduled in self.open_runs.values()))
+        return max(floor, datetime.fromtimestamp(start_epoch, tz=floor.tzinfo))
+    
+    def filter_new(self, task_history: List[SnowflakeTaskHistory]) -> List[SnowflakeTaskHistory]:
+        """
+        Keep rows not emitted before.
+        
+        A row is new if its run is open and was not seen in that state, if it
+        finished after being seen open, or if it completed after its task's
+        last completed time. A finished run without a completed time is new
+        only the first time it is seen. The watermark itself is not changed;
+        call advance once the rows were reported, so a failed cycle re-reads
+        them on the next poll.
+        
+        Args:
+            task_history: Rows returned by the poll
+            
+        Returns:
+            New or changed rows, in input order
+        """
+        new_rows = []
+        for task in task_history:
+            key = self._run_key(task)
+            state = (task.state or "").upper()
+            previous = self.open_runs.get(key)
+            
+            if state in OPEN_TASK_STATES:
+                if previous is None or previous[0] != state:
+                    new_rows.append(task)
+                continue
+            
+            if previous is not None:
+                new_rows.append(task)
+                continue
+            completed = try_parse_timestamp(task.completed_time)
+            if completed is None:
+                if key not in self.finished_runs:
+                    new_rows.append(task)
+                continue
+            watermark = self.last_completed.get(key.rsplit("@", 1)[0])
+            if watermark is None or completed.timestamp() > watermark:
+                new_rows.append(task)
+        return new_rows
+    
+    def advance(self, task_history: List[SnowflakeTaskHistory], now: datetime) -> None:
+        """
+        Move the watermark past a poll.
+        
+        Args:
+            task_history: Rows returned by the poll
+            now: Time of the poll
+        """
+        for task in task_history:
+            key = self._run_key(task)
+            state = (task.state or "").upper()
+            if state in OPEN_TASK_STATES:
+                scheduled = try_parse_timestamp(task.scheduled_time)
+                self.open_runs[key] = (state, scheduled.timestamp() if scheduled else now.timestamp())
+                continue
+            
+            self.open_runs.pop(key, None)
+            completed = try_parse_timestamp(task.completed_time)
+            if completed is None:
+                self.finished_runs[key] = None
+                continue
+            task_key = key.rsplit("@", 1)[0]
+            watermark = self.last_completed.get(task_key)
+            if watermark is None or completed.timestamp() > watermark:
+                self.last_completed[task_key] = completed.timestamp()
+                self.last_completed.move_to_end(task_key)
+        
+        while len(self.last_completed) > self.max_tasks:
+            self.last_completed.popitem(last=False)
+        while len(self.open_runs) > self.max_open_runs:
+            self.open_runs.popitem(last=False)
+        while len(self.finished_runs) > self.max_open_runs:
+            self.finished_runs.popitem(last=False)
+        self.last_poll_epoch = now.timestamp()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the watermark state."""
+        return {
+            "version": WATERMARK_STATE_VERSION,
+            "last_poll_epoch": self.last_poll_epoch,
+            "last_completed": list(self.last_completed.items()),
+            "open_runs": [[key, state, scheduled] for key, (state, scheduled) in self.open_runs.items()],
+            "finished_runs": list(self.finished_runs),
+        }
+    
+    def load_state(self, state: Dict[str, Any]) -> None:
+        """Replace contents with serialized state from to_dict."""
+        if state.get("version") != WATERMARK_STATE_VERSION:
+            logger.warning(f"Ignoring task history watermark with version {state.get('version')}")
+            return
+        self.last_poll_epoch = state.get("last_poll_epoch")
+        self.last_completed = OrderedDict((key, float(epoch)) for key, epoch in state.get("last_completed", []))
+        self.open_runs = OrderedDict(
+            (key, (run_state, float(scheduled))) for key, run_state, scheduled in state.get("open_runs", [])
+        )
+        self.finished_runs = OrderedDict.fromkeys(state.get("finished_runs", []))
+
+
+# Graph status precedence: any failure fails the graph, then unfinished work
+# keeps it running; skipped (cancelled) tasks only count if nothing else ran
+_GRAPH_STATUS_PRECEDENCE = (
+    JobStatus.FAILED,
+    JobStatus.RUNNING,
+    JobStatus.PENDING,
+    JobStatus.UNKNOWN,
+    JobStatus.SUCCESS,
+    JobStatus.CANCELLED,
+)
+
+
+class _TaskRun:
+    """One TASK_HISTORY row with its timestamps parsed once."""
+    
+    __slots__ = ("task", "qualified_name", "status", "started_at", "completed_at")
+    
+    def __init__(self, task: SnowflakeTaskHistory):
+        self.task = task
+        self.qualified_name = f"{task.database_name}.{task.schema_name}.{task.name}"
+        self.status = map_snowflake_task_status(task.state)
+        self.started_at = try_parse_timestamp(task.started_time)
+        if task.started_time and self.started_at is None:
+            logger.warning(f"Failed to parse start time for task {task.name}")
+        self.completed_at = try_parse_timestamp(task.completed_time)
+
+
+def _task_record(run: _TaskRun, checked_at: datetime, graph_job_id: Optional[str] = None) -> JobStatusRecord:
+    """Build the JobStatusRecord for a single task run."""
+    task = run.task
+    metadata = {
+        "database_name": task.database_name,
+        "schema_name": task.schema_name,
+        "root_task_id": task.root_task_id,
+        "graph_run_id": task.graph_run_id,
+        "run_id": task.run_id,
+        "error_code": task.error_code,
+        "scheduled_time": str(task.scheduled_time) if task.scheduled_time else None,
+    }
+    if graph_job_id:
+        metadata["graph_job_id"] = graph_job_id
+    
+    return JobStatusRecord(
+        job_id=f"snowflake_task_{task.name}_{task.run_id or 'unknown'}",
+        platform=PlatformType.SNOWFLAKE_TASK,
+        job_name=run.qualified_name,
+        status=run.status,
+        last_run_time=run.started_at,
+        duration_seconds=duration_seconds(run.started_at, run.completed_at),
+        error_message=task.error_message,
+        metadata=metadata,
+        checked_at=checked_at,
+    )
+
+
+def _critical_path(
+    runs: List[_TaskRun],
+    predecessors: Optional[Dict[str, List[str]]] = None,
+) -> List[_TaskRun]:
+    """
+    Reconstruct the chain of task runs that determined a graph run's end time.
+    
+    Walks back from the last task to complete. At each step the next link is
+    the predecessor that completed last; when task predecessors are unknown,
+    it is the run that completed last at or before the current run started.
+    
+    Returns:
+        Task runs on the critical path, first to last
+    """
+    finished = sorted(
+        (r for r in runs if r.started_at is not None and r.completed_at is not None),
+        key=lambda r: r.completed_at,
+    )
+    if not finished:
+        return []
+    completion_times = [r.completed_at for r in finished]
+    by_name = {r.qualified_name: r for r in finished}
+    
+    path = [finished[-1]]
+    visited = {finished[-1].qualified_name}
+    while True:
+        current = path[-1]
+        if predecessors is not None:
+            candidates = [
+                by_name[name] for name in predecessors.get(current.qualified_name, [])
+                if name in by_name and name not in visited
+            ]
+            previous = max(candidates, key=lambda r: r.completed_at, default=None)
+        else:
+            index = bisect_right(completion_times, current.started_at) - 1
+            previous = finished[index] if index >= 0 else None
+            if previous is not None and previous.qualified_name in visited:
+                previous = None
+        if previous is None:
+            break
+        path.append(previous)
+        visited.add(previous.qualified_name)
+    
+    path.reverse()
+    return path
+
+
+def _graph_record(
+    graph_run_id: str,
+    runs: List[_TaskRun],
+    checked_at: datetime,
+    predecessors: Optional[Dict[str, List[str]]] = None,
+) -> JobStatusRecord:
+    """Build the graph-level record for all task runs sharing a GRAPH_RUN_ID."""
+    statuses = {r.status for r in runs}
+    status = next(s for s in _GRAPH_STATUS_PRECEDENCE if s in statuses)
+    
+    started = [r.started_at for r in runs if r.started_at is not None]
+    completed = [r.completed_at for r in runs if r.completed_at is not None]
+    graph_started_at = min(started) if started else None
+    graph_completed_at = max(completed) if completed and status not in (JobStatus.RUNNING, JobStatus.PENDING) else None
+    
+    # Root task: the run that started first (ties broken by schedule order)
+    root = min(runs, key=lambda r: (r.started_at is None, r.started_at or checked_at, str(r.task.scheduled_time)))
+    
+    failed_runs = [r for r in runs if r.status == JobStatus.FAILED]
+    first_failure = min(
+        failed_runs,
+        key=lambda r: (r.completed_at is None, r.completed_at or checked_at),
+        default=None,
+    )
+    error_message = None
+    if first_failure is not None:
+        error_message = f"{first_failure.qualified_name}: {first_failure.task.error_message or 'failed'}"
+    
+    critical_path = _critical_path(runs, predecessors)
+    
+    return JobStatusRecord(
+        job_id=f"snowflake_task_graph_{root.task.root_task_id or root.task.name}_{graph_run_id}",
+        platform=PlatformType.SNOWFLAKE_TASK,
+        job_name=f"{root.qualified_name} (task graph)",
+        status=status,
+        last_run_time=graph_started_at,
+        duration_seconds=duration_seconds(graph_started_at, graph_completed_at),
+        error_message=error_message,
+        metadata={
+            "record_type": "task_graph",
+            "database_name": root.task.database_name,
+            "schema_name": root.task.schema_name,
+            "root_task_id": root.task.root_task_id,
+            "graph_run_id": graph_run_id,
+            "task_count": len(runs),
+            "failed_task_count": len(failed_runs),
+            "first_failed_task": first_failure.qualified_name if first_failure else None,
+            "critical_path": [r.qualified_name for r in critical_path],
+            "critical_path_seconds": [duration_seconds(r.started_at, r.completed_at) for r in critical_path],
+        },
+        checked_at=checked_at,
+    )
+
+
+def aggregate_task_graphs(
+    task_history: List[SnowflakeTaskHistory],
+    checked_at: Optional[datetime] = None,
+    predecessors: Optional[Dict[str, List[str]]] = None,
+    include_successful_children: bool = True,
+) -> List[JobStatusRecord]:
+    """
+    Group task history rows into task-graph runs and build their records.
+    
+    Rows are grouped by GRAPH_RUN_ID in one pass. Each graph run produces one
+    graph-level record (end-to-end duration, first failing task, critical
+    path) followed by its task records; rows without a graph run ID are
+    emitted as plain task records.
+    
+    Args:
+        task_history: TASK_HISTORY rows
+        checked_at: Check time stamped on every record
+        predecessors: Optional fully qualified task name -> predecessor names,
+            used for an exact critical path instead of one inferred from timings
+        include_successful_children: Emit task records for successful tasks
+            inside a graph; when False only the graph record and its
+            unsuccessful tasks are emitted
+        
+    Returns:
+        List of JobStatusRecord objects
+    """
+    checked_at = checked_at or utc_now()
+    graphs: Dict[str, List[_TaskRun]] = {}
+    standalone: List[_TaskRun] = []
+    for task in task_history:
+        run = _TaskRun(task)
+        if task.graph_run_id:
+            graphs.setdefault(task.graph_run_id, []).append(run)
+        else:
+            standalone.append(run)
+    
+    job_records = []
+    for graph_run_id, runs in graphs.items():
+        graph_record = _graph_record(graph_run_id, runs, checked_at, predecessors)
+        job_records.append(graph_record)
+        for run in runs:
+            if include_successful_children or run.status != JobStatus.SUCCESS:
+                job_records.append(_task_record(run, checked_at, graph_record.job_id))
+    job_records.extend(_task_record(run, checked_at) for run in standalone)
+    return job_records
+
+
+_watermarks: StateRegistry[TaskHistoryWatermark] = StateRegistry(TaskHistoryWatermark.load)
+
+
+def get_task_watermark(path: str) -> TaskHistoryWatermark:
+    """Get the shared watermark for a state file, loading it on first use."""
+    return _watermarks.get(path)
 
 
 # Convenience functions for use in agents
@@ -226,8 +895,49 @@ async def get_snowflake_task_status(
     warehouse: str = "COMPUTE_WH",
     role: Optional[str] = None,
     hours_back: int = 24,
+    aggregate_graphs: bool = True,
+    include_successful_children: bool = True,
+    incremental: Optional[bool] = None,
+    task_scopes: Optional[List[str]] = None,
+    max_sessions: Optional[int] = None,
 ) -> List[JobStatusRecord]:
-    """Get task status records from Snowflake."""
+    """
+    Get task status records from Snowflake.
+    
+    With task_scopes ("DATABASE.SCHEMA" patterns, settings.snowflake_task_scopes
+    by default), tasks are discovered across the account and each matching
+    database's history is read concurrently; without them only the
+    connection's current database is read.
+    
+    Task definitions are tracked in the task catalog. With task_scopes the
+    catalog is updated from the discovery listing; otherwise the current
+    schema is re-listed every settings.snowflake_task_catalog_refresh_minutes
+    (0, the default, never re-lists) and a failed refresh only logs a
+    warning. Created, modified and removed tasks are reported to the current
+    monitoring cycle and kept in the catalog, not returned as records; see
+    get_snowflake_task_definition_changes.
+    
+    With aggregate_graphs, task runs belonging to a task graph are summarized
+    by one graph-level record ahead of their task records (see
+    aggregate_task_graphs).
+    
+    In incremental mode (settings.snowflake_task_incremental by default)
+    the history is read from the saved watermark onwards and only new or
+    changed executions are returned; a graph run with any new execution is
+    returned whole so its graph record stays complete. hours_back then only
+    bounds the first poll. If some databases could not be read, the
+    watermark is not advanced and the next poll reads the window again.
+    
+    At most max_sessions (settings.snowflake_task_max_sessions by default)
+    Snowflake sessions are open at once.
+    """
+    from config.settings import settings
+    
+    if incremental is None:
+        incremental = settings.snowflake_task_incremental
+    if task_scopes is None:
+        task_scopes = [scope for scope in settings.snowflake_task_scopes.split(",") if scope.strip()]
+    
     client = SnowflakeTaskAPIClient(
         account=account,
         user=user,
@@ -236,65 +946,129 @@ async def get_snowflake_task_status(
         schema=schema,
         warehouse=warehouse,
         role=role,
+        max_sessions=max_sessions or settings.snowflake_task_max_sessions,
     )
     
+    # State files are kept per monitored instance
+    catalog_path = instance_state_path(settings.snowflake_task_catalog_path)
+    watermark_path = instance_state_path(settings.snowflake_task_watermark_path)
+    
     try:
-        # Get task history
-        task_history = await client.get_task_history(hours_back=hours_back)
+        # Task definitions: discovered across scopes, or refreshed through the
+        # catalog for the current schema when a refresh is due
+        catalog = get_task_catalog(catalog_path)
+        definition_changes = []
+        refreshed = False
+        if task_scopes:
+            tasks = await client.discover_tasks(task_scopes)
+            definition_changes = catalog.update(tasks)
+            scope_patterns = [_scope_pattern(scope) for scope in task_scopes]
+            definition_changes.extend(catalog.remove_missing(
+                (qualified_task_name(task) for task in tasks),
+                lambda name: any(fnmatchcase(name.rsplit(".", 1)[0].upper(), p) for p in scope_patterns),
+            ))
+            refreshed = True
+        elif catalog.refresh_due(utc_now(), settings.snowflake_task_catalog_refresh_minutes):
+            try:
+                tasks, definition_changes = await client.get_tasks_cached(catalog)
+                refreshed = True
+            except SnowflakeTaskAPIError as e:
+                logger.warning(f"Task catalog refresh failed, using cached definitions: {e}")
+                tasks = catalog.get()
+        else:
+            tasks = catalog.get()
+        predecessors = task_predecessors(tasks)
+        if refreshed:
+            try:
+                catalog.save(catalog_path)
+            except OSError as e:
+                logger.warning(f"Failed to save task catalog: {e}")
+        for change in definition_changes:
+            logger.info(f"Task definition {change.change_type}: {change.task_name}")
+        report_definition_changes(definition_changes)
         
-        job_records = []
-        for task in task_history:
-            # Parse timestamps
-            last_run_time = None
-            if task.started_time:
-                if isinstance(task.started_time, datetime):
-                    last_run_time = task.started_time.replace(tzinfo=timezone.utc)
-                elif isinstance(task.started_time, str):
-                    try:
-                        last_run_time = datetime.fromisoformat(task.started_time)
-                        if last_run_time.tzinfo is None:
-                            last_run_time = last_run_time.replace(tzinfo=timezone.utc)
-                    except ValueError:
-                        logger.warning(f"Failed to parse start time for task {task.name}")
-            
-            # Calculate duration
-            duration_seconds = None
-            if task.started_time and task.completed_time:
-                try:
-                    if isinstance(task.started_time, datetime) and isinstance(task.completed_time, datetime):
-                        duration = task.completed_time - task.started_time
-                        duration_seconds = int(duration.total_seconds())
-                except Exception:
-                    logger.warning(f"Failed to calculate duration for task {task.name}")
-            
-            # Create record
-            record = JobStatusRecord(
-                job_id=f"snowflake_task_{task.name}_{task.run_id or 'unknown'}",
-                platform=PlatformType.SNOWFLAKE_TASK,
-                job_name=f"{task.database_name}.{task.schema_name}.{task.name}",
-                status=map_snowflake_task_status(task.state),
-                last_run_time=last_run_time,
-                duration_seconds=duration_seconds,
-                error_message=task.error_message,
-                metadata={
-                    "database_name": task.database_name,
-                    "schema_name": task.schema_name,
-                    "root_task_id": task.root_task_id,
-                    "graph_run_id": task.graph_run_id,
-                    "run_id": task.run_id,
-                    "error_code": task.error_code,
-                    "scheduled_time": str(task.scheduled_time) if task.scheduled_time else None,
-                },
-                checked_at=datetime.now(timezone.utc),
+        failed_databases: List[str] = []
+        
+        async def _read_history(range_start: Optional[datetime] = None) -> List[SnowflakeTaskHistory]:
+            if task_scopes:
+                history, failed = await client.scan_task_history(
+                    tasks,
+                    limit=settings.snowflake_task_result_limit,
+                    hours_back=hours_back,
+                    scheduled_time_range_start=range_start,
+                )
+                failed_databases.extend(failed)
+                return history
+            return await client.get_task_history(
+                limit=settings.snowflake_task_result_limit,
+                hours_back=hours_back,
+                scheduled_time_range_start=range_start,
             )
-            job_records.append(record)
         
+        if incremental:
+            now = utc_now()
+            watermark = get_task_watermark(watermark_path)
+            task_history = await _read_history(watermark.range_start(now, hours_back))
+            polled = task_history
+            new_rows = watermark.filter_new(polled)
+            if aggregate_graphs:
+                changed_graphs = {task.graph_run_id for task in new_rows if task.graph_run_id}
+                new_ids = {id(task) for task in new_rows}
+                task_history = [
+                    task for task in task_history
+                    if task.graph_run_id in changed_graphs or id(task) in new_ids
+                ]
+            else:
+                task_history = new_rows
+            logger.info(f"Incremental task history poll: {len(new_rows)} new or changed of {len(polled)} rows")
+        else:
+            task_history = await _read_history()
+        
+        if aggregate_graphs:
+            job_records = aggregate_task_graphs(
+                task_history,
+                predecessors=predecessors,
+                include_successful_children=include_successful_children,
+            )
+        else:
+            checked_at = utc_now()
+            job_records = [_task_record(_TaskRun(task), checked_at) for task in task_history]
         logger.info(f"Successfully retrieved {len(job_records)} Snowflake task records")
+        report_platform_records(PlatformType.SNOWFLAKE_TASK, job_records)
+        
+        # Advance the watermark only once the records were built and reported;
+        # after a partial scan it stays put so the failed databases are re-read
+        if incremental and not failed_databases:
+            watermark.advance(polled, now)
+            try:
+                watermark.save(watermark_path)
+            except OSError as e:
+                logger.warning(f"Failed to save task history watermark: {e}")
         return job_records
         
     except Exception as e:
         logger.error(f"Failed to get Snowflake task status: {e}")
+        report_platform_error(PlatformType.SNOWFLAKE_TASK, str(e))
         raise SnowflakeTaskAPIError(f"Failed to get task status: {str(e)}")
     
     finally:
-        await client.close()
\ No newline at end of file
+        await client.close()
+
+
+def get_snowflake_task_definition_changes(since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    Task definition changes recorded by the task catalog.
+    
+    Definition changes are events, not job runs, so they are kept out of the
+    records returned by get_snowflake_task_status.
+    
+    Args:
+        since: Only return changes detected after this time
+        
+    Returns:
+        Created, modified and removed tasks, oldest first
+    """
+    from config.settings import settings
+    
+    catalog = get_task_catalog(instance_state_path(settings.snowflake_task_catalog_path))
+    return [change.model_dump(mode="json") for change in catalog.recent_changes(since)]
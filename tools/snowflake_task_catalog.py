@@ -0,0 +1,201 @@
+"""
+Cached Snowflake task catalog with definition change detection.
+
+Task definitions change rarely, so the catalog keeps each task's definition
+and a hash of it between cycles. A refresh lists only task names and
+last-altered times; full definitions are fetched just for tasks that are
+new or were altered, and a changed hash is reported as a definition change.
+Recent changes are kept in the catalog as their own event list; they are
+never mixed into the job status records.
+"""
+
+import hashlib
+import logging
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+from models.platform_models import SnowflakeTaskDefinitionChange, SnowflakeTaskInfo
+from models.state_file import PersistentState, StateRegistry
+from models.timestamps import ensure_utc, utc_now
+
+logger = logging.getLogger(__name__)
+
+CATALOG_STATE_VERSION = 1
+
+# Task fields that make up its definition; state, owner and comment changes are not definition changes
+DEFINITION_FIELDS = ("definition", "condition", "schedule", "warehouse", "predecessors")
+
+# Definition changes kept in the catalog's event list
+MAX_RECENT_CHANGES = 200
+
+
+def qualified_task_name(task: SnowflakeTaskInfo) -> str:
+    """DATABASE.SCHEMA.NAME for a task."""
+    return f"{task.database_name}.{task.schema_name}.{task.name}"
+
+
+def definition_hash(task: SnowflakeTaskInfo) -> str:
+    """Stable 16-character hash of a task's definition fields."""
+    digest = hashlib.blake2b(digest_size=8)
+    for field in DEFINITION_FIELDS:
+        digest.update((getattr(task, field) or "").encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class TaskCatalog(PersistentState):
+    """Task definitions and their hashes, kept between cycles."""
+    
+    state_name = "task catalog"
+    
+    def __init__(self):
+        """Initialize an empty task catalog."""
+        self.tasks: Dict[str, SnowflakeTaskInfo] = {}
+        self.hashes: Dict[str, str] = {}
+        self.changes: Deque[SnowflakeTaskDefinitionChange] = deque(maxlen=MAX_RECENT_CHANGES)
+        self.refreshed_at: Optional[datetime] = None
+        self.initialized = False
+    
+    def __len__(self) -> int:
+        return len(self.tasks)
+    
+    def stale_names(self, listing: Iterable[SnowflakeTaskInfo]) -> List[str]:
+        """
+        Names from a name/last-altered listing whose cached definition may be out of date.
+        
+        Returns:
+            Unqualified names of tasks that are new or whose last-altered time moved
+        """
+        stale = []
+        for task in listing:
+            cached = self.tasks.get(qualified_task_name(task))
+            if cached is None or task.last_altered is None or str(cached.last_altered) != str(task.last_altered):
+                stale.append(task.name)
+        return stale
+    
+    def refresh_due(self, now: datetime, interval_minutes: int) -> bool:
+        """
+        Whether a schema listing refresh is due.
+        
+        Args:
+            now: Current time
+            interval_minutes: Minutes between refreshes; 0 disables refreshing
+        """
+        if interval_minutes <= 0:
+            return False
+        return self.refreshed_at is None or now - self.refreshed_at >= timedelta(minutes=interval_minutes)
+    
+    def recent_changes(self, since: Optional[datetime] = None) -> List[SnowflakeTaskDefinitionChange]:
+        """Recorded definition changes, oldest first, optionally only those detected after since."""
+        if since is None:
+            return list(self.changes)
+        since = ensure_utc(since)
+        return [change for change in self.changes if ensure_utc(change.detected_at) > since]
+    
+    def update(self, tasks: Iterable[SnowflakeTaskInfo]) -> List[SnowflakeTaskDefinitionChange]:
+        """
+        Store fetched task definitions and report the ones whose hash changed.
+        
+        The first update after an empty catalog only seeds it, so a fresh
+        install does not report every existing task as created.
+        
+        Returns:
+            Created and modified tasks, also added to the catalog's change list
+        """
+        detected_at = utc_now()
+        changes = []
+        for task in tasks:
+            name = qualified_task_name(task)
+            new_hash = definition_hash(task)
+            old_hash = self.hashes.get(name)
+            previous = self.tasks.get(name)
+            self.tasks[name] = task
+            self.hashes[name] = new_hash
+            if not self.initialized or old_hash == new_hash:
+                continue
+            changes.append(SnowflakeTaskDefinitionChange(
+                task_name=name,
+                change_type="created" if old_hash is None else "modified",
+                previous_hash=old_hash,
+                definition_hash=new_hash,
+                changed_fields=[
+                    field for field in DEFINITION_FIELDS
+                    if previous is not None and getattr(previous, field) != getattr(task, field)
+                ],
+                detected_at=detected_at,
+            ))
+        self.initialized = True
+        self.changes.extend(changes)
+        return changes
+    
+    def remove_missing(
+        self,
+        present_names: Iterable[str],
+        in_scope: Callable[[str], bool],
+    ) -> List[SnowflakeTaskDefinitionChange]:
+        """
+        Drop cached tasks that a complete listing of their scope no longer contains.
+        
+        Args:
+            present_names: Qualified names of the tasks that still exist
+            in_scope: Whether a qualified name belongs to the listed scope
+            
+        Returns:
+            Removed tasks, also added to the catalog's change list
+        """
+        present = set(present_names)
+        detected_at = utc_now()
+        changes = []
+        for name in [n for n in self.tasks if n not in present and in_scope(n)]:
+            del self.tasks[name]
+            changes.append(SnowflakeTaskDefinitionChange(
+                task_name=name,
+                change_type="removed",
+                previous_hash=self.hashes.pop(name, None),
+                detected_at=detected_at,
+            ))
+        self.changes.extend(changes)
+        return changes
+    
+    def get(self, names: Optional[Iterable[str]] = None) -> List[SnowflakeTaskInfo]:
+        """Cached tasks, optionally restricted to qualified names, ordered by name."""
+        selected = self.tasks if names is None else {n: self.tasks[n] for n in names if n in self.tasks}
+        return [selected[name] for name in sorted(selected)]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the catalog."""
+        return {
+            "version": CATALOG_STATE_VERSION,
+            "tasks": [task.model_dump(mode="json") for task in self.tasks.values()],
+            "changes": [change.model_dump(mode="json") for change in self.changes],
+            "refreshed_at": self.refreshed_at.isoformat() if self.refreshed_at else None,
+        }
+    
+    def load_state(self, state: Dict[str, Any]) -> None:
+        """Replace contents with serialized state from to_dict."""
+        if state.get("version") != CATALOG_STATE_VERSION:
+            logger.warning(f"Ignoring task catalog with version {state.get('version')}")
+            return
+        self.tasks = {}
+        self.hashes = {}
+        for data in state.get("tasks", []):
+            task = SnowflakeTaskInfo(**data)
+            name = qualified_task_name(task)
+            self.tasks[name] = task
+            self.hashes[name] = definition_hash(task)
+        self.changes = deque(
+            (SnowflakeTaskDefinitionChange(**data) for data in state.get("changes", [])),
+            maxlen=MAX_RECENT_CHANGES,
+        )
+        refreshed_at = state.get("refreshed_at")
+        self.refreshed_at = ensure_utc(datetime.fromisoformat(refreshed_at)) if refreshed_at else None
+        self.initialized = True
+
+
+_catalogs: StateRegistry[TaskCatalog] = StateRegistry(TaskCatalog.load)
+
+
+def get_task_catalog(path: str) -> TaskCatalog:
+    """Get the shared catalog for a state file, loading it on first use."""
+    return _catalogs.get(path)